@@ -0,0 +1,35 @@
+class CachedDynamicLibrary:
+    """Dynamic library that allows caching its keyword information."""
+
+    ROBOT_LIBRARY_CACHE = True
+    keywords = {
+        "No Arg": [],
+        "One Arg": ["arg"],
+        "Defaults": ["a", "b=default", "*varargs"],
+        "Typed": ["count", "ratio=0.5", "**config"],
+        "Named Only": ["*", "name", "value=None"],
+    }
+
+    def get_keyword_names(self):
+        return list(self.keywords)
+
+    def run_keyword(self, name, args, kwargs):
+        return f"{name}: {args} {kwargs}"
+
+    def get_keyword_arguments(self, name):
+        return self.keywords[name]
+
+    def get_keyword_types(self, name):
+        if name == "Defaults":
+            return {"a": "int | None"}
+        if name == "Typed":
+            return {"count": "int", "ratio": "float"}
+        return None
+
+    def get_keyword_documentation(self, name):
+        if name == "__intro__":
+            return "Library documentation."
+        return f"Documentation for '{name}'."
+
+    def get_keyword_tags(self, name):
+        return ["cached", name.split()[0].lower()]
@@ -0,0 +1,35 @@
+class DynamicLibraryInformation:
+    """Library documentation in code."""
+
+    def get_library_information(self):
+        return {
+            "__intro__": {"doc": "Library documentation."},
+            "__init__": {"doc": "Init documentation."},
+            "Keyword": {
+                "args": ["arg", "named=default"],
+                "types": {"arg": "int"},
+                "doc": "Keyword documentation.\n\nTags: from doc",
+                "tags": ["tag"],
+            },
+            "Types": {"args": ["arg"], "types": {"arg": "float"}},
+            "No information": {},
+            "Invalid information": {"args": 42},
+        }
+
+    def get_keyword_names(self):
+        return [
+            "Keyword",
+            "Types",
+            "No information",
+            "Invalid information",
+            "Not in info",
+        ]
+
+    def run_keyword(self, name, args, kwargs):
+        return [name, list(args), kwargs]
+
+    def get_keyword_arguments(self, name):
+        return ["*args"]
+
+    def get_keyword_documentation(self, name):
+        return f"Documentation for '{name}'."
@@ -31,6 +31,27 @@ class Suite(_BaseLib):
     ROBOT_LIBRARY_SCOPE = "SUITE"
 
 
+class Reused(_BaseLib):
+    ROBOT_LIBRARY_SCOPE = "SUITE"
+    ROBOT_LIBRARY_REUSE = True
+
+    def __init__(self):
+        _BaseLib.__init__(self)
+        self.ROBOT_LIBRARY_LISTENER = self
+        self.events = []
+
+    def _close(self):
+        self.events.append("close")
+
+    def _reset(self):
+        self.events.append("reset")
+        self.registered = set()
+
+    def events_should_be(self, *expected):
+        if self.events != list(expected):
+            raise AssertionError(f"Wrong events: {self.events} != {list(expected)}")
+
+
 class TestSuite(_BaseLib):
     ROBOT_LIBRARY_SCOPE = "TEST_SUITE"
 
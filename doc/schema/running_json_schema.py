@@ -160,6 +160,7 @@ class Import(BaseModel):
 class Variable(BaseModel):
     name: str
     value: Sequence[str]
+    separator: str | None
     lineno: int | None
     error: str | None
 
@@ -85,27 +85,8 @@ See documentations of the individual APIs for more details.
         via the :mod:`robot` root package.
 """
 
-from robot.conf.languages import Language as Language, Languages as Languages
-from robot.model import SuiteVisitor as SuiteVisitor
-from robot.parsing import (
-    get_init_model as get_init_model,
-    get_init_tokens as get_init_tokens,
-    get_model as get_model,
-    get_resource_model as get_resource_model,
-    get_resource_tokens as get_resource_tokens,
-    get_tokens as get_tokens,
-    Token as Token,
-)
-from robot.reporting import ResultWriter as ResultWriter
-from robot.result import (
-    ExecutionResult as ExecutionResult,
-    ResultVisitor as ResultVisitor,
-)
-from robot.running import (
-    TestSuite as TestSuite,
-    TestSuiteBuilder as TestSuiteBuilder,
-    TypeInfo as TypeInfo,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
 
 from .exceptions import (
     ContinuableFailure as ContinuableFailure,
@@ -114,3 +95,69 @@ from .exceptions import (
     FatalError as FatalError,
     SkipExecution as SkipExecution,
 )
+
+if TYPE_CHECKING:
+    from robot.conf.languages import Language as Language, Languages as Languages
+    from robot.model import SuiteVisitor as SuiteVisitor
+    from robot.parsing import (
+        get_init_model as get_init_model,
+        get_init_tokens as get_init_tokens,
+        get_model as get_model,
+        get_resource_model as get_resource_model,
+        get_resource_tokens as get_resource_tokens,
+        get_tokens as get_tokens,
+        Token as Token,
+    )
+    from robot.reporting import ResultWriter as ResultWriter
+    from robot.result import (
+        ExecutionResult as ExecutionResult,
+        ResultVisitor as ResultVisitor,
+    )
+    from robot.running import (
+        TestSuite as TestSuite,
+        TestSuiteBuilder as TestSuiteBuilder,
+        TypeInfo as TypeInfo,
+    )
+
+
+# Public APIs are imported only when they are used. This avoids importing
+# the whole framework when, for example, libraries import `robot.api.deco`.
+_lazy_apis = {
+    "Language": "robot.conf.languages",
+    "Languages": "robot.conf.languages",
+    "SuiteVisitor": "robot.model",
+    "get_init_model": "robot.parsing",
+    "get_init_tokens": "robot.parsing",
+    "get_model": "robot.parsing",
+    "get_resource_model": "robot.parsing",
+    "get_resource_tokens": "robot.parsing",
+    "get_tokens": "robot.parsing",
+    "Token": "robot.parsing",
+    "ResultWriter": "robot.reporting",
+    "ExecutionResult": "robot.result",
+    "ResultVisitor": "robot.result",
+    "TestSuite": "robot.running",
+    "TestSuiteBuilder": "robot.running",
+    "TypeInfo": "robot.running",
+}
+
+__all__ = [
+    "ContinuableFailure",
+    "Error",
+    "Failure",
+    "FatalError",
+    "SkipExecution",
+    *_lazy_apis,
+]
+
+
+def __getattr__(name):
+    if name not in _lazy_apis:
+        raise AttributeError(f"'robot.api' has no attribute '{name}'.")
+    value = getattr(import_module(_lazy_apis[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_lazy_apis})
@@ -135,6 +135,7 @@ def library(
     doc_format: "DocFormat | None" = None,
     listener: "Any | None" = None,
     auto_keywords: bool = False,
+    reuse: "bool | None" = None,
 ) -> LibraryDecorator: ...
 
 
@@ -146,6 +147,7 @@ def library(
     doc_format: "DocFormat | None" = None,
     listener: "Any | None" = None,
     auto_keywords: bool = False,
+    reuse: "bool | None" = None,
 ) -> "L | LibraryDecorator":
     """Class decorator to control keyword discovery and other library settings.
 
@@ -161,7 +163,8 @@ def library(
     ``ROBOT_LIBRARY_CONVERTERS``, ``ROBOT_LIBRARY_DOC_FORMAT`` and
     ``ROBOT_LIBRARY_LISTENER``, respectively. These attributes are only set if
     the related arguments are given, and they override possible existing attributes
-    in the decorated class.
+    in the decorated class. Similarly ``reuse`` sets ``ROBOT_LIBRARY_REUSE`` that
+    controls whether instances of suite scoped libraries are reused in later suites.
 
     Examples::
 
@@ -182,6 +185,7 @@ def library(
 
     The ``@library`` decorator is new in Robot Framework 3.2.
     The ``converters`` argument is new in Robot Framework 5.0.
+    The ``reuse`` argument is new in Robot Framework 7.5.
     """
     if isinstance(scope, type):
         return library()(scope)
@@ -197,6 +201,8 @@ def library(
             cls.ROBOT_LIBRARY_DOC_FORMAT = doc_format
         if listener is not None:
             cls.ROBOT_LIBRARY_LISTENER = listener
+        if reuse is not None:
+            cls.ROBOT_LIBRARY_REUSE = reuse
         cls.ROBOT_AUTO_KEYWORDS = auto_keywords
         return cls
 
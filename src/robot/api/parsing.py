@@ -34,6 +34,11 @@ The publicly exposed parsing entry points are the following:
   functions for `parsing data to model`_ represented as
   an abstract syntax tree (AST).
 
+* :func:`~.parser.incremental.update_model`,
+  :func:`~.parser.incremental.update_resource_model`, and
+  :func:`~.parser.incremental.update_init_model`
+  functions for `updating model after edits`_.
+
 * `Model objects`_ used by the AST model.
 
 * :class:`~robot.parsing.model.visitor.ModelVisitor`
@@ -458,6 +463,27 @@ settings section with documentation is added.
     TestModifier().visit(model)
     model.save('modified.robot')
 
+Updating model after edits
+--------------------------
+
+Tools like editors that need to keep the model in sync with data that is
+edited can use :func:`~.parser.incremental.update_model`,
+:func:`~.parser.incremental.update_resource_model` or
+:func:`~.parser.incremental.update_init_model` functions instead of parsing
+the whole data again after each edit. They get a model created earlier,
+the edited range as line number and column offset pairs, and the new text
+replacing the range. Only tests, tasks, keywords and variables affected by
+the edit are parsed again and the model is updated in place::
+
+    from robot.api.parsing import get_model, update_model
+
+    model = get_model('example.robot')
+    # Replace 'argument' on line 3 with 'new value'.
+    update_model(model, start=(3, 15), end=(3, 23), text='new value')
+
+The resulting model is the same as if the edited data had been parsed from
+scratch. This functionality is new in Robot Framework 7.5.
+
 Executing model
 ---------------
 
@@ -493,6 +519,9 @@ from robot.parsing import (
     get_resource_tokens as get_resource_tokens,
     get_tokens as get_tokens,
     Token as Token,
+    update_init_model as update_init_model,
+    update_model as update_model,
+    update_resource_model as update_resource_model,
 )
 from robot.parsing.model.blocks import (
     CommentSection as CommentSection,
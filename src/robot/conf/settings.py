@@ -28,7 +28,8 @@ from robot.result.flattenkeywordmatcher import validate_flatten_keyword
 from robot.result.keywordremover import KeywordRemover
 from robot.utils import (
     abspath, create_destination_directory, escape, get_link_path, html_escape,
-    is_list_like, plural_or_not as s, seq2str, split_args_from_name_or_path
+    is_compressed, is_list_like, plural_or_not as s, seq2str,
+    split_args_from_name_or_path, timestr_to_secs
 )
 
 from .gatherfailed import gather_failed_suites, gather_failed_tests
@@ -50,6 +51,8 @@ class _BaseSettings:
         "Exclude"          : ("exclude", []),
         "OutputDir"        : ("outputdir", abspath(".")),
         "LegacyOutput"     : ("legacyoutput", False),
+        "Index"            : ("index", False),
+        "CompressionLevel" : ("compressionlevel", 1),
         "Log"              : ("log", "log.html"),
         "Report"           : ("report", "report.html"),
         "XUnit"            : ("xunit", None),
@@ -118,7 +121,9 @@ class _BaseSettings:
             return value if value and value.upper() != "NONE" else None
         if name == "OutputDir":
             return Path(value).absolute()
-        if name in ["SuiteStatLevel", "ConsoleWidth"]:
+        if name in ("ParseCache", "LibraryCache"):
+            return Path(value).absolute() if str(value).upper() != "NONE" else None
+        if name in ["SuiteStatLevel", "ConsoleWidth", "Processes"]:
             return self._convert_to_positive_integer_or_default(name, value)
         if name == "VariableFiles":
             return [split_args_from_name_or_path(item) for item in value]
@@ -130,6 +135,14 @@ class _BaseSettings:
             return [v for v in [self._process_tag_stat_link(v) for v in value] if v]
         if name == "Randomize":
             return self._process_randomize_value(value)
+        if name == "Shard":
+            return self._process_shard(value)
+        if name in ["Coordinator", "Worker"]:
+            return self._process_address(name, value)
+        if name == "CoordinatorTimeout":
+            return self._process_coordinator_timeout(value)
+        if name == "CompressionLevel":
+            return self._process_compression_level(value)
         if name == "MaxErrorLines":
             return self._process_max_error_lines(value)
         if name == "MaxAssignLength":
@@ -194,6 +207,14 @@ class _BaseSettings:
             )
         return value
 
+    def _process_compression_level(self, value):
+        value = self._convert_to_integer("CompressionLevel", value)
+        if not 0 <= value <= 9:
+            self._raise_invalid(
+                "CompressionLevel", f"Expected integer between 0 and 9, got {value}."
+            )
+        return value
+
     def _process_max_assign_length(self, value):
         value = self._convert_to_integer("MaxAssignLength", value)
         return max(value, 0)
@@ -216,6 +237,39 @@ class _BaseSettings:
             self._raise_invalid("Randomize", f"Seed should be integer, got '{seed}'.")
         return value, seed
 
+    def _process_shard(self, value):
+        if isinstance(value, tuple):
+            index, total = value
+        else:
+            try:
+                index, total = (int(v) for v in value.split("/"))
+            except ValueError:
+                self._raise_invalid(
+                    "Shard", f"Expected format 'index/total', got '{value}'."
+                )
+        if not 1 <= index <= total:
+            self._raise_invalid(
+                "Shard", f"Index must be between 1 and {total}, got {index}."
+            )
+        return index, total
+
+    def _process_address(self, name, value):
+        if isinstance(value, tuple):
+            return value
+        host, port = value.rsplit(":", 1) if ":" in value else ("localhost", value)
+        try:
+            port = int(port)
+        except ValueError:
+            self._raise_invalid(name, f"Expected format '[host:]port', got '{value}'.")
+        return host or "localhost", port
+
+    def _process_coordinator_timeout(self, value):
+        try:
+            value = timestr_to_secs(value)
+        except ValueError as err:
+            self._raise_invalid("CoordinatorTimeout", err)
+        return value if value > 0 else None
+
     def __getitem__(self, name):
         if name not in self._opts:
             raise KeyError(f"Non-existing option '{name}'.")
@@ -242,6 +296,9 @@ class _BaseSettings:
 
     def _process_output_name(self, option, name):
         base, ext = os.path.splitext(name)
+        if is_compressed(name):
+            base, format_ext = os.path.splitext(base)
+            ext = format_ext + ext
         if self["TimestampOutputs"]:
             base += (
                 "-{s.year}{s.month:02}{s.day:02}-{s.hour:02}{s.minute:02}{s.second:02}"
@@ -384,6 +441,14 @@ class _BaseSettings:
     def legacy_output(self) -> bool:
         return self["LegacyOutput"]
 
+    @property
+    def index(self) -> bool:
+        return self["Index"]
+
+    @property
+    def compression_level(self) -> int:
+        return self["CompressionLevel"]
+
     @property
     def log(self) -> "Path | None":
         return self["Log"]
@@ -458,6 +523,10 @@ class _BaseSettings:
     def pre_rebot_modifiers(self):
         return self["PreRebotModifiers"]
 
+    @property
+    def shard_timings(self) -> "str | None":
+        return self["ShardTimings"]
+
     @property
     def console_colors(self):
         return self["ConsoleColors"]
@@ -483,6 +552,7 @@ class RobotSettings(_BaseSettings):
         "MaxErrorLines"      : ("maxerrorlines", 40),
         "MaxAssignLength"    : ("maxassignlength", 200),
         "DryRun"             : ("dryrun", False),
+        "LowMemory"          : ("lowmemory", False),
         "ExitOnFailure"      : ("exitonfailure", False),
         "ExitOnError"        : ("exitonerror", False),
         "Skip"               : ("skip", []),
@@ -491,10 +561,14 @@ class RobotSettings(_BaseSettings):
         "ReRunFailed"        : ("rerunfailed", None),
         "ReRunFailedSuites"  : ("rerunfailedsuites", None),
         "Randomize"          : ("randomize", "NONE"),
+        "Shard"              : ("shard", None),
+        "ShardTimings"       : ("shardtimings", None),
         "RunEmptySuite"      : ("runemptysuite", False),
         "Variables"          : ("variable", []),
         "VariableFiles"      : ("variablefile", []),
         "Parsers"            : ("parser", []),
+        "ParseCache"         : ("parsecache", None),
+        "LibraryCache"       : ("librarycache", None),
         "PreRunModifiers"    : ("prerunmodifier", []),
         "Listeners"          : ("listener", []),
         "ConsoleTypeDotted"  : ("dotted", False),
@@ -502,8 +576,15 @@ class RobotSettings(_BaseSettings):
         "ConsoleMarkers"     : ("consolemarkers", "AUTO"),
         "DebugFile"          : ("debugfile", None),
         "Language"           : ("language", []),
+        "Processes"          : ("processes", 1),
+        "Coordinator"        : ("coordinator", None),
+        "CoordinatorTimeout" : ("coordinatortimeout", 600),
+        "Worker"             : ("worker", None),
     }  # fmt: skip
     _languages = None
+    #: Variables set by the top level suite setup in the main process. They
+    #: are set as global variables when running units in worker processes.
+    worker_variables: "dict[str, object]" = {}
 
     def get_rebot_settings(self):
         settings = RebotSettings()
@@ -523,6 +604,7 @@ class RobotSettings(_BaseSettings):
             "TimestampOutputs",
             "ConsoleType",
             "ConsoleTypeQuiet",
+            "ShardTimings",
         }
         for opt in settings._opts:
             if opt in self and opt not in not_copied:
@@ -530,6 +612,77 @@ class RobotSettings(_BaseSettings):
         settings._opts["ProcessEmptySuite"] = self["RunEmptySuite"]
         return settings
 
+    def get_worker_settings(self):
+        """Returns settings used when running suites in worker processes.
+
+        Only options affecting the actual execution are copied. Output files,
+        console output and options affecting how the suite is built are
+        handled by the main process.
+        """
+        settings = RobotSettings()
+        settings.start_time = self.start_time
+        not_copied = {
+            "Output",
+            "Index",
+            "Log",
+            "Report",
+            "XUnit",
+            "DebugFile",
+            "ConsoleType",
+            "ConsoleTypeQuiet",
+            "ConsoleTypeDotted",
+            "StdOut",
+            "StdErr",
+            "PythonPath",
+            "ReRunFailed",
+            "ReRunFailedSuites",
+            "Randomize",
+            "Shard",
+            "ShardTimings",
+            "Parsers",
+            "PreRunModifiers",
+            "PreRebotModifiers",
+            "Processes",
+            "Coordinator",
+            "CoordinatorTimeout",
+            "Worker",
+        }
+        for opt in self._opts:
+            if opt not in not_copied:
+                settings._opts[opt] = self._opts[opt]
+        settings._opts["Output"] = None
+        settings._opts["ConsoleType"] = "none"
+        for listener in self.listeners:
+            if not isinstance(listener, (str, Path)):
+                self._raise_invalid(
+                    "Processes",
+                    "Listeners must be given as names or paths when running "
+                    "tests in multiple processes.",
+                )
+        return settings
+
+    def to_dict(self) -> dict:
+        """Returns processed option values as a JSON compatible dictionary.
+
+        Used for sending worker settings to remote workers. Settings can be
+        recreated based on the returned dictionary using :meth:`from_dict`.
+        """
+        data = {
+            name: str(value) if isinstance(value, Path) else value
+            for name, value in self._opts.items()
+        }
+        data["start_time"] = self.start_time.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RobotSettings":
+        settings = cls()
+        data = dict(data)
+        if "start_time" in data:
+            settings.start_time = datetime.fromisoformat(data.pop("start_time"))
+        settings._opts.update(data)
+        return settings
+
     def _output_disabled(self):
         return self.output is None
 
@@ -568,6 +721,8 @@ class RobotSettings(_BaseSettings):
             "randomize_suites": self.randomize_suites,
             "randomize_tests": self.randomize_tests,
             "randomize_seed": self.randomize_seed,
+            "shard": self.shard,
+            "shard_timings": self.shard_timings,
         }
 
     @property
@@ -613,6 +768,18 @@ class RobotSettings(_BaseSettings):
     def dry_run(self):
         return self["DryRun"]
 
+    @property
+    def low_memory(self):
+        return self["LowMemory"]
+
+    @property
+    def parse_cache(self):
+        return self["ParseCache"]
+
+    @property
+    def library_cache(self):
+        return self["LibraryCache"]
+
     @property
     def exit_on_failure(self):
         return self["ExitOnFailure"]
@@ -698,6 +865,26 @@ class RobotSettings(_BaseSettings):
     def extension(self):
         return self["Extension"]
 
+    @property
+    def processes(self):
+        return self["Processes"]
+
+    @property
+    def shard(self) -> "tuple[int, int] | None":
+        return self["Shard"]
+
+    @property
+    def coordinator(self) -> "tuple[str, int] | None":
+        return self["Coordinator"]
+
+    @property
+    def coordinator_timeout(self) -> "float | None":
+        return self["CoordinatorTimeout"]
+
+    @property
+    def worker(self) -> "tuple[str, int] | None":
+        return self["Worker"]
+
 
 class RebotSettings(_BaseSettings):
     _extra_cli_opts = {
@@ -707,6 +894,8 @@ class RebotSettings(_BaseSettings):
         "StartTime"         : ("starttime", None),
         "EndTime"           : ("endtime", None),
         "Merge"             : ("merge", False),
+        "ShardTimings"      : ("shardtimings", None),
+        "Processes"         : ("processes", 1),
     }  # fmt: skip
 
     def _output_disabled(self):
@@ -766,6 +955,10 @@ class RebotSettings(_BaseSettings):
     def merge(self):
         return self["Merge"]
 
+    @property
+    def processes(self):
+        return self["Processes"]
+
     @property
     def console(self):
         if self["ConsoleTypeQuiet"]:
@@ -35,6 +35,7 @@ Libdoc itself is implemented in the :mod:`~robot.libdocpkg` package.
 
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 if __name__ == "__main__" and "robot" not in sys.modules:
     from pythonpathsetter import set_pythonpath
@@ -42,11 +43,12 @@ if __name__ == "__main__" and "robot" not in sys.modules:
     set_pythonpath()
 
 from robot.errors import DataError
-from robot.libdocpkg import (
-    ConsoleViewer, format_languages, LANGUAGES, LibraryDocumentation
-)
+from robot.libdocpkg import ConsoleViewer, format_languages, LANGUAGES
 from robot.utils import Application, seq2str
 
+if TYPE_CHECKING:
+    from robot.libdocpkg import LibraryDocumentation as LibraryDocumentation
+
 USAGE = f"""Libdoc -- Robot Framework library documentation generator
 
 Version:  <VERSION>
@@ -196,6 +198,8 @@ class LibDoc(Application):
         pythonpath=None,
         quiet=False,
     ):
+        from robot.libdocpkg import LibraryDocumentation
+
         if pythonpath:
             sys.path = pythonpath + sys.path
         lib_or_res, output = args[:2]
@@ -345,5 +349,14 @@ def libdoc(
     )
 
 
+def __getattr__(name):
+    # `LibraryDocumentation` is imported only when needed. See `robot.libdocpkg`.
+    if name == "LibraryDocumentation":
+        from robot.libdocpkg import LibraryDocumentation
+
+        return LibraryDocumentation
+    raise AttributeError(f"'robot.libdoc' has no attribute '{name}'.")
+
+
 if __name__ == "__main__":
     libdoc_cli(sys.argv[1:])
@@ -18,6 +18,20 @@
 The public Libdoc API is exposed via the :mod:`robot.libdoc` module.
 """
 
-from .builder import LibraryDocumentation as LibraryDocumentation
+from typing import TYPE_CHECKING
+
 from .consoleviewer import ConsoleViewer as ConsoleViewer
 from .languages import format_languages as format_languages, LANGUAGES as LANGUAGES
+
+if TYPE_CHECKING:
+    from .builder import LibraryDocumentation as LibraryDocumentation
+
+
+def __getattr__(name):
+    # Building documentation requires importing most of the framework. It is
+    # done only when needed to keep, for example, `libdoc --help` fast.
+    if name == "LibraryDocumentation":
+        from .builder import LibraryDocumentation
+
+        return LibraryDocumentation
+    raise AttributeError(f"'robot.libdocpkg' has no attribute '{name}'.")
@@ -21,6 +21,7 @@ from robot.errors import DataError
 from .console import ConsoleOutput
 from .filelogger import FileLogger
 from .loggerhelper import AbstractLogger, write_to_console
+from .replayer import ResultReplayer
 from .stdoutlogsplitter import StdoutLogSplitter
 
 
@@ -59,6 +60,7 @@ class Logger(AbstractLogger):
         self._lib_listeners = None
         self._other_loggers = []
         self._message_cache = []
+        self._message_recorders = []
         self._log_message_parents = []
         self._library_import_logging = 0
         self._error_occurred = False
@@ -172,6 +174,10 @@ class Logger(AbstractLogger):
 
     def message(self, msg):
         """Messages about what the framework is doing, warnings, errors, ..."""
+        for recorder, delay in reversed(self._message_recorders):
+            recorder.append(msg)
+            if delay:
+                return
         if not self._cache_only:
             for logger in self:
                 logger.message(msg)
@@ -191,6 +197,22 @@ class Logger(AbstractLogger):
         finally:
             self._cache_only = False
 
+    @contextmanager
+    def record_messages(self, delay: bool = False):
+        """Record messages written while in the context to the yielded list.
+
+        If ``delay`` is true, recorded messages are not written to registered
+        loggers. They can be written later by passing them to :meth:`message`.
+        """
+        messages = []
+        self._message_recorders.append((messages, delay))
+        try:
+            yield messages
+        finally:
+            self._message_recorders = [
+                rec for rec in self._message_recorders if rec[0] is not messages
+            ]
+
     def log_message(self, msg):
         """Log messages written (mainly) by libraries."""
         logged = False
@@ -212,6 +234,11 @@ class Logger(AbstractLogger):
         if not logged:
             self.message(msg)
 
+    def replay_result(self, result):
+        """Reports results executed elsewhere to the console and output file."""
+        loggers = [lo for lo in (self._console, self._output_file) if lo]
+        result.visit(ResultReplayer(*loggers))
+
     def log_output(self, output):
         for msg in StdoutLogSplitter(output):
             self.log_message(msg)
@@ -32,6 +32,7 @@ class Output(AbstractLogger, LoggerApi):
             self.log_level,
             settings.rpa,
             legacy_output=settings.legacy_output,
+            compression_level=settings.compression_level,
         )
         self.listeners = Listeners(settings.listeners, self.log_level)
         self.library_listeners = LibraryListeners(self.log_level)
@@ -64,6 +65,13 @@ class Output(AbstractLogger, LoggerApi):
         self.output_file.close()
         LOGGER.unregister_output_file()
         LOGGER.output_file(self._settings["Output"])
+        if self._settings.index:
+            self._write_index(self._settings.output)
+
+    def _write_index(self, path):
+        from robot.result.outputindex import OutputIndex
+
+        OutputIndex.write_for(path)
 
     def start_suite(self, data, result):
         LOGGER.start_suite(data, result)
@@ -188,6 +196,9 @@ class Output(AbstractLogger, LoggerApi):
     def message(self, msg):
         LOGGER.log_message(msg)
 
+    def replay_result(self, result):
+        LOGGER.replay_result(result)
+
     def trace(self, msg, write_if_flat=True):
         if write_if_flat or not self.output_file.flatten_level:
             self.write(msg, "TRACE")
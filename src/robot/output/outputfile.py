@@ -17,7 +17,7 @@ from contextlib import contextmanager
 from pathlib import Path
 
 from robot.errors import DataError
-from robot.utils import get_error_message
+from robot.utils import get_error_message, get_file_suffix, open_file
 
 from .jsonlogger import JsonLogger
 from .loggerapi import LoggerApi
@@ -33,24 +33,27 @@ class OutputFile(LoggerApi):
         log_level: LogLevel,
         rpa: bool = False,
         legacy_output: bool = False,
+        compression_level: int = 1,
     ):
         # `self.logger` is replaced with `NullLogger` when flattening.
-        self.logger = self.real_logger = self._get_logger(path, rpa, legacy_output)
+        self.logger = self.real_logger = self._get_logger(
+            path, rpa, legacy_output, compression_level
+        )
         self.is_logged = log_level.is_logged
         self.flatten_level = 0
         self.errors = []
         self._delayed_messages = None
 
-    def _get_logger(self, path, rpa, legacy_output):
+    def _get_logger(self, path, rpa, legacy_output, compression_level):
         if not path:
             return NullLogger()
         try:
-            file = open(path, "w", encoding="UTF-8")
+            file = open_file(path, "w", "UTF-8", compression_level=compression_level)
         except Exception:
             raise DataError(
                 f"Opening output file '{path}' failed: {get_error_message()}"
             )
-        if path.suffix.lower() == ".json":
+        if get_file_suffix(path) == ".json":
             return JsonLogger(file, rpa)
         if legacy_output:
             return LegacyXmlLogger(file, rpa)
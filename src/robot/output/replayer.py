@@ -0,0 +1,143 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from robot.result import ResultVisitor
+
+
+class ResultReplayer(ResultVisitor):
+    """Reports already executed results to loggers as if they were run now.
+
+    Used when tests are executed in other processes and their results need
+    to be written to the output file and console of the main process.
+    Loggers must implement the :class:`~robot.output.loggerapi.LoggerApi`
+    interface and they get the result object both as ``data`` and ``result``.
+    """
+
+    def __init__(self, *loggers):
+        self.loggers = loggers
+
+    def _start(self, name, item):
+        for logger in self.loggers:
+            getattr(logger, name)(item, item)
+
+    def _end(self, name, item):
+        for logger in reversed(self.loggers):
+            getattr(logger, name)(item, item)
+
+    def start_suite(self, suite):
+        self._start("start_suite", suite)
+
+    def end_suite(self, suite):
+        self._end("end_suite", suite)
+
+    def start_test(self, test):
+        self._start("start_test", test)
+
+    def end_test(self, test):
+        self._end("end_test", test)
+
+    def start_keyword(self, keyword):
+        self._start("start_keyword", keyword)
+
+    def end_keyword(self, keyword):
+        self._end("end_keyword", keyword)
+
+    def start_for(self, for_):
+        self._start("start_for", for_)
+
+    def end_for(self, for_):
+        self._end("end_for", for_)
+
+    def start_for_iteration(self, iteration):
+        self._start("start_for_iteration", iteration)
+
+    def end_for_iteration(self, iteration):
+        self._end("end_for_iteration", iteration)
+
+    def start_while(self, while_):
+        self._start("start_while", while_)
+
+    def end_while(self, while_):
+        self._end("end_while", while_)
+
+    def start_while_iteration(self, iteration):
+        self._start("start_while_iteration", iteration)
+
+    def end_while_iteration(self, iteration):
+        self._end("end_while_iteration", iteration)
+
+    def start_group(self, group):
+        self._start("start_group", group)
+
+    def end_group(self, group):
+        self._end("end_group", group)
+
+    def start_if(self, if_):
+        self._start("start_if", if_)
+
+    def end_if(self, if_):
+        self._end("end_if", if_)
+
+    def start_if_branch(self, branch):
+        self._start("start_if_branch", branch)
+
+    def end_if_branch(self, branch):
+        self._end("end_if_branch", branch)
+
+    def start_try(self, try_):
+        self._start("start_try", try_)
+
+    def end_try(self, try_):
+        self._end("end_try", try_)
+
+    def start_try_branch(self, branch):
+        self._start("start_try_branch", branch)
+
+    def end_try_branch(self, branch):
+        self._end("end_try_branch", branch)
+
+    def start_var(self, var):
+        self._start("start_var", var)
+
+    def end_var(self, var):
+        self._end("end_var", var)
+
+    def start_break(self, break_):
+        self._start("start_break", break_)
+
+    def end_break(self, break_):
+        self._end("end_break", break_)
+
+    def start_continue(self, continue_):
+        self._start("start_continue", continue_)
+
+    def end_continue(self, continue_):
+        self._end("end_continue", continue_)
+
+    def start_return(self, return_):
+        self._start("start_return", return_)
+
+    def end_return(self, return_):
+        self._end("end_return", return_)
+
+    def start_error(self, error):
+        self._start("start_error", error)
+
+    def end_error(self, error):
+        self._end("end_error", error)
+
+    def visit_message(self, message):
+        for logger in self.loggers:
+            logger.log_message(message)
@@ -36,6 +36,9 @@ from .parser import (
     get_init_model as get_init_model,
     get_model as get_model,
     get_resource_model as get_resource_model,
+    update_init_model as update_init_model,
+    update_model as update_model,
+    update_resource_model as update_resource_model,
 )
 from .suitestructure import (
     SuiteDirectory as SuiteDirectory,
@@ -14,7 +14,7 @@
 #  limitations under the License.
 
 import re
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 
 from .tokens import Token
 
@@ -24,10 +24,15 @@ class Tokenizer:
     _pipe_splitter = re.compile(r"((?:\A|\s+)\|(?:\s+|\Z))", re.UNICODE)
 
     def tokenize(self, data: str, data_only: bool = False) -> "Iterator[list[Token]]":
+        if data_only:
+            return self._tokenize_data_only(data)
+        return self._tokenize(data)
+
+    def _tokenize(self, data: str) -> "Iterator[list[Token]]":
         current: list[Token] = []
-        for lineno, line in enumerate(data.splitlines(not data_only), start=1):
-            tokens = self._tokenize_line(line, lineno, not data_only)
-            tokens, starts_new = self._cleanup_tokens(tokens, data_only)
+        for lineno, line in enumerate(data.splitlines(True), start=1):
+            tokens = self._tokenize_line(line, lineno, include_separators=True)
+            tokens, starts_new = self._cleanup_tokens(tokens, data_only=False)
             if starts_new:
                 if current:
                     yield current
@@ -36,6 +41,96 @@ class Tokenizer:
                 current.extend(tokens)
         yield current
 
+    def _tokenize_data_only(self, data: str) -> "Iterator[list[Token]]":
+        # Performance optimized code. Produces the same data tokens as
+        # `_tokenize_line` and `_cleanup_tokens` would, but creates tokens
+        # only for data and skips lines without data altogether.
+        current: list[Token] = []
+        split_from_spaces = self._space_splitter.split
+        for lineno, line in enumerate(data.splitlines(), start=1):
+            first = line.lstrip()[:1]
+            if not first or first == "#":
+                continue
+            if line[:1] == "|" and line[:2].strip() == "|":
+                parts = (value for value, _ in self._split_from_pipes(line.rstrip()))
+                cells = self._get_data_cells(parts, starts_with_data=False)
+                tokens, starts_new = self._get_data_tokens(cells, lineno)
+            elif "#" in line or "..." in line:
+                parts = split_from_spaces(line.rstrip())
+                cells = self._get_data_cells(parts, starts_with_data=True)
+                tokens, starts_new = self._get_data_tokens(cells, lineno)
+            else:
+                # No comments nor continuation and the line has data.
+                tokens = []
+                offset = 0
+                is_data = True
+                for value in split_from_spaces(line.rstrip()):
+                    if is_data:
+                        tokens.append(Token(None, value, lineno, offset))
+                    offset += len(value)
+                    is_data = not is_data
+                starts_new = True
+            if starts_new:
+                if current:
+                    yield current
+                current = tokens
+            else:
+                current.extend(tokens)
+        yield current
+
+    def _get_data_cells(
+        self,
+        parts: "Iterable[str]",
+        starts_with_data: bool,
+    ) -> "list[tuple[str, int]]":
+        # Data and separators alternate. Returns data values and their offsets.
+        cells = []
+        offset = 0
+        is_data = starts_with_data
+        for value in parts:
+            if is_data:
+                cells.append((value, offset))
+            offset += len(value)
+            is_data = not is_data
+        return cells
+
+    def _get_data_tokens(
+        self,
+        cells: "list[tuple[str, int]]",
+        lineno: int,
+    ) -> "tuple[list[Token], bool]":
+        continuation = None
+        has_data = False
+        end = len(cells)
+        for index, (value, offset) in enumerate(cells):
+            if not index:
+                # The first value may have a leading space. With pipes and
+                # with other values spaces have been consumed as separators.
+                value = value.lstrip()
+            if not value:
+                continue
+            if value[0] == "#":
+                end = index
+                break
+            if not has_data:
+                if value == "..." and continuation is None:
+                    continuation = index
+                else:
+                    has_data = True
+        while end and not cells[end - 1][0]:
+            end -= 1
+        if continuation is None:
+            start = 0
+        elif end > continuation + 1:
+            start = continuation + 1
+        else:
+            value, offset = cells[continuation]
+            return [Token(None, "", lineno, offset + len(value))], False
+        tokens = [
+            Token(None, value, lineno, offset) for value, offset in cells[start:end]
+        ]
+        return tokens, continuation is None and has_data
+
     def _tokenize_line(
         self,
         line: str,
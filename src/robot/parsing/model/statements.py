@@ -22,8 +22,6 @@ from typing import ClassVar, Literal, overload, Type, TYPE_CHECKING, TypeVar
 
 from robot.conf import Language
 from robot.errors import DataError
-from robot.running import TypeInfo
-from robot.running.arguments import UserKeywordArgumentParser
 from robot.utils import normalize_whitespace, seq2str, split_from_equals, test_or_task
 from robot.variables import (
     contains_variable, is_dict_variable, is_scalar_assign, search_variable,
@@ -999,6 +997,9 @@ class Arguments(MultiValue):
         return cls(tokens)
 
     def validate(self, ctx: "ValidationContext"):
+        # `robot.running` is imported here to avoid a circular import.
+        from robot.running.arguments import UserKeywordArgumentParser
+
         errors: list[str] = []
         UserKeywordArgumentParser(error_reporter=errors.append).parse(self.values)
         self.errors = tuple(errors)
@@ -1184,6 +1185,8 @@ class ForHeader(Statement):
                 if not match.is_scalar_assign():
                     self.errors += (f"Invalid FOR loop variable '{var}'.",)
                 elif match.type:
+                    from robot.running import TypeInfo
+
                     try:
                         TypeInfo.from_variable(match)
                     except DataError as err:
@@ -1755,6 +1758,8 @@ class VariableValidator:
             return
         if match.identifier == "&":
             self._validate_dict_items(statement)
+        from robot.running import TypeInfo
+
         try:
             TypeInfo.from_variable(match)
         except DataError as err:
@@ -1780,6 +1785,8 @@ class AssignmentValidator:
         if assignment:
             assignment = VariableAssignment(assignment)
             statement.errors += assignment.errors
+            from robot.running import TypeInfo
+
             for variable in assignment:
                 try:
                     TypeInfo.from_variable(variable)
@@ -13,6 +13,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from .incremental import (
+    update_init_model as update_init_model,
+    update_model as update_model,
+    update_resource_model as update_resource_model,
+)
 from .parser import (
     get_init_model as get_init_model,
     get_model as get_model,
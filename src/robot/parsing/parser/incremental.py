@@ -0,0 +1,344 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from io import StringIO
+from typing import Callable, Iterator
+
+from robot.conf import LanguagesLike
+
+from ..lexer import get_init_tokens, get_resource_tokens, get_tokens, Token
+from ..model import (
+    Block, File, KeywordSection, Section, SettingSection, Statement, TestCaseSection,
+    VariableSection
+)
+from .parser import _get_model
+
+
+def update_model(
+    model: File,
+    start: "tuple[int, int]",
+    end: "tuple[int, int]",
+    text: str,
+    lang: LanguagesLike = None,
+) -> File:
+    """Updates a model created by :func:`get_model` based on a text edit.
+
+    :param model: The model to update. Must have been created using
+        ``data_only=False``.
+    :param start: Start of the edited range as a ``(lineno, col_offset)`` tuple.
+        Line numbers start from 1 and column offsets from 0 similarly as with
+        tokens.
+    :param end: End of the edited range in the same format as ``start``.
+        The character at the end position is not part of the range.
+    :param text: Text replacing the range. Empty when text is just removed.
+    :param lang: Additional languages to be supported during parsing.
+        Should be the same as used when the model was created.
+
+    Only tests, tasks, keywords and variables that are affected by the edit
+    are tokenized and lexed again.
+    The other parts of the model are preserved as-is and, if needed, their
+    line numbers are updated. If the edit affects section headers, settings,
+    or other data that can affect how the rest of the file is parsed, the whole
+    file is parsed again. In both cases the result is the same as when parsing
+    the edited data with :func:`get_model`.
+
+    The given model is updated in place and also returned.
+
+    Use :func:`update_resource_model` or :func:`update_init_model` with models
+    created using :func:`get_resource_model` or :func:`get_init_model`,
+    respectively.
+
+    New in Robot Framework 7.5.
+    """
+    return ModelUpdater(get_tokens, lang).update(model, start, end, text)
+
+
+def update_resource_model(
+    model: File,
+    start: "tuple[int, int]",
+    end: "tuple[int, int]",
+    text: str,
+    lang: LanguagesLike = None,
+) -> File:
+    """Updates a model created by :func:`get_resource_model`.
+
+    Same as :func:`update_model` otherwise, but the model is considered to be
+    a resource file model.
+
+    New in Robot Framework 7.5.
+    """
+    return ModelUpdater(get_resource_tokens, lang).update(model, start, end, text)
+
+
+def update_init_model(
+    model: File,
+    start: "tuple[int, int]",
+    end: "tuple[int, int]",
+    text: str,
+    lang: LanguagesLike = None,
+) -> File:
+    """Updates a model created by :func:`get_init_model`.
+
+    Same as :func:`update_model` otherwise, but the model is considered to be
+    a suite initialization file model.
+
+    New in Robot Framework 7.5.
+    """
+    return ModelUpdater(get_init_tokens, lang).update(model, start, end, text)
+
+
+class ModelUpdater:
+    # Sections where top level items can be parsed separately. Tests, tasks
+    # and keywords are affected by settings, but all settings are included
+    # when parsing.
+    supported_sections = (VariableSection, TestCaseSection, KeywordSection)
+
+    def __init__(
+        self,
+        token_getter: Callable[..., Iterator[Token]],
+        lang: LanguagesLike = None,
+    ):
+        self.token_getter = token_getter
+        self.lang = lang
+
+    def update(
+        self,
+        model: File,
+        start: "tuple[int, int]",
+        end: "tuple[int, int]",
+        text: str,
+    ) -> File:
+        if start > end:
+            raise ValueError(f"Edit start {start} is after its end {end}.")
+        if model.sections and not self._has_eol(model.sections[0]):
+            raise ValueError(
+                "Updating model requires model created using 'data_only=False'."
+            )
+        if not self._update_section(model, start, end, text):
+            self._update_file(model, start, end, text)
+        return model
+
+    def _has_eol(self, section: Section) -> bool:
+        statement = self._first_statement(section)
+        return any(token.type == Token.EOL for token in statement.tokens)
+
+    def _update_file(
+        self,
+        model: File,
+        start: "tuple[int, int]",
+        end: "tuple[int, int]",
+        text: str,
+    ):
+        data = self._apply_edit(self._get_text(model), 1, start, end, text)
+        updated = self._get_model(data)
+        model.sections = updated.sections
+        model.languages = updated.languages
+
+    def _update_section(
+        self,
+        model: File,
+        start: "tuple[int, int]",
+        end: "tuple[int, int]",
+        text: str,
+    ) -> bool:
+        section = self._find_section(model, start[0], end[0])
+        if not section:
+            return False
+        header = section.header
+        if start[0] <= header.end_lineno or not self._ends_with_newline(header):
+            return False
+        items = section.body
+        first, last = self._find_affected_items(items, start[0], end[0])
+        affected = items[first : last + 1]
+        if affected:
+            lineno = self._first_statement(affected[0]).lineno
+        else:
+            lineno = header.end_lineno + 1
+        old = "".join(self._get_text(item) for item in affected)
+        try:
+            new = self._apply_edit(old, lineno, start, end, text)
+        except ValueError:
+            return False
+        updated = self._parse_section(model, section, new, lineno)
+        if updated is None:
+            return False
+        delta = self._count_line_breaks(new) - self._count_line_breaks(old)
+        if delta:
+            following = items[last + 1 :]
+            following += model.sections[model.sections.index(section) + 1 :]
+            for node in following:
+                for statement in self._get_statements(node):
+                    for token in statement.tokens:
+                        token.lineno += delta
+        items[first : last + 1] = updated.body
+        return True
+
+    def _find_section(self, model: File, start: int, end: int) -> "Section | None":
+        sections = model.sections
+        if not sections:
+            return None
+        index = 0
+        for index, section in reversed(list(enumerate(sections))):
+            if self._first_statement(section).lineno <= start:
+                break
+        if index + 1 < len(sections):
+            if self._first_statement(sections[index + 1]).lineno <= end:
+                return None
+        section = sections[index]
+        if not isinstance(section, self.supported_sections):
+            return None
+        return section
+
+    def _find_affected_items(
+        self,
+        items: "list[Statement | Block]",
+        start: int,
+        end: int,
+    ) -> "tuple[int, int]":
+        if not items:
+            return 0, -1
+        linenos = [self._first_statement(item).lineno for item in items]
+        first = last = len(items) - 1
+        for index in range(1, len(items)):
+            if linenos[index] > start:
+                first = index - 1
+                break
+        for index in range(first, len(items)):
+            if linenos[index] > end:
+                last = index - 1
+                break
+        # Edit on the first line of an item can make it part of the previous
+        # item. With statements, continuation lines also continue statements
+        # before possible comments and empty lines.
+        if first > 0 and start <= linenos[first]:
+            first -= 1
+            while first > 0 and self._is_comment_or_empty(items[first]):
+                first -= 1
+        # Comments, empty lines and tests or keywords without name can become
+        # part of a test or keyword created by the edit.
+        while last + 1 < len(items) and (
+            self._is_comment_or_empty(items[last + 1])
+            or self._has_no_name(items[last + 1])
+        ):
+            last += 1
+        return first, last
+
+    def _is_comment_or_empty(self, item: "Statement | Block") -> bool:
+        return isinstance(item, Statement) and item.type in (Token.COMMENT, Token.EOL)
+
+    def _has_no_name(self, item: "Statement | Block") -> bool:
+        return isinstance(item, Block) and not item.header.tokens[0].value
+
+    def _parse_section(
+        self,
+        model: File,
+        section: Section,
+        data: str,
+        lineno: int,
+    ) -> "Section | None":
+        # Implicit comment section can contain language configuration and
+        # settings affect how tests and tasks are lexed. They are parsed
+        # together with the edited items and then discarded.
+        context = [
+            s
+            for s in model.sections
+            if s.header is None or isinstance(s, SettingSection)
+        ]
+        prefix = "".join(self._get_text(s) for s in context)
+        if prefix and not self._ends_with_newline(prefix):
+            prefix += "\n"
+        prefix += self._get_text(section.header)
+        parsed = self._get_model(prefix + data)
+        if len(parsed.sections) != len(context) + 1:
+            return None
+        updated = parsed.sections[-1]
+        # Edited data can, for example, continue the section header.
+        if type(updated) is not type(section) or self._get_text(
+            updated.header
+        ) != self._get_text(section.header):
+            return None
+        delta = lineno - self._count_line_breaks(prefix) - 1
+        for item in updated.body:
+            for statement in self._get_statements(item):
+                for token in statement.tokens:
+                    token.lineno += delta
+        return updated
+
+    def _get_model(self, data: str) -> File:
+        return _get_model(self.token_getter, StringIO(data), False, None, self.lang)
+
+    def _apply_edit(
+        self,
+        data: str,
+        lineno: int,
+        start: "tuple[int, int]",
+        end: "tuple[int, int]",
+        text: str,
+    ) -> str:
+        lines = data.splitlines(keepends=True)
+        start_offset = self._get_offset(lines, lineno, start)
+        end_offset = self._get_offset(lines, lineno, end)
+        return data[:start_offset] + text + data[end_offset:]
+
+    def _get_offset(
+        self,
+        lines: "list[str]",
+        lineno: int,
+        position: "tuple[int, int]",
+    ) -> int:
+        index = position[0] - lineno
+        col_offset = position[1]
+        if index == len(lines) and col_offset == 0:
+            return sum(len(line) for line in lines)
+        # Column offset can point to the end of the line, but not past it.
+        # Line breaks are not part of the line.
+        if not (
+            0 <= index < len(lines)
+            and 0 <= col_offset <= len(lines[index].rstrip("\r\n"))
+        ):
+            raise ValueError(f"Invalid position {position}.")
+        return sum(len(line) for line in lines[:index]) + col_offset
+
+    def _get_text(self, node: "File | Section | Statement | Block") -> str:
+        return "".join(
+            token.value
+            for statement in self._get_statements(node)
+            for token in statement.tokens
+        )
+
+    def _get_statements(self, node) -> "Iterator[Statement]":
+        if isinstance(node, Statement):
+            yield node
+            return
+        for field in node._fields:
+            value = getattr(node, field)
+            if isinstance(value, list):
+                for item in value:
+                    yield from self._get_statements(item)
+            elif value is not None:
+                yield from self._get_statements(value)
+
+    def _first_statement(self, node: "Section | Statement | Block") -> Statement:
+        while not isinstance(node, Statement):
+            node = node.header if node.header is not None else node.body[0]
+        return node
+
+    def _ends_with_newline(self, data: "str | Statement") -> bool:
+        if isinstance(data, Statement):
+            data = data.tokens[-1].value
+        return self._count_line_breaks(data[-1:]) == 1
+
+    def _count_line_breaks(self, data: str) -> int:
+        return len((data + "x").splitlines()) - 1
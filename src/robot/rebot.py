@@ -37,10 +37,7 @@ if __name__ == "__main__" and "robot" not in sys.modules:
 
     set_pythonpath()
 
-from robot.conf import RebotSettings
 from robot.errors import DataError
-from robot.output import LOGGER
-from robot.reporting import ResultWriter
 from robot.run import RobotFramework
 from robot.utils import Application
 
@@ -84,6 +81,11 @@ Options
  -R --merge               When combining results, merge outputs together
                           instead of putting them under a new top level suite.
                           Example: rebot --merge orig.xml rerun.xml
+    --processes num       Read multiple output files in parallel in `num`
+                          worker processes. Results are combined or merged in
+                          the given order. The default is 1, meaning that
+                          files are read in the main process.
+                          Example: rebot --processes 8 output*.xml
  -N --name name           Set the name of the top level suite.
  -D --doc documentation   Set the documentation of the top level suite.
                           Simple formatting is supported (e.g. *bold*). If
@@ -132,6 +134,14 @@ Options
                           --outputdir unless given as an absolute path.
     --legacyoutput        Create XML output file in format compatible with
                           Robot Framework 6.x and earlier.
+    --index               Create a sidecar index file containing byte offsets
+                          of suites and tests in the XML output file. Results
+                          can be read lazily using the index when processing
+                          huge outputs programmatically.
+    --compressionlevel level  Compression level between 0 and 9 to use when
+                          the output file has a `.gz` or `.xz` suffix and is
+                          thus compressed. Higher levels create smaller files
+                          but are slower. Default: 1
  -l --log file            HTML log file. Can be disabled by giving a special
                           name `NONE`. Default: log.html
                           Examples: `--log mylog.html`, `-l none`
@@ -139,6 +149,13 @@ Options
                           similarly as --log. Default: report.html
  -x --xunit file          xUnit compatible result file. Not created unless this
                           option is specified.
+    --shardtimings file   Write test durations to a JSON file that can be used
+                          with the `--shard` option when running tests to
+                          balance shards. If the file exists, its timings are
+                          updated. Outputs of shards should be combined with
+                          `--merge` to preserve test names.
+                          Example: rebot --merge --shardtimings timings.json
+                                         --output NONE shard*.xml
  -T --timestampoutputs    When this option is used, timestamp in a format
                           `YYYYMMDD-hhmmss` is added to all generated output
                           files between their basename and extension. For
@@ -347,6 +364,8 @@ $ python -m robot.rebot --name Combined outputs/*.xml
 class Rebot(RobotFramework):
 
     def __init__(self):
+        from robot.output import LOGGER
+
         Application.__init__(
             self,
             USAGE,
@@ -356,6 +375,10 @@ class Rebot(RobotFramework):
         )
 
     def main(self, datasources, **options):
+        from robot.conf import RebotSettings
+        from robot.output import LOGGER
+        from robot.reporting import ResultWriter
+
         try:
             settings = RebotSettings(options)
         except DataError:
@@ -54,7 +54,14 @@ class ResultWriter:
         settings = settings or RebotSettings(options)
         results = Results(settings, *self._sources)
         if settings.output:
-            self._write_output(results.result, settings.output, settings.legacy_output)
+            self._write_output(
+                results.result,
+                settings.output,
+                settings.legacy_output,
+                settings.compression_level,
+            )
+            if settings.index:
+                self._write_index(settings.output)
         if settings.xunit:
             self._write_xunit(results.result, settings.xunit)
         if settings.log:
@@ -65,10 +72,17 @@ class ResultWriter:
             self._write_report(
                 results.js_result, settings.report, settings.report_config
             )
+        if settings.shard_timings:
+            self._write_shard_timings(results.result, settings.shard_timings)
         return results.return_code
 
-    def _write_output(self, result, path, legacy_output=False):
-        self._write("Output", result.save, path, legacy_output)
+    def _write_output(self, result, path, legacy_output=False, compression_level=1):
+        self._write("Output", result.save, path, legacy_output, compression_level)
+
+    def _write_index(self, path):
+        from robot.result.outputindex import OutputIndex
+
+        OutputIndex.write_for(path)
 
     def _write_xunit(self, result, path):
         self._write("XUnit", XUnitWriter(result).write, path)
@@ -79,6 +93,16 @@ class ResultWriter:
     def _write_report(self, js_result, path, config):
         self._write("Report", ReportWriter(js_result).write, path, config)
 
+    def _write_shard_timings(self, result, path):
+        from robot.running.sharder import ShardTimings
+
+        try:
+            ShardTimings.from_file(path).update(result.suite).save(path)
+        except DataError as err:
+            LOGGER.error(err.message)
+        else:
+            LOGGER.info(f"Shard timings written to '{path}'.")
+
     def _write(self, name, writer, path, *args):
         try:
             writer(path, *args)
@@ -114,6 +138,7 @@ class Results:
                 flattened_keywords=flattened,
                 merge=self._settings.merge,
                 rpa=self._settings.rpa,
+                processes=self._settings.processes,
             )
             if self._settings.rpa is None:
                 self._settings.rpa = self._result.rpa
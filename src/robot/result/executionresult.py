@@ -19,7 +19,9 @@ from typing import overload, Sequence, TextIO
 
 from robot.errors import DataError
 from robot.model import Statistics, SuiteVisitor
-from robot.utils import JsonDumper, JsonLoader, setter
+from robot.utils import (
+    file_writer, get_file_suffix, is_compressed, JsonDumper, JsonLoader, setter
+)
 from robot.version import get_full_version
 
 from .executionerrors import ExecutionErrors
@@ -47,7 +49,7 @@ def is_json_source(source) -> bool:
         path = Path(source.name)
     else:
         return False
-    return bool(path and path.suffix.lower() == ".json")
+    return bool(path and get_file_suffix(path) == ".json")
 
 
 class Result:
@@ -304,7 +306,7 @@ class Result:
             separators=separators,
         ).dump(data, file)
 
-    def save(self, target=None, legacy_output=False):
+    def save(self, target=None, legacy_output=False, compression_level=1):
         """Save results as XML or JSON file.
 
         :param target: Target where to save results to. Can be a path
@@ -312,10 +314,16 @@ class Result:
             uses the :attr:`source` which overwrites the original file.
         :param legacy_output: Save XML results in Robot Framework 6.x compatible
             format. New in Robot Framework 7.0.
+        :param compression_level: Compression level between 0 and 9 to use
+            if the ``target`` is a path with a ``.gz`` or ``.xz`` suffix.
+            New in Robot Framework 7.5.
 
         File type is got based on the ``target``. The type is JSON if the ``target``
         is a path that has a ``.json`` suffix or if it is an open file that has
         a ``name`` attribute with a ``.json`` suffix. Otherwise, the type is XML.
+        If the path additionally has a ``.gz`` or ``.xz`` suffix, like
+        ``output.xml.gz``, the file is compressed using gzip or lzma,
+        respectively. Support for compressed files is new in Robot Framework 7.5.
 
         It is also possible to use :meth:`to_json` for JSON serialization. Compared
         to this method, it allows returning the JSON in addition to writing it
@@ -331,7 +339,15 @@ class Result:
         target = target or self.source
         if not target:
             raise ValueError("Path required.")
-        if is_json_source(target):
+        if isinstance(target, (Path, str)) and is_compressed(target):
+            with file_writer(
+                target, usage="output", compression_level=compression_level
+            ) as file:
+                if is_json_source(target):
+                    self.to_json(file)
+                else:
+                    self.save(file, legacy_output)
+        elif is_json_source(target):
             self.to_json(target)
         else:
             writer = OutputWriter if not legacy_output else LegacyOutputWriter
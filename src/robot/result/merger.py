@@ -24,6 +24,7 @@ class Merger(SuiteVisitor):
         self.result = result
         self.current = None
         self.rpa = rpa
+        self._indices = {}
 
     def merge(self, merged):
         self.result.set_execution_mode(merged)
@@ -34,7 +35,7 @@ class Merger(SuiteVisitor):
         if self.current is None:
             old = self._find_root(suite.name)
         else:
-            old = self._find(self.current.suites, suite.name)
+            old = self._find(self.current, "suites", suite.name)
         if old is not None:
             old.start_time = old.end_time = old.elapsed_time = None
             old.doc = suite.doc
@@ -44,7 +45,7 @@ class Merger(SuiteVisitor):
             self.current = old
         else:
             suite.message = self._create_add_message(suite, suite=True)
-            self.current.suites.append(suite)
+            self._append(self.current, "suites", suite)
         return old is not None
 
     def _find_root(self, name):
@@ -56,26 +57,46 @@ class Merger(SuiteVisitor):
             )
         return root
 
-    def _find(self, items, name):
-        for item in items:
-            if item.name == name:
-                return item
-        return None
+    def _find(self, suite, attr, name):
+        index = self._get_indices(suite, attr).get(name)
+        return getattr(suite, attr)[index] if index is not None else None
+
+    def _get_indices(self, suite, attr):
+        """Return mapping from names to indices of first child suites or tests.
+
+        ``attr`` is either ``"suites"`` or ``"tests"``. Mappings are created
+        lazily per suite and updated when items are added to avoid scanning
+        items linearly every time when an item needs to be found.
+        """
+        indices = self._indices.setdefault(suite, {})
+        if attr not in indices:
+            names = {}
+            for index, item in enumerate(getattr(suite, attr)):
+                names.setdefault(item.name, index)
+            indices[attr] = names
+        return indices[attr]
+
+    def _append(self, suite, attr, item):
+        indices = self._get_indices(suite, attr)
+        items = getattr(suite, attr)
+        items.append(item)
+        indices.setdefault(item.name, len(items) - 1)
 
     def end_suite(self, suite):
         self.current = self.current.parent
 
     def visit_test(self, test):
-        old = self._find(self.current.tests, test.name)
-        if old is None:
+        tests = self.current.tests
+        index = self._get_indices(self.current, "tests").get(test.name)
+        if index is None:
             test.message = self._create_add_message(test)
-            self.current.tests.append(test)
+            self._append(self.current, "tests", test)
         elif test.skipped:
+            old = tests[index]
             old.message = self._create_skip_message(old, test)
         else:
-            test.message = self._create_merge_message(test, old)
-            index = self.current.tests.index(old)
-            self.current.tests[index] = test
+            test.message = self._create_merge_message(test, tests[index])
+            tests[index] = test
 
     def _create_add_message(self, item, suite=False):
         item_type = "Suite" if suite else test_or_task("Test", self.rpa)
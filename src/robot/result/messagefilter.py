@@ -13,15 +13,16 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from robot import output
-
 from .visitor import ResultVisitor
 
 
 class MessageFilter(ResultVisitor):
 
     def __init__(self, level="TRACE"):
-        log_level = output.LogLevel(level or "TRACE")
+        # Imported here to avoid a circular import with `robot.output`.
+        from robot.output import LogLevel
+
+        log_level = LogLevel(level or "TRACE")
         self.log_all = log_level.level == "TRACE"
         self.is_logged = log_level.is_logged
 
@@ -37,7 +37,9 @@ __ http://robotframework.org/robotframework/latest/RobotFrameworkUserGuide.html#
 from datetime import datetime, timedelta
 from io import StringIO
 from pathlib import Path
-from typing import Final, Literal, Mapping, overload, Sequence, TextIO, TypeVar, Union
+from typing import (
+    Callable, Final, Literal, Mapping, overload, Sequence, TextIO, TypeVar, Union
+)
 
 from robot import model
 from robot.model import (
@@ -1007,7 +1009,15 @@ class TestCase(model.TestCase[Keyword], StatusMixin):
 
     body_class = Body
     fixture_class = Keyword
-    __slots__ = ("status", "message", "_start_time", "_end_time", "_elapsed_time")
+    __slots__ = (
+        "status",
+        "message",
+        "_start_time",
+        "_end_time",
+        "_elapsed_time",
+        "_body",
+        "_lazy_loader",
+    )
 
     def __init__(
         self,
@@ -1023,6 +1033,8 @@ class TestCase(model.TestCase[Keyword], StatusMixin):
         elapsed_time: "timedelta | int | float | None" = None,
         parent: "TestSuite | None" = None,
     ):
+        # Set when results are read lazily. Called to read the test body.
+        self._lazy_loader: "Callable[[], TestCase] | None" = None
         super().__init__(name, doc, tags, timeout, lineno, parent)
         self.status = status
         self.message = message
@@ -1034,10 +1046,68 @@ class TestCase(model.TestCase[Keyword], StatusMixin):
     def not_run(self) -> bool:
         return False
 
-    @setter
-    def body(self, body: "Sequence[BodyItem | DataDict]") -> Body:
-        """Test body."""
-        return self.body_class(self, body)
+    @property
+    def body(self) -> Body:
+        """Test body.
+
+        If results have been read lazily, the body is read when it is accessed
+        the first time. The same applies also to :attr:`setup` and
+        :attr:`teardown`.
+        """
+        if self._lazy_loader:
+            self._load_lazily()
+        return self._body
+
+    @body.setter
+    def body(self, body: "Sequence[BodyItem | DataDict]"):
+        if self._lazy_loader:
+            self._load_lazily()
+        self._body = self.body_class(self, body)
+
+    @property
+    def setup(self) -> Keyword:
+        if self._lazy_loader:
+            self._load_lazily()
+        return super().setup
+
+    @setup.setter
+    def setup(self, setup: "Keyword | DataDict | None"):
+        if self._lazy_loader:
+            self._load_lazily()
+        model.TestCase.setup.fset(self, setup)
+
+    @property
+    def has_setup(self) -> bool:
+        if self._lazy_loader:
+            self._load_lazily()
+        return super().has_setup
+
+    @property
+    def teardown(self) -> Keyword:
+        if self._lazy_loader:
+            self._load_lazily()
+        return super().teardown
+
+    @teardown.setter
+    def teardown(self, teardown: "Keyword | DataDict | None"):
+        if self._lazy_loader:
+            self._load_lazily()
+        model.TestCase.teardown.fset(self, teardown)
+
+    @property
+    def has_teardown(self) -> bool:
+        if self._lazy_loader:
+            self._load_lazily()
+        return super().has_teardown
+
+    def _load_lazily(self):
+        loader, self._lazy_loader = self._lazy_loader, None
+        loaded = loader()
+        self.body = loaded.body
+        if loaded.has_setup:
+            self.setup = loaded.setup
+        if loaded.has_teardown:
+            self.teardown = loaded.teardown
 
     def to_dict(self) -> DataDict:
         return {"id": self.id, **super().to_dict(), **StatusMixin.to_dict(self)}
@@ -0,0 +1,241 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Sidecar indices for output.xml files used for reading results lazily.
+
+An index contains byte offsets of suite and test elements in an output.xml
+file. When results are read lazily, test bodies are skipped when the file is
+parsed and individual tests are parsed separately based on the offsets only
+when their bodies are accessed.
+"""
+
+import json
+import os
+from pathlib import Path
+from xml.parsers import expat
+
+from robot.errors import DataError
+from robot.utils import get_error_message, is_compressed
+
+
+class OutputIndex:
+    """Byte offsets of suite and test elements in an output.xml file.
+
+    Suites and tests are identified by their ids like ``s1-s2-t3``. Suite
+    offsets are ``[start, end]`` pairs. Test offsets additionally contain
+    the start and end of the test body, or ``None`` if the body cannot be
+    skipped, as ``[start, end, body_start, body_end]``.
+
+    Indices are stored next to output files with an ``.index`` suffix added
+    to the output file name. The size and the modification time of the output
+    file are stored to the index to detect is the index still valid.
+    """
+
+    version = 1
+
+    def __init__(
+        self,
+        source: "Path | str",
+        size: int,
+        mtime: int,
+        suites: "dict[str, list[int]] | None" = None,
+        tests: "dict[str, list[int | None]] | None" = None,
+    ):
+        self.source = Path(source)
+        self.size = size
+        self.mtime = mtime
+        self.suites = suites or {}
+        self.tests = tests or {}
+
+    @classmethod
+    def build(cls, source: "Path | str") -> "OutputIndex":
+        """Build an index by reading the given output.xml file."""
+        parser = expat.ParserCreate()
+        builder = IndexBuilder(parser)
+        try:
+            with open(source, "rb") as file:
+                stat = os.fstat(file.fileno())
+                parser.ParseFile(file)
+        except (OSError, expat.ExpatError):
+            raise DataError(
+                f"Creating index for output file '{source}' failed: "
+                f"{get_error_message()}"
+            )
+        return cls(
+            source, stat.st_size, stat.st_mtime_ns, builder.suites, builder.tests
+        )
+
+    @classmethod
+    def load(cls, source: "Path | str") -> "OutputIndex | None":
+        """Load the index of the given output file if it exists and is valid.
+
+        Returns ``None`` if the index does not exist, cannot be read, or has
+        been created for a different version of the output file. The latter
+        is detected based on the size and the modification time of the file.
+        """
+        try:
+            with open(cls.get_path(source), encoding="UTF-8") as file:
+                data = json.load(file)
+            stat = Path(source).stat()
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != cls.version
+            or data.get("size") != stat.st_size
+            or data.get("mtime") != stat.st_mtime_ns
+        ):
+            return None
+        return cls(
+            source,
+            stat.st_size,
+            stat.st_mtime_ns,
+            data.get("suites"),
+            data.get("tests"),
+        )
+
+    @classmethod
+    def write_for(cls, output: "Path | str | None"):
+        """Create and save an index for the given output file.
+
+        Nothing is done if there is no output or if it is a JSON or
+        a compressed output that cannot be indexed. Possible errors are
+        logged instead of raising them.
+        """
+        # Imported here to avoid a circular import with `robot.output`.
+        from robot.output import LOGGER
+
+        if not output:
+            return
+        output = Path(output)
+        if is_compressed(output) or output.suffix.lower() == ".json":
+            return
+        try:
+            cls.build(output).save()
+        except DataError as err:
+            LOGGER.error(err.message)
+
+    @classmethod
+    def get_path(cls, source: "Path | str") -> Path:
+        """Return the path where the index of the given output is stored."""
+        source = Path(source)
+        return source.with_name(source.name + ".index")
+
+    def save(self, path: "Path | str | None" = None):
+        """Save the index. By default, it is saved next to the output file."""
+        path = path or self.get_path(self.source)
+        data = {
+            "version": self.version,
+            "size": self.size,
+            "mtime": self.mtime,
+            "suites": self.suites,
+            "tests": self.tests,
+        }
+        try:
+            with open(path, "w", encoding="UTF-8") as file:
+                json.dump(data, file, separators=(",", ":"))
+        except OSError as err:
+            raise DataError(f"Writing index file '{path}' failed: {err.strerror}")
+
+    @property
+    def skipped_bodies(self) -> "list[tuple[int, int]]":
+        """Test body offsets as ``(start, end)`` pairs in the file order."""
+        return sorted(
+            (offsets[2], offsets[3])
+            for offsets in self.tests.values()
+            if offsets[2] is not None
+        )
+
+
+class IndexBuilder:
+    body_end_tags = frozenset(("doc", "tag", "tags", "timeout", "status"))
+
+    def __init__(self, parser):
+        self.parser = parser
+        self.suites = {}
+        self.tests = {}
+        self._suites = []
+        self._test = None
+        self._test_depth = 0
+        parser.StartElementHandler = self.start
+        parser.EndElementHandler = self.end
+
+    def start(self, tag, attrs):
+        offset = self.parser.CurrentByteIndex
+        test = self._test
+        if test is not None:
+            self._test_depth += 1
+            if self._test_depth == 1:
+                self._test_child(test, tag, offset)
+        elif tag == "suite":
+            self._suites.append((attrs.get("id"), offset))
+        elif tag == "test":
+            self._test = [attrs.get("id"), offset, None, None, True]
+            self._test_depth = 0
+
+    def _test_child(self, test, tag, offset):
+        body_start, body_end = test[2:4]
+        if tag in self.body_end_tags:
+            if body_start is not None and body_end is None:
+                test[3] = offset
+        elif body_end is not None:
+            # Body items after other elements cannot be skipped as one block.
+            test[4] = False
+        elif body_start is None:
+            test[2] = offset
+
+    def end(self, tag):
+        offset = self.parser.CurrentByteIndex
+        if self._test is not None:
+            if self._test_depth:
+                self._test_depth -= 1
+            else:
+                self._end_test(self._test, offset + len("</test>"))
+        elif tag == "suite":
+            suite_id, start = self._suites.pop()
+            if suite_id:
+                self.suites[suite_id] = [start, offset + len("</suite>")]
+
+    def _end_test(self, test, end):
+        test_id, start, body_start, body_end, valid = test
+        if test_id:
+            if not valid or body_end is None:
+                body_start = body_end = None
+            self.tests[test_id] = [start, end, body_start, body_end]
+        self._test = None
+
+
+class SkippingReader:
+    """File-like object reading a binary file so that given ranges are skipped.
+
+    Ranges must be given as sorted and non-overlapping ``(start, end)`` pairs.
+    """
+
+    def __init__(self, file, skipped: "list[tuple[int, int]]"):
+        self._file = file
+        self._skipped = iter(skipped)
+        self._next = next(self._skipped, None)
+        self._position = file.tell()
+
+    def read(self, size: int = -1) -> bytes:
+        while self._next and self._next[0] <= self._position:
+            self._position = self._next[1]
+            self._file.seek(self._position)
+            self._next = next(self._skipped, None)
+        if self._next and (size < 0 or self._position + size > self._next[0]):
+            size = self._next[0] - self._position
+        data = self._file.read(size)
+        self._position += len(data)
+        return data
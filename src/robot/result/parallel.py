@@ -0,0 +1,106 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Reading multiple execution results in parallel in worker processes.
+
+Workers read results, flatten and remove keywords as requested, and return
+the results as JSON compatible dictionaries. The main process recreates
+result objects from them in the original source order, so combining and
+merging results works the same way as when results are read sequentially.
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Iterator, Sequence
+
+from .executionerrors import ExecutionErrors
+from .executionresult import Result
+from .model import TestSuite
+
+
+def can_read_in_parallel(sources: Sequence[Any]) -> bool:
+    """Sources can be read in parallel if they can be passed to workers.
+
+    Paths and strings or bytes containing results directly can be passed,
+    but, for example, open file objects cannot.
+    """
+    return len(sources) > 1 and all(
+        isinstance(source, (Path, str, bytes)) for source in sources
+    )
+
+
+def read_results(
+    sources: Sequence[Any],
+    options: dict,
+    processes: int,
+    reader: Callable[..., Result],
+) -> Iterator[Result]:
+    """Read results in worker processes and yield them in the original order.
+
+    ``reader`` is used in workers to read individual results and it gets
+    a source and ``options`` as arguments. It must be a module level function.
+    """
+    # Imported here because these modules are needed only with processes.
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import get_context
+
+    pool = ProcessPoolExecutor(
+        max_workers=min(processes, len(sources)),
+        mp_context=get_context("spawn"),
+        initializer=init_worker,
+        initargs=(sys.path,),
+    )
+    futures = [pool.submit(read_result, reader, s, options) for s in sources]
+    try:
+        for future in futures:
+            yield result_from_dict(future.result())
+    finally:
+        for future in futures:
+            future.cancel()
+        pool.shutdown()
+
+
+def init_worker(sys_path: "list[str]"):
+    sys.path[:] = sys_path
+    # The syslog is written only by the main process.
+    os.environ["ROBOT_SYSLOG_FILE"] = "NONE"
+
+
+def read_result(reader: Callable[..., Result], source: Any, options: dict) -> dict:
+    """Reads a result in a worker process and returns it as a dictionary."""
+    return result_to_dict(reader(source, options))
+
+
+def result_to_dict(result: Result) -> dict:
+    return {
+        "source": result.source,
+        "rpa": result.rpa,
+        "generator": result.generator,
+        "generated": result.generation_time,
+        "suite": result.suite.to_dict(),
+        "errors": result.errors.messages.to_dicts(),
+    }
+
+
+def result_from_dict(data: dict) -> Result:
+    return Result(
+        source=data["source"],
+        suite=TestSuite.from_dict(data["suite"]),
+        errors=ExecutionErrors(data["errors"]),
+        rpa=data["rpa"],
+        generator=data["generator"],
+        generation_time=data["generated"],
+    )
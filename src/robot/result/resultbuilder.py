@@ -13,6 +13,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from functools import partial
+from io import BytesIO
+from pathlib import Path
 from typing import Sequence
 from xml.etree import ElementTree as ET
 
@@ -24,7 +27,10 @@ from .flattenkeywordmatcher import (
     create_flatten_message, FlattenByNameMatcher, FlattenByTags, FlattenByTypeMatcher
 )
 from .merger import Merger
-from .xmlelementhandlers import XmlElementHandler
+from .model import TestCase, TestSuite
+from .outputindex import OutputIndex, SkippingReader
+from .parallel import can_read_in_parallel, read_results
+from .xmlelementhandlers import TestRootHandler, XmlElementHandler
 
 
 def ExecutionResult(
@@ -33,6 +39,8 @@ def ExecutionResult(
     include_keywords: bool = True,
     flattened_keywords: Sequence[str] = (),
     rpa: "bool | None" = None,
+    processes: int = 1,
+    lazy: bool = False,
 ):
     """Factory method to constructs :class:`~.executionresult.Result` objects.
 
@@ -49,6 +57,20 @@ def ExecutionResult(
     :param rpa: Setting ``rpa`` either to ``True`` (RPA mode) or ``False`` (test
         automation) sets the execution mode explicitly. By default, the mode is got
         from processed output files and conflicting modes cause an error.
+    :param processes: When greater than one and multiple sources are given,
+        sources are read in parallel using that many worker processes.
+        Keywords are flattened and removed in workers and results are combined
+        or merged in the original order. Sources must be given as paths or as
+        strings or bytes in this case, not as open file objects. New in
+        Robot Framework 7.5.
+    :param lazy: When ``True``, test bodies, setups and teardowns in XML
+        output files given as paths are read only when they are accessed.
+        Reading uses a sidecar index file created with the ``--index`` option
+        or by using :class:`~.outputindex.OutputIndex`. If the index does not
+        exist or is outdated, it is created in memory, but it is not saved.
+        This can save considerable amount of time and memory when only some
+        of the tests in a huge output file are inspected in detail. New in
+        Robot Framework 7.5.
     :returns: :class:`~.executionresult.Result` instance.
 
     A source is considered to be JSON in these cases:
@@ -65,25 +87,32 @@ def ExecutionResult(
         "include_keywords": include_keywords,
         "flattened_keywords": flattened_keywords,
         "rpa": rpa,
+        "lazy": lazy,
     }
     if merge:
-        return _merge_results(sources[0], sources[1:], options)
+        return _merge_results(sources, options, processes)
     if len(sources) > 1:
-        return _combine_results(sources, options)
+        return _combine_results(sources, options, processes)
     return _single_result(sources[0], options)
 
 
-def _merge_results(original, merged, options):
-    result = ExecutionResult(original, **options)
+def _merge_results(sources, options, processes):
+    results = _read_results(sources, options, processes)
+    result = next(results)
     merger = Merger(result, rpa=result.rpa)
-    for source in merged:
-        merged = ExecutionResult(source, **options)
+    for merged in results:
         merger.merge(merged)
     return result
 
 
-def _combine_results(sources, options):
-    return CombinedResult(ExecutionResult(src, **options) for src in sources)
+def _combine_results(sources, options, processes):
+    return CombinedResult(_read_results(sources, options, processes))
+
+
+def _read_results(sources, options, processes):
+    if processes > 1 and can_read_in_parallel(sources):
+        return read_results(sources, options, processes, _single_result)
+    return (_single_result(source, options) for source in sources)
 
 
 def _single_result(source, options):
@@ -92,7 +121,7 @@ def _single_result(source, options):
     return _xml_result(source, **options)
 
 
-def _json_result(source, include_keywords, flattened_keywords, rpa):
+def _json_result(source, include_keywords, flattened_keywords, rpa, lazy):
     try:
         return Result.from_json(source, include_keywords, flattened_keywords, rpa)
     except IOError as err:
@@ -102,9 +131,9 @@ def _json_result(source, include_keywords, flattened_keywords, rpa):
     raise DataError(f"Reading JSON source '{source}' failed: {error}")
 
 
-def _xml_result(source, include_keywords, flattened_keywords, rpa):
+def _xml_result(source, include_keywords, flattened_keywords, rpa, lazy):
     ets = ETSource(source)
-    builder = ExecutionResultBuilder(ets, include_keywords, flattened_keywords)
+    builder = ExecutionResultBuilder(ets, include_keywords, flattened_keywords, lazy)
     result = Result(source, rpa=rpa)
     try:
         return builder.build(result)
@@ -125,7 +154,13 @@ class ExecutionResultBuilder:
     :func:`ExecutionResult` factory method.
     """
 
-    def __init__(self, source, include_keywords=True, flattened_keywords=()):
+    def __init__(
+        self,
+        source,
+        include_keywords=True,
+        flattened_keywords=(),
+        lazy=False,
+    ):
         """
         :param source: Path to the XML output file to build
             :class:`~.executionresult.Result` objects from.
@@ -135,16 +170,26 @@ class ExecutionResultBuilder:
         :param flattened_keywords: List of patterns controlling what keywords
             and control structures to flatten. See the documentation of
             the ``--flattenkeywords`` option for more details.
+        :param lazy: When ``True`` and the source is a path, test bodies are
+            read only when they are accessed. See :func:`ExecutionResult`
+            for more details. New in Robot Framework 7.5.
         """
         self._source = source if isinstance(source, ETSource) else ETSource(source)
         self._include_keywords = include_keywords
         self._flattened_keywords = flattened_keywords
+        self._lazy = lazy
 
     def build(self, result):
         # Parsing is performance optimized. Do not change without profiling!
         handler = XmlElementHandler(result)
         with self._source as source:
-            self._parse(source, handler.start, handler.end)
+            index = self._get_index(source)
+            if index:
+                with open(source, "rb") as file:
+                    reader = SkippingReader(file, index.skipped_bodies)
+                    self._parse(reader, handler.start, handler.end)
+            else:
+                self._parse(source, handler.start, handler.end)
         result.handle_suite_teardown_failures()
         if self._flattened_keywords:
             # Tags are nowadays written after keyword content, so we cannot
@@ -152,8 +197,45 @@ class ExecutionResultBuilder:
             result.suite.visit(FlattenByTags(self._flattened_keywords))
         if not self._include_keywords:
             result.suite.visit(KeywordRemover())
+        if index:
+            self._add_lazy_loaders(result.suite, index)
         return result
 
+    def _get_index(self, source):
+        if not (self._lazy and self._include_keywords):
+            return None
+        if not isinstance(source, (Path, str)):
+            return None
+        # Possibly missing or outdated index is not saved, because reading
+        # results should not create files.
+        return OutputIndex.load(source) or OutputIndex.build(source)
+
+    def _add_lazy_loaders(self, suite, index):
+        for test in suite.all_tests:
+            offsets = index.tests.get(test.id)
+            if offsets and offsets[2] is not None:
+                start, end = offsets[:2]
+                test._lazy_loader = partial(self._load_test, index.source, start, end)
+
+    def _load_test(self, path, start, end) -> TestCase:
+        try:
+            with open(path, "rb") as file:
+                file.seek(start)
+                source = BytesIO(file.read(end - start))
+            suite = TestSuite()
+            handler = XmlElementHandler(suite, TestRootHandler())
+            self._parse(source, handler.start, handler.end)
+            test = suite.tests[0]
+        except IOError as err:
+            error = err.strerror
+        except Exception:
+            error = get_error_message()
+        else:
+            if self._flattened_keywords:
+                test.visit(FlattenByTags(self._flattened_keywords))
+            return test
+        raise DataError(f"Reading test lazily from '{path}' failed: {error}")
+
     def _parse(self, source, start, end):
         context = ET.iterparse(source, events=("start", "end"))
         if not self._include_keywords:
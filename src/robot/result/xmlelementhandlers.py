@@ -87,6 +87,12 @@ class RootHandler(ElementHandler):
             raise DataError(f"Incompatible root element '{tag}'.")
 
 
+class TestRootHandler(RootHandler):
+    """Root handler for parsing individual tests when results are read lazily."""
+
+    children = frozenset(("test",))
+
+
 @ElementHandler.register
 class RobotHandler(ElementHandler):
     tag = "robot"
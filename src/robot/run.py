@@ -38,13 +38,8 @@ if __name__ == "__main__" and "robot" not in sys.modules:
 
     set_pythonpath()
 
-from robot.conf import RobotSettings
 from robot.errors import DataError
-from robot.model import ModelModifier
-from robot.output import librarylogger, LOGGER, pyloggingconf
-from robot.reporting import ResultWriter
-from robot.running.builder import TestSuiteBuilder
-from robot.utils import Application, text
+from robot.utils import Application
 
 USAGE = """Robot Framework -- A generic automation framework
 
@@ -53,6 +48,7 @@ Version:  <VERSION>
 Usage:  robot [options] paths
    or:  python -m robot [options] paths
    or:  python path/to/robot [options] paths
+   or:  robot --worker host:port [options]
 
 Robot Framework is a generic open source automation framework for acceptance
 testing, acceptance test-driven development (ATDD) and robotic process
@@ -181,6 +177,20 @@ Options
                           Default: output.xml
     --legacyoutput        Create XML output file in format compatible with
                           Robot Framework 6.x and earlier.
+    --index               Create a sidecar index file containing byte offsets
+                          of suites and tests in the XML output file. Results
+                          can be read lazily using the index when processing
+                          huge outputs programmatically.
+    --compressionlevel level  Compression level between 0 and 9 to use when
+                          the output file has a `.gz` or `.xz` suffix and is
+                          thus compressed. Higher levels create smaller files
+                          but are slower. Default: 1
+    --lowmemory           Remove results of keywords, control structures and
+                          loop iterations from memory immediately after they
+                          have been written to the output file. Reduces memory
+                          usage with long running tests and tasks, but results
+                          of already executed child items are not available
+                          for listeners anymore.
  -l --log file            HTML log file. Can be disabled by giving a special
                           value `NONE`. Default: log.html
                           Examples: `--log mylog.html`, `-l NONE`
@@ -315,6 +325,52 @@ Options
                           The seed must be an integer.
                           Examples: --randomize all
                                     --randomize tests:1234
+    --shard index/total   Run only tests belonging to the given shard. Shards
+                          are balanced using test durations got from the file
+                          specified with `--shardtimings` so that all shards
+                          take about the same time. Suites are kept in the same
+                          shard when possible. Running all shards with the same
+                          data and timings runs each test exactly once.
+                          Example: --shard 3/8
+    --shardtimings path   JSON file containing historical test durations used
+                          for balancing shards. Tests not found from the file
+                          get the average duration. The file can be created
+                          and updated from output files using Rebot with
+                          its `--shardtimings` option.
+                          Example: --shard 2/4 --shardtimings timings.json
+    --processes num       Run child suites of the top level suite, or its
+                          tests if there are no child suites, in `num`
+                          parallel worker processes. The top level suite setup
+                          and teardown are run in the main process and
+                          variables set by the setup are sent to the workers.
+                          Results are combined into one output, log and
+                          report. Listeners are run in the worker processes.
+                          Also suite files are parsed in parallel using the
+                          same number of processes. The default is 1, meaning
+                          that all tests are run in the main process.
+                          Example: --processes 8
+    --coordinator [host:]port  Serve child suites of the top level suite, or
+                          its tests if there are no child suites, to remote
+                          workers connecting to the given address instead of
+                          running them in the main process. Workers are
+                          started with `--worker`. Results are combined into
+                          one output, log and report similarly as with
+                          `--processes`.
+                          The default host is `localhost`. Use e.g. `0.0.0.0`
+                          to accept workers from other machines.
+                          Example: --coordinator 0.0.0.0:8271
+    --coordinatortimeout time  Fail tests that have not been run if no workers
+                          are connected to the coordinator during the given
+                          time. Given in Robot Framework time format. The
+                          default is 10 minutes. Use 0 to wait forever.
+                          Example: --coordinatortimeout 1h
+    --worker host:port    Run as a worker that pulls suites or tests from
+                          the coordinator at the given address and runs them.
+                          No data sources are given in this mode and execution
+                          options are got from the coordinator. Test data and
+                          libraries must be available using the same paths as
+                          on the coordinator machine.
+                          Example: --worker build-server:8271
     --listener listener *  Class or module for monitoring test execution.
                           Gets notifications e.g. when tests start and end.
                           Arguments to the listener class can be given after
@@ -329,6 +385,14 @@ Options
                           arguments the same way as with --listener.
     --parser parser *     Custom parser class or module. Parser classes accept
                           arguments the same way as with --listener.
+    --parsecache dir      Directory where to cache parsed suite and resource
+                          files. Files that have not changed are not parsed
+                          again when the same directory is used later. Files
+                          handled by custom parsers are not cached.
+    --librarycache dir    Directory where to cache keyword names, arguments,
+                          types and documentation of imported libraries.
+                          Keywords are created based on cached data if
+                          libraries have not changed.
     --console console     How to report execution on the console.
                           Built-in consoles:
                           verbose: report every suite and test (default)
@@ -448,14 +512,25 @@ $ robot tests.robot
 class RobotFramework(Application):
 
     def __init__(self):
+        from robot.output import LOGGER
+
         super().__init__(
             USAGE,
-            arg_limits=(1,),
+            arg_limits=None,
             env_options="ROBOT_OPTIONS",
             logger=LOGGER,
         )
 
     def main(self, datasources, **options):
+        # Heavy modules are imported only when needed to keep importing
+        # the `robot` package and running `robot --version` fast.
+        from robot.conf import RobotSettings
+        from robot.model import ModelModifier
+        from robot.output import librarylogger, LOGGER, pyloggingconf
+        from robot.reporting import ResultWriter
+        from robot.running.builder import TestSuiteBuilder
+        from robot.utils import text
+
         try:
             settings = RobotSettings(options)
         except DataError:
@@ -468,6 +543,10 @@ class RobotFramework(Application):
             sys.path = settings.pythonpath + sys.path
         LOGGER.register_console_logger(**settings.console_output_config)
         LOGGER.info(f"Settings:\n{settings}")
+        if settings.worker:
+            from robot.running.distributed import run_worker
+
+            return run_worker(settings.worker)
         builder = TestSuiteBuilder(
             included_extensions=settings.extension,
             included_files=settings.parse_include,
@@ -475,6 +554,8 @@ class RobotFramework(Application):
             rpa=settings.rpa,
             lang=settings.languages,
             allow_empty_suite=settings.run_empty_suite,
+            parse_cache=settings.parse_cache,
+            processes=settings.processes,
         )
         suite = builder.build(*datasources)
         if settings.pre_run_modifiers:
@@ -507,6 +588,8 @@ class RobotFramework(Application):
         return result.return_code
 
     def validate(self, options, arguments):
+        if not arguments and not options.get("worker"):
+            raise DataError("Expected at least 1 argument, got 0.")
         return self._filter_options_without_value(options), arguments
 
     def _filter_options_without_value(self, options):
@@ -17,7 +17,8 @@ from typing import TYPE_CHECKING
 
 from robot.variables import contains_variable
 
-from .typeconverters import UnknownConverter
+from ..context import EXECUTION_CONTEXTS
+from .typeconverters import TypeConverter, UnknownConverter
 from .typeinfo import TypeInfo
 
 if TYPE_CHECKING:
@@ -28,6 +29,13 @@ if TYPE_CHECKING:
 
 
 class ArgumentConverter:
+    """Converts arguments based on type hints and default values.
+
+    Converters used with each argument are resolved when the argument is
+    converted first time. Converter instances are cached by
+    :class:`~robot.running.arguments.argumentspec.ArgumentSpec` and reused
+    as long as the spec and the conversion configuration do not change.
+    """
 
     def __init__(
         self,
@@ -40,6 +48,48 @@ class ArgumentConverter:
         self.custom_converters = custom_converters
         self.dry_run = dry_run
         self.languages = languages
+        self._spec_state = self._get_spec_state(arg_spec)
+        self._context_languages = self._get_context_languages()
+        self._named = set(arg_spec.positional) | set(arg_spec.named_only)
+        self._plans: "dict[str, ConversionPlan]" = {}
+
+    def _get_context_languages(self):
+        # Converters use languages of the current execution context by default.
+        ctx = EXECUTION_CONTEXTS.current
+        return ctx.languages if ctx else None
+
+    def _get_spec_state(self, spec: "ArgumentSpec") -> tuple:
+        return (
+            spec.positional_only,
+            spec.positional_or_named,
+            spec.var_positional,
+            spec.named_only,
+            spec.var_named,
+            spec.defaults,
+            spec.types,
+        )
+
+    def is_valid_for(
+        self,
+        arg_spec: "ArgumentSpec",
+        custom_converters: "CustomArgumentConverters",
+        dry_run: bool = False,
+        languages: "LanguagesLike" = None,
+    ) -> bool:
+        """Tells can this converter be used with the given configuration.
+
+        Spec attributes and configuration are compared by identity.
+        """
+        if (
+            self.spec is not arg_spec
+            or self.custom_converters is not custom_converters
+            or self.dry_run != dry_run
+            or self.languages is not languages
+            or self._context_languages is not self._get_context_languages()
+        ):
+            return False
+        state = self._get_spec_state(arg_spec)
+        return all(a is b for a, b in zip(state, self._spec_state))
 
     def convert(self, positional, named):
         return self._convert_positional(positional), self._convert_named(named)
@@ -55,7 +105,7 @@ class ArgumentConverter:
         return converted
 
     def _convert_named(self, named):
-        names = set(self.spec.positional) | set(self.spec.named_only)
+        names = self._named
         var_named = self.spec.var_named
         return [
             (name, self._convert(name if name in names else var_named, value))
@@ -63,57 +113,113 @@ class ArgumentConverter:
         ]
 
     def _convert(self, name, value):
-        spec = self.spec
         if (
-            spec.types is None
+            self.spec.types is None
             or self.dry_run
             and contains_variable(value, identifiers="$@&%")
         ):
             return value
-        conversion_error = None
+        if name in self._plans:
+            plan = self._plans[name]
+        else:
+            plan = self._plans[name] = ConversionPlan(
+                name, self.spec, self.custom_converters, self.languages
+            )
+        return plan.convert(value)
+
+
+class ConversionPlan:
+    """Converters to use with a certain argument.
+
+    Resolving converters based on type information is relatively expensive,
+    so it is done only once per argument. Converters themselves return values
+    that already have the correct type as-is.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        spec: "ArgumentSpec",
+        custom_converters: "CustomArgumentConverters",
+        languages: "LanguagesLike" = None,
+    ):
+        self.name = name
         # Don't convert None if argument has None as a default value.
         # Python < 3.11 adds None to type hints automatically when using None as
         # a default value which preserves None automatically. This code keeps
         # the same behavior also with newer Python versions. We can consider
         # changing this once Python 3.11 is our minimum supported version.
-        if value is None and name in spec.defaults and spec.defaults[name] is None:
-            return value
+        self.default_is_none = name in spec.defaults and spec.defaults[name] is None
+        self.converter = self._get_type_hint_converter(
+            spec, custom_converters, languages
+        )
+        self.default_converter = self._get_default_converter(spec, languages)
+
+    def _get_type_hint_converter(
+        self,
+        spec: "ArgumentSpec",
+        custom_converters: "CustomArgumentConverters",
+        languages: "LanguagesLike",
+    ) -> "TypeConverter | None":
         # Primarily convert arguments based on type hints.
-        if name in spec.types:
-            info: TypeInfo = spec.types[name]
-            converter = info.get_converter(
-                self.custom_converters,
-                self.languages,
-                allow_unknown=True,
-            )
-            # If type is unknown, don't attempt conversion. It would succeed, but
-            # we want to, for now, attempt conversion based on the default value.
-            if not isinstance(converter, UnknownConverter):
-                try:
-                    return converter.convert(value, name)
-                except ValueError as err:
-                    conversion_error = err
+        if self.name not in spec.types:
+            return None
+        info: TypeInfo = spec.types[self.name]
+        converter = info.get_converter(
+            custom_converters,
+            languages,
+            allow_unknown=True,
+        )
+        # If type is unknown, don't attempt conversion. It would succeed, but
+        # we want to, for now, attempt conversion based on the default value.
+        if isinstance(converter, UnknownConverter):
+            return None
+        return converter
+
+    def _get_default_converter(
+        self,
+        spec: "ArgumentSpec",
+        languages: "LanguagesLike",
+    ) -> "TypeConverter | None":
         # Try conversion also based on the default value type. We probably should
         # do this only if there is no explicit type hint, but Python < 3.11
         # handling `arg: type = None` differently than newer versions would mean
         # that conversion behavior depends on the Python version. Once Python 3.11
         # is our minimum supported version, we can consider reopening
         # https://github.com/robotframework/robotframework/issues/4881
-        if name in spec.defaults:
-            typ = type(spec.defaults[name])
-            if typ is str:
-                # Don't convert arguments to strings.
-                info = TypeInfo()
-            elif typ is int:
-                # Try also conversion to float.
-                info = TypeInfo.from_sequence([int, float])
-            elif typ is type(None) and isinstance(value, str) and value == "":
-                # Don't convert empty string to None.
-                info = TypeInfo()
-            else:
-                info = TypeInfo.from_type(typ)
+        if self.name not in spec.defaults:
+            return None
+        typ = type(spec.defaults[self.name])
+        if typ is str:
+            # Don't convert arguments to strings.
+            return None
+        if typ is int:
+            # Try also conversion to float.
+            info = TypeInfo.from_sequence([int, float])
+        else:
+            info = TypeInfo.from_type(typ)
+        try:
+            return info.get_converter(languages=languages)
+        except (ValueError, TypeError):
+            return None
+
+    def convert(self, value):
+        if value is None and self.default_is_none:
+            return value
+        conversion_error = None
+        if self.converter is not None:
+            try:
+                return self.converter.convert(value, self.name)
+            except ValueError as err:
+                conversion_error = err
+        if self.default_converter is not None and not (
+            # Don't convert empty string to None.
+            self.default_converter.type_info.type is type(None)
+            and isinstance(value, str)
+            and value == ""
+        ):
             try:
-                return info.convert(value, name, languages=self.languages)
+                return self.default_converter.convert(value, self.name)
             except (ValueError, TypeError):
                 pass
         if conversion_error:
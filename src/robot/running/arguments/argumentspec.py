@@ -37,6 +37,7 @@ class ArgumentSpec(metaclass=SetterAwareType):
         "var_named",
         "embedded",
         "defaults",
+        "_converter",
     )
 
     def __init__(
@@ -64,6 +65,7 @@ class ArgumentSpec(metaclass=SetterAwareType):
         self.defaults = defaults or {}
         self.types = types
         self.return_type = return_type
+        self._converter = None
 
     @property
     def name(self) -> "str | None":
@@ -148,10 +150,21 @@ class ArgumentSpec(metaclass=SetterAwareType):
         languages=None,
     ) -> "tuple[list, list]":
         if self.types or self.defaults:
-            converter = ArgumentConverter(self, converters, dry_run, languages)
+            converter = self._get_converter(converters, dry_run, languages)
             positional, named = converter.convert(positional, named)
         return positional, named
 
+    def _get_converter(self, converters, dry_run, languages) -> ArgumentConverter:
+        # Converters are cached because resolving what converters to use with
+        # each argument is expensive and same keywords are often run repeatedly.
+        converter = self._converter
+        if not converter or not converter.is_valid_for(
+            self, converters, dry_run, languages
+        ):
+            converter = ArgumentConverter(self, converters, dry_run, languages)
+            self._converter = converter
+        return converter
+
     def map(
         self,
         positional,
@@ -29,6 +29,10 @@ from robot.utils import Importer, seq2str, split_args_from_name_or_path, type_na
 
 from ..model import TestSuite
 from ..resourcemodel import ResourceFile
+from .parallel import (
+    count_suite_files, create_pool, ParallelParser, ParsedFile, shutdown_pool
+)
+from .parsecache import CachingParser, ParseCache
 from .parsers import (
     CustomParser, JsonParser, MarkdownParser, NoInitFileDirectoryParser, Parser,
     RestParser, RobotParser
@@ -76,6 +80,8 @@ class TestSuiteBuilder:
         lang: LanguagesLike = None,
         allow_empty_suite: bool = False,
         process_curdir: bool = True,
+        parse_cache: "Path | str | None" = None,
+        processes: int = 1,
     ):
         """
         :param included_suites:
@@ -111,14 +117,25 @@ class TestSuiteBuilder:
             Control processing the special ``${CURDIR}`` variable. It is
             resolved already at parsing time by default, but that can be
             changed by giving this argument ``False`` value.
+        :param parse_cache:
+            Directory where to cache parsed suite files. Files that have not
+            changed are not parsed again if the same directory is used later.
+            Same as ``--parsecache``. New in RF 7.5.
+        :param processes:
+            Number of processes to use for parsing suite files. Files are
+            parsed in parallel only if the value is bigger than one. The built
+            suite is the same regardless the value. New in RF 7.5.
         """
-        self.standard_parsers = self._get_standard_parsers(lang, process_curdir)
+        self.standard_parsers = self._get_standard_parsers(
+            lang, process_curdir, parse_cache
+        )
         self.custom_parsers = self._get_custom_parsers(custom_parsers)
         self.defaults = defaults
         self.included_extensions = tuple(included_extensions or ())
         self.included_files = tuple(included_files or ())
         self.rpa = rpa
         self.allow_empty_suite = allow_empty_suite
+        self.processes = processes
         # TODO: Remove in RF 8.0.
         if included_suites != "DEPRECATED":
             warnings.warn(
@@ -131,11 +148,17 @@ class TestSuiteBuilder:
         self,
         lang: LanguagesLike,
         process_curdir: bool,
+        parse_cache: "Path | str | None" = None,
     ) -> "dict[str, Parser]":
         robot_parser = RobotParser(lang, process_curdir)
         rest_parser = RestParser(lang, process_curdir)
         json_parser = JsonParser()
         markdown_parser = MarkdownParser(lang, process_curdir)
+        if parse_cache:
+            cache = ParseCache(parse_cache)
+            robot_parser = CachingParser(robot_parser, cache)
+            rest_parser = CachingParser(rest_parser, cache)
+            markdown_parser = CachingParser(markdown_parser, cache)
         return {
             "robot": robot_parser,
             "rst": rest_parser,
@@ -177,6 +200,7 @@ class TestSuiteBuilder:
             self._get_parsers(paths),
             self.defaults,
             self.rpa,
+            self.processes,
         ).parse(structure)
         if not self.allow_empty_suite:
             self._validate_not_empty(suite, multi_source=len(paths) > 1)
@@ -232,19 +256,32 @@ class SuiteStructureParser(SuiteStructureVisitor):
         parsers: "dict[str | None, Parser]",
         defaults: "TestDefaults | None" = None,
         rpa: "bool | None" = None,
+        processes: int = 1,
     ):
         self.parsers = parsers
         self.rpa = rpa
         self.defaults = defaults
+        self.processes = processes
         self.suite: TestSuite | None = None
         self._stack: list[tuple[TestSuite, TestDefaults]] = []
+        self._parsed: "dict[int, ParsedFile]" = {}
 
     @property
     def parent_defaults(self) -> "TestDefaults | None":
         return self._stack[-1][-1] if self._stack else self.defaults
 
     def parse(self, structure: SuiteStructure) -> TestSuite:
-        structure.visit(self)
+        if self.processes > 1 and count_suite_files(structure) > 1:
+            pool = create_pool(self.processes)
+            try:
+                parser = ParallelParser(self.parsers, self.defaults, pool)
+                self._parsed = parser.parse(structure)
+                structure.visit(self)
+            finally:
+                shutdown_pool(pool, self._parsed)
+                self._parsed = {}
+        else:
+            structure.visit(self)
         return cast(TestSuite, self.suite)
 
     def visit_file(self, structure: SuiteFile):
@@ -281,8 +318,11 @@ class SuiteStructureParser(SuiteStructureVisitor):
         source = cast(Path, structure.source)
         defaults = self.parent_defaults or TestDefaults()
         parser = self.parsers[structure.extension]
+        parsed = self._parsed.pop(id(structure), None)
         try:
-            suite = parser.parse_suite_file(source, defaults)
+            suite = parsed.get_suite(parser, defaults) if parsed else None
+            if suite is None:
+                suite = parser.parse_suite_file(source, defaults)
             if not suite.tests:
                 LOGGER.info(f"Data source '{source}' has no tests or tasks.")
         except DataError as err:
@@ -304,9 +344,17 @@ class SuiteStructureParser(SuiteStructureVisitor):
 
 class ResourceFileBuilder:
 
-    def __init__(self, lang: LanguagesLike = None, process_curdir: bool = True):
+    def __init__(
+        self,
+        lang: LanguagesLike = None,
+        process_curdir: bool = True,
+        parse_cache: "ParseCache | Path | str | None" = None,
+    ):
         self.lang = lang
         self.process_curdir = process_curdir
+        if parse_cache and not isinstance(parse_cache, ParseCache):
+            parse_cache = ParseCache(parse_cache)
+        self.parse_cache = parse_cache
 
     def build(self, source: Path) -> ResourceFile:
         if not isinstance(source, Path):
@@ -322,12 +370,14 @@ class ResourceFileBuilder:
 
     def _parse(self, source: Path) -> ResourceFile:
         suffix = source.suffix.lower()
+        if suffix in (".json", ".rsrc"):
+            return JsonParser().parse_resource_file(source)
         if suffix in (".rst", ".rest"):
             parser = RestParser(self.lang, self.process_curdir)
-        elif suffix in (".json", ".rsrc"):
-            parser = JsonParser()
         elif suffix in (".md", ".markdown"):
             parser = MarkdownParser(self.lang, self.process_curdir)
         else:
             parser = RobotParser(self.lang, self.process_curdir)
+        if self.parse_cache:
+            parser = CachingParser(parser, self.parse_cache)
         return parser.parse_resource_file(source)
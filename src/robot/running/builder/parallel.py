@@ -0,0 +1,244 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Parsing suite files in parallel in worker processes.
+
+Initialization files are parsed in the main process to get test defaults
+that are passed to workers parsing suite files. Workers return serialized
+suite models and messages logged during parsing. When suite files are
+later visited in their normal order, messages are written to loggers
+and models recreated, and results are thus the same as when parsing
+files sequentially.
+"""
+
+import copy
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from robot.conf import Languages
+from robot.errors import DataError
+from robot.output import LOGGER
+from robot.parsing import (
+    SuiteDirectory, SuiteFile, SuiteStructure, SuiteStructureVisitor
+)
+from robot.utils import FileReader
+
+from ..model import TestSuite
+from .parsecache import CachingParser
+from .parsers import CustomParser, Parser
+from .settings import TestDefaults
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+
+class ParsedFile:
+    """Suite file parsed, or being parsed, in a worker process."""
+
+    def __init__(
+        self,
+        future: "Future",
+        defaults: TestDefaults,
+        languages: "Languages | None",
+    ):
+        self.future = future
+        self.defaults = get_defaults_config(defaults)
+        self.languages = tuple(languages or ())
+
+    def get_suite(self, parser: Parser, defaults: TestDefaults) -> "TestSuite | None":
+        """Return the parsed suite or ``None`` if it must be parsed again.
+
+        Files must be parsed again in the main process if the worker failed
+        unexpectedly, if defaults or active languages are not the same that
+        were used by the worker, or if the file declares custom languages
+        that cannot be added to the shared language configuration based on
+        their codes.
+
+        If parsing failed, raises the original error.
+        """
+        if self.future.cancelled() or self.future.exception():
+            return None
+        data, messages, error, added_languages = self.future.result()
+        languages = get_languages(parser)
+        if (
+            added_languages is None
+            or get_defaults_config(defaults) != self.defaults
+            or tuple(languages or ()) != self.languages
+        ):
+            return None
+        for lang in added_languages:
+            languages.add_language(lang)
+        for message, level, html in messages:
+            LOGGER.write(message, level, html)
+        if error:
+            raise DataError(error)
+        return TestSuite.from_dict(data)
+
+
+class ParallelParser(SuiteStructureVisitor):
+    """Sends suite files in a suite structure to workers to be parsed.
+
+    Uses copies of the given parsers for parsing initialization files so
+    that possible side effects, such as adding languages, do not affect
+    the actual parsing. Files handled by custom parsers and files in
+    directories with initialization files that cannot be parsed are
+    skipped and need to be parsed normally.
+    """
+
+    def __init__(
+        self,
+        parsers: "dict[str | None, Parser]",
+        defaults: "TestDefaults | None",
+        pool: "ProcessPoolExecutor",
+    ):
+        self.parsers = copy.deepcopy(
+            {ext: p for ext, p in parsers.items() if not isinstance(p, CustomParser)}
+        )
+        self.defaults = defaults
+        self.pool = pool
+        self.parsed: "dict[int, ParsedFile]" = {}
+        self._stack: "list[TestDefaults | None]" = []
+
+    def parse(self, structure: SuiteStructure) -> "dict[int, ParsedFile]":
+        structure.visit(self)
+        return self.parsed
+
+    @property
+    def parent_defaults(self) -> "TestDefaults | None":
+        return self._stack[-1] if self._stack else self.defaults
+
+    def start_directory(self, structure: SuiteDirectory):
+        parent = self.parent_defaults
+        parser = self.parsers.get(structure.extension)
+        if parser and (parent or not self._stack):
+            defaults = TestDefaults(parent)
+            source = structure.init_file or structure.source
+            with LOGGER.record_messages(delay=True):
+                try:
+                    parser.parse_init_file(source, defaults)
+                except Exception:
+                    defaults = None
+        else:
+            defaults = None
+        self._stack.append(defaults)
+
+    def end_directory(self, structure: SuiteDirectory):
+        self._stack.pop()
+
+    def visit_file(self, structure: SuiteFile):
+        if self._stack and not self.parent_defaults:
+            return
+        parser = self.parsers.get(structure.extension)
+        if not parser:
+            return
+        defaults = self.parent_defaults or TestDefaults()
+        try:
+            # Pickle data already here to use the current language configuration.
+            data = pickle.dumps((parser, structure.source, defaults))
+        except Exception:
+            return
+        future = self.pool.submit(parse_suite_file, data)
+        languages = get_languages(parser)
+        self.parsed[id(structure)] = ParsedFile(future, defaults, languages)
+        if languages:
+            self._add_declared_languages(structure.source, languages)
+
+    def _add_declared_languages(self, source: Path, languages: Languages):
+        # Languages declared by files are added to the shared configuration
+        # and affect subsequently parsed files. Possible mismatches caused by
+        # this simple approach are detected later and files parsed again.
+        try:
+            with FileReader(source) as reader:
+                for line in reader.readlines():
+                    if line.startswith("*"):
+                        break
+                    config, _, value = line.partition(":")
+                    if config.strip().lower() == "language":
+                        languages.add_language(value.strip())
+        except Exception:
+            pass
+
+
+def count_suite_files(structure: SuiteStructure) -> int:
+    if isinstance(structure, SuiteFile):
+        return 1
+    return sum(count_suite_files(child) for child in structure.children)
+
+
+def create_pool(processes: int) -> "ProcessPoolExecutor":
+    # Imported here because these modules are needed only with processes.
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import get_context
+
+    return ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=get_context("spawn"),
+        initializer=init_worker,
+        initargs=(sys.path,),
+    )
+
+
+def shutdown_pool(pool: "ProcessPoolExecutor", parsed: "dict[int, ParsedFile]"):
+    for file in parsed.values():
+        file.future.cancel()
+    pool.shutdown()
+
+
+def init_worker(sys_path: "list[str]"):
+    sys.path[:] = sys_path
+    # The syslog is written only by the main process.
+    os.environ["ROBOT_SYSLOG_FILE"] = "NONE"
+
+
+def parse_suite_file(data: bytes):
+    """Parses a suite file in a worker process.
+
+    Returns the suite as a dictionary, messages logged during parsing,
+    a possible error message, and codes of languages the file added to
+    the language configuration. If the file added custom languages that
+    cannot be recreated based on their codes, ``None`` is returned instead
+    of language codes.
+    """
+    parser, source, defaults = pickle.loads(data)
+    languages = get_languages(parser)
+    original = list(languages or ())
+    with LOGGER.record_messages(delay=True) as messages:
+        try:
+            suite = parser.parse_suite_file(source, defaults)
+        except DataError as err:
+            suite, error = None, err.message
+        else:
+            error = None
+    messages = [(m.message, m.level, m.html) for m in messages]
+    added = [lang for lang in languages or () if lang not in original]
+    if all(type(lang).__module__ == Languages.__module__ for lang in added):
+        added = [lang.code for lang in added]
+    else:
+        added = None
+    return suite.to_dict() if suite else None, messages, error, added
+
+
+def get_languages(parser: Parser) -> "Languages | None":
+    if isinstance(parser, CachingParser):
+        parser = parser.parser
+    languages = getattr(parser, "lang", None)
+    return languages if isinstance(languages, Languages) else None
+
+
+def get_defaults_config(defaults: TestDefaults) -> tuple:
+    return defaults.setup, defaults.teardown, defaults.tags, defaults.timeout
@@ -0,0 +1,217 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from robot.conf import Languages
+from robot.errors import DataError
+from robot.output import LOGGER
+from robot.utils import get_error_message
+from robot.version import VERSION
+
+from ..model import TestSuite
+from ..resourcemodel import ResourceFile
+from .parsers import Parser, RobotParser
+from .settings import TestDefaults
+
+
+class ParseCache:
+    """Persistent cache of parsed suite and resource files.
+
+    Entries are stored as JSON files into the given directory. Their names
+    are hashes calculated from everything that affects the parsing result,
+    most importantly the file path and content, and entries are thus never
+    invalidated explicitly. Old entries can be removed by simply removing
+    the whole directory.
+    """
+
+    def __init__(self, directory: "Path | str"):
+        self.directory = Path(directory)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        except OSError as err:
+            raise DataError(
+                f"Creating parse cache directory '{self.directory}' failed: {err}"
+            )
+
+    def get_key(self, source: Path, *parts: str) -> "str | None":
+        try:
+            content = source.read_bytes()
+        except OSError:
+            return None
+        digest = hashlib.sha256()
+        for part in (VERSION, str(source), *parts):
+            digest.update(part.encode("UTF-8") + b"\0")
+        digest.update(content)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> "dict | None":
+        try:
+            with open(self.directory / f"{key}.json", encoding="UTF-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, entry: dict):
+        path = self.directory / f"{key}.json"
+        temp = path.with_name(f"{key}.{os.getpid()}.tmp")
+        try:
+            with open(temp, "w", encoding="UTF-8") as file:
+                json.dump(entry, file, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temp, path)
+        except (OSError, TypeError, ValueError):
+            LOGGER.warn(
+                f"Writing parse cache entry '{path}' failed: {get_error_message()}"
+            )
+            if temp.exists():
+                temp.unlink()
+
+
+class CachingParser(Parser):
+    """Parser that uses :class:`ParseCache` with the wrapped parser.
+
+    Only parsers parsing Robot Framework data are wrapped. Custom parsers
+    are never cached because there is no way to know what affects their
+    results, and parsing JSON files would not get any faster.
+    """
+
+    def __init__(self, parser: RobotParser, cache: ParseCache):
+        self.parser = parser
+        self.cache = cache
+        # Parsing files adds languages they declare to a shared `Languages`
+        # instance. In that case language config must be checked every time.
+        if isinstance(parser.lang, Languages):
+            self.languages = parser.lang
+            self._language_config = None
+        else:
+            self.languages = None
+            self._language_config = self._get_language_config(parser.lang)
+        self.config = repr(
+            (type(parser).__module__, type(parser).__qualname__, parser.process_curdir)
+        )
+
+    @property
+    def name(self) -> str:
+        return self.parser.name
+
+    @property
+    def language_config(self) -> str:
+        if self._language_config is not None:
+            return self._language_config
+        return self._get_language_config(self.languages)
+
+    def _get_language_config(self, lang) -> str:
+        languages = Languages(lang) if not isinstance(lang, Languages) else lang
+        return repr(
+            (
+                sorted(languages.headers.items()),
+                sorted(languages.settings.items()),
+                sorted(languages.bdd_prefixes),
+                sorted(languages.true_strings),
+                sorted(languages.false_strings),
+                sorted(languages.deprecations.items()),
+            )
+        )
+
+    def parse_suite_file(self, source: Path, defaults: TestDefaults) -> TestSuite:
+        config = repr(
+            (defaults.setup, defaults.teardown, defaults.tags, defaults.timeout)
+        )
+        key = self._get_key(source, "suite", config)
+        entry = self._get_entry(key, TestSuite)
+        if entry:
+            return entry["model"]
+        return self._parse(key, self.parser.parse_suite_file, source, defaults)
+
+    def parse_init_file(self, source: Path, defaults: TestDefaults) -> TestSuite:
+        key = self._get_key(source, "init")
+        entry = self._get_entry(key, TestSuite, "defaults")
+        if entry:
+            suite, own = entry["model"], entry["defaults"]
+        else:
+            # Init files do not depend on possible parent defaults. Parsing
+            # with empty defaults allows caching values set by this file.
+            own = TestDefaults()
+            suite = self._parse(
+                key,
+                self.parser.parse_init_file,
+                source,
+                own,
+                get_extra=lambda: {"defaults": self._defaults_to_dict(own)},
+            )
+            own = self._defaults_to_dict(own)
+        defaults.setup = own["setup"]
+        defaults.teardown = own["teardown"]
+        defaults.tags = own["tags"]
+        defaults.timeout = own["timeout"]
+        return suite
+
+    def _defaults_to_dict(self, defaults: TestDefaults) -> dict:
+        return {
+            "setup": defaults.setup,
+            "teardown": defaults.teardown,
+            "tags": defaults.tags,
+            "timeout": defaults.timeout,
+        }
+
+    def parse_resource_file(self, source: Path) -> ResourceFile:
+        key = self._get_key(source, "resource")
+        entry = self._get_entry(key, ResourceFile)
+        if entry:
+            return entry["model"]
+        return self._parse(key, self.parser.parse_resource_file, source)
+
+    def _get_key(self, source: Path, kind: str, *config: str) -> "str | None":
+        return self.cache.get_key(
+            source, kind, self.config, self.language_config, *config
+        )
+
+    def _get_entry(
+        self,
+        key: "str | None",
+        model_class: "type[TestSuite | ResourceFile]",
+        *required: str,
+    ) -> "dict | None":
+        entry = self.cache.get(key) if key else None
+        if not entry or not all(name in entry for name in required):
+            return None
+        try:
+            entry["model"] = model_class.from_dict(entry["model"])
+        except (DataError, KeyError, TypeError, ValueError):
+            return None
+        for message, level, html in entry.get("messages", ()):
+            LOGGER.write(message, level, html)
+        for lang in entry.get("languages", ()):
+            self.languages.add_language(lang)
+        return entry
+
+    def _parse(self, key: "str | None", parse, *args, get_extra=dict):
+        languages = list(self.languages or ())
+        with LOGGER.record_messages() as messages:
+            model = parse(*args)
+        added = [lang for lang in self.languages or () if lang not in languages]
+        # Only built-in languages can be added based on their codes later.
+        if key and all(type(lang).__module__ == Languages.__module__ for lang in added):
+            entry = {
+                "model": model.to_dict(),
+                "messages": [(m.message, m.level, m.html) for m in messages],
+                "languages": [lang.code for lang in added],
+                **get_extra(),
+            }
+            self.cache.set(key, entry)
+        return model
@@ -13,7 +13,6 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-import asyncio
 import inspect
 import sys
 from contextlib import contextmanager
@@ -22,6 +21,7 @@ from robot.errors import DataError, ExecutionFailed
 
 
 class Asynchronous:
+    # `asyncio` is imported only when needed because importing it is slow.
 
     def __init__(self):
         self._loop_ref = None
@@ -29,6 +29,8 @@ class Asynchronous:
     @property
     def event_loop(self):
         if self._loop_ref is None:
+            import asyncio
+
             self._loop_ref = asyncio.new_event_loop()
         return self._loop_ref
 
@@ -43,6 +45,8 @@ class Asynchronous:
             return self.event_loop.run_until_complete(task)
         except ExecutionFailed as err:
             if err.dont_continue:
+                import asyncio
+
                 task.cancel()
                 # Wait for task and its children to cancel.
                 self.event_loop.run_until_complete(
@@ -54,6 +58,8 @@ class Asynchronous:
         return inspect.iscoroutine(obj) and not self._is_loop_running()
 
     def _is_loop_running(self):
+        import asyncio
+
         try:
             asyncio.get_running_loop()
         except RuntimeError:
@@ -83,8 +89,10 @@ class ExecutionContexts:
     def namespaces(self):
         return (context.namespace for context in self)
 
-    def start_suite(self, suite, namespace, output, dry_run=False):
-        ctx = _ExecutionContext(suite, namespace, output, dry_run, self._asynchronous)
+    def start_suite(self, suite, namespace, output, dry_run=False, low_memory=False):
+        ctx = _ExecutionContext(
+            suite, namespace, output, dry_run, self._asynchronous, low_memory
+        )
         self._contexts.append(ctx)
         return ctx
 
@@ -100,7 +108,15 @@ EXECUTION_CONTEXTS = ExecutionContexts()
 
 class _ExecutionContext:
 
-    def __init__(self, suite, namespace, output, dry_run=False, asynchronous=None):
+    def __init__(
+        self,
+        suite,
+        namespace,
+        output,
+        dry_run=False,
+        asynchronous=None,
+        low_memory=False,
+    ):
         self.suite = suite
         self.test = None
         self.timeouts = []
@@ -115,6 +131,7 @@ class _ExecutionContext:
         self.steps = []
         self.user_keywords = []
         self.asynchronous = asynchronous
+        self.low_memory = low_memory
 
     @property
     def languages(self):
@@ -378,6 +395,25 @@ class _ExecutionContext:
             }[result.type]
         method(*args)
         self.steps.pop()
+        if self.low_memory:
+            self._detach_result(result)
+
+    def _detach_result(self, result):
+        # The result has already been written to the output file and listeners
+        # have been notified, so its children are not needed anymore. The item
+        # itself is preserved so that its status is available for its parent.
+        # Loop iterations are removed altogether because their number is not
+        # limited by the executed data.
+        if getattr(result, "has_setup", False):
+            result.setup = None
+        if getattr(result, "has_teardown", False):
+            result.teardown = None
+        if hasattr(result, "body"):
+            result.body.clear()
+        if result.type == result.ITERATION:
+            body = result.parent.body
+            if body and body[-1] is result:
+                body.pop()
 
     def get_runner(self, name, recommend_on_failure=True):
         return self.namespace.get_runner(name, recommend_on_failure)
@@ -0,0 +1,305 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Distributing test execution to workers over TCP.
+
+When tests are run using the ``--coordinator [host:]port`` option, the main
+process acts as a coordinator that serves execution units, serialized child
+suites or tests of the top level suite, to workers connecting to the given
+address. Workers are started using ``robot --worker host:port``. They pull
+units one by one, run them with the normal
+:class:`~robot.running.suiterunner.SuiteRunner`, and send results back as
+JSON output. The coordinator adds results to the final result in
+the original execution order similarly as when running tests in local
+worker processes using ``--processes``.
+
+Messages consist of a single line containing a JSON object followed by
+a payload with as many bytes as the ``size`` attribute of the object tells.
+The conversation goes as follows:
+
+1. A worker sends ``{"type": "ready"}``.
+2. The coordinator responds either with ``{"type": "unit", "id": <id>,
+   "suite": <suite>, "settings": <settings>, "variables": <variables>}``,
+   where ``<suite>`` is created using :meth:`TestSuite.to_dict
+   <robot.running.model.TestSuite.to_dict>`, ``<settings>`` using
+   :meth:`RobotSettings.to_dict <robot.conf.settings.RobotSettings.to_dict>`
+   and ``<variables>`` contains variables set by the top level suite setup,
+   or with ``{"type": "done"}`` if there is no more work.
+3. After running the unit, the worker sends ``{"type": "result", "id": <id>,
+   "stop": <bool>}`` followed by the JSON output as a payload. ``stop`` tells
+   should execution be stopped due to exit-on-failure or similar.
+
+If a worker disconnects before sending results, its unit is given to another
+worker. If that happens :attr:`Coordinator.max_attempts` times with the same
+unit, for example, because the unit crashes every worker running it, the unit
+is not retried anymore and its tests are marked failed. If there are units
+to run but no workers are connected during the timeout given to
+:class:`Coordinator`, the remaining units are not run and their tests are
+marked failed as well. Workers need to have access to test data and
+libraries using same paths as the coordinator.
+"""
+
+import json
+import socket
+import time
+from collections import deque
+from concurrent.futures import Future
+from itertools import count
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Condition, Event, Thread
+
+from robot.conf import RobotSettings
+from robot.errors import DataError
+from robot.output import LOGGER
+from robot.utils import secs_to_timestr
+
+from .parallel import run_unit
+
+
+def send_message(stream, header: dict, payload: bytes = b""):
+    header = dict(header, size=len(payload))
+    stream.write(json.dumps(header).encode("UTF-8") + b"\n" + payload)
+    stream.flush()
+
+
+def receive_message(stream) -> "tuple[dict, bytes]":
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("Connection closed.")
+    header = json.loads(line)
+    size = header.get("size", 0)
+    payload = stream.read(size) if size else b""
+    if len(payload) != size:
+        raise ConnectionError("Connection closed.")
+    return header, payload
+
+
+class RemoteUnit:
+
+    def __init__(
+        self,
+        id: int,
+        data: dict,
+        settings: dict,
+        variables: dict,
+        future: Future,
+    ):
+        self.id = id
+        self.data = data
+        self.settings = settings
+        self.variables = variables
+        self.future = future
+        self.started = False
+        self.attempts = 0
+
+
+class Coordinator:
+    """Serves execution units to remote workers.
+
+    Has same interface as :class:`~robot.running.parallel.ProcessExecutor`,
+    but results of futures returned by :meth:`submit` contain the JSON output
+    as bytes instead of a path to an output file.
+
+    If ``timeout`` is given and there are units waiting to be run but no
+    workers have been connected for that many seconds, futures of the waiting
+    units fail.
+    """
+
+    #: How many times running a unit is tried before giving up.
+    max_attempts = 3
+
+    def __init__(self, address: "tuple[str, int]", timeout: "float | None" = None):
+        self.address = address
+        self.timeout = timeout
+        self.stop = Event()
+        self._units = deque()
+        self._ids = count(1)
+        self._condition = Condition()
+        self._closed = False
+        self._workers = 0
+        try:
+            self._server = socket.create_server(address)
+        except OSError as err:
+            host, port = address
+            raise DataError(
+                f"Starting coordinator at '{host}:{port}' failed: {err.strerror}"
+            )
+        LOGGER.info(f"Coordinator listening at '{address[0]}:{address[1]}'.")
+        Thread(target=self._serve, daemon=True).start()
+        if timeout:
+            Thread(target=self._watch, daemon=True).start()
+
+    def submit(
+        self,
+        data: dict,
+        settings: RobotSettings,
+        output=None,
+        variables: "dict | None" = None,
+    ) -> Future:
+        future = Future()
+        unit = RemoteUnit(
+            next(self._ids), data, settings.to_dict(), variables or {}, future
+        )
+        with self._condition:
+            self._units.append(unit)
+            self._condition.notify_all()
+        return future
+
+    def _serve(self):
+        while True:
+            try:
+                connection, address = self._server.accept()
+            except OSError:
+                break
+            LOGGER.info(f"Worker connected from '{address[0]}:{address[1]}'.")
+            Thread(target=self._handle, args=(connection,), daemon=True).start()
+
+    def _handle(self, connection: socket.socket):
+        self._update_workers(+1)
+        with connection, connection.makefile("rwb") as stream:
+            try:
+                while True:
+                    receive_message(stream)
+                    unit = self._next_unit()
+                    if not unit:
+                        send_message(stream, {"type": "done"})
+                        break
+                    self._run_unit(unit, stream)
+            except (OSError, ValueError):
+                pass
+            finally:
+                self._update_workers(-1)
+
+    def _update_workers(self, change: int):
+        with self._condition:
+            self._workers += change
+            self._condition.notify_all()
+
+    def _watch(self):
+        idle_since = time.monotonic()
+        with self._condition:
+            while not self._closed:
+                now = time.monotonic()
+                if self._workers or not self._units:
+                    idle_since = now
+                elif now - idle_since >= self.timeout:
+                    self._fail_waiting_units(
+                        f"No workers connected to the coordinator in "
+                        f"{secs_to_timestr(self.timeout)}."
+                    )
+                self._condition.wait(max(idle_since + self.timeout - now, 0.1))
+
+    def _fail_waiting_units(self, message: str):
+        while self._units:
+            unit = self._units.popleft()
+            if unit.started or unit.future.set_running_or_notify_cancel():
+                unit.future.set_exception(RuntimeError(message))
+
+    def _next_unit(self) -> "RemoteUnit | None":
+        with self._condition:
+            while True:
+                while not (self._units or self._closed):
+                    self._condition.wait()
+                if self._closed:
+                    return None
+                unit = self._units.popleft()
+                if not unit.started:
+                    if not unit.future.set_running_or_notify_cancel():
+                        continue
+                    unit.started = True
+                if self.stop.is_set():
+                    unit.future.set_result((None, True))
+                    continue
+                return unit
+
+    def _run_unit(self, unit: RemoteUnit, stream):
+        unit.attempts += 1
+        try:
+            message = {
+                "type": "unit",
+                "id": unit.id,
+                "suite": unit.data,
+                "settings": unit.settings,
+                "variables": unit.variables,
+            }
+            send_message(stream, message)
+            header, payload = receive_message(stream)
+        except (OSError, ValueError) as err:
+            if unit.attempts < self.max_attempts:
+                with self._condition:
+                    self._units.appendleft(unit)
+                    self._condition.notify_all()
+            else:
+                error = RuntimeError(
+                    f"Worker failed {unit.attempts} times while running "
+                    f"the unit. Last error: {err}"
+                )
+                unit.future.set_exception(error)
+            raise
+        if header.get("stop"):
+            self.stop.set()
+        unit.future.set_result((payload, header.get("stop", False)))
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._server.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def run_worker(address: "tuple[str, int]", connect_timeout: float = 60) -> int:
+    """Runs execution units received from the coordinator at ``address``.
+
+    Connecting is retried until ``connect_timeout`` seconds have passed so
+    that workers can be started before the coordinator. Returns zero after
+    the coordinator tells that there is no more work.
+    """
+    connection = _connect(address, connect_timeout)
+    with connection, connection.makefile("rwb") as stream:
+        with TemporaryDirectory(prefix="robot-worker-") as directory:
+            output = Path(directory, "output.json")
+            while True:
+                send_message(stream, {"type": "ready"})
+                header, _ = receive_message(stream)
+                if header["type"] != "unit":
+                    return 0
+                settings = RobotSettings.from_dict(header["settings"])
+                _, stop = run_unit(
+                    header["suite"], settings, str(output), header.get("variables")
+                )
+                message = {"type": "result", "id": header["id"], "stop": stop}
+                send_message(stream, message, output.read_bytes())
+
+
+def _connect(address: "tuple[str, int]", timeout: float) -> socket.socket:
+    host, port = address
+    max_time = time.time() + timeout
+    while True:
+        try:
+            return socket.create_connection(address)
+        except OSError as err:
+            if time.time() > max_time:
+                raise DataError(
+                    f"Connecting to coordinator at '{host}:{port}' failed: "
+                    f"{err.strerror}"
+                )
+            time.sleep(0.5)
@@ -14,7 +14,7 @@
 #  limitations under the License.
 
 from robot.errors import DataError
-from robot.utils import get_error_message, is_list_like, type_name
+from robot.utils import get_error_message, is_dict_like, is_list_like, type_name
 
 from .arguments import PythonArgumentParser
 from .context import EXECUTION_CONTEXTS
@@ -62,6 +62,14 @@ class DynamicMethod:
     def _handle_return_value(self, value):
         raise NotImplementedError
 
+    def process_value(self, value):
+        """Process a value got using :class:`GetLibraryInformation`.
+
+        Values are validated and converted the same way as values returned
+        by this method.
+        """
+        return self._handle_return_value(value)
+
     def _to_string(self, value, allow_tuple=False, allow_none=False):
         if isinstance(value, str):
             return value
@@ -96,6 +104,15 @@ class DynamicMethod:
         return self.method is not no_dynamic_method
 
 
+class GetLibraryInformation(DynamicMethod):
+    _underscore_name = "get_library_information"
+
+    def _handle_return_value(self, value):
+        if value is None or is_dict_like(value):
+            return value
+        raise DataError(f"Return value must be a dictionary, got {type_name(value)}.")
+
+
 class GetKeywordNames(DynamicMethod):
     _underscore_name = "get_keyword_names"
 
@@ -176,6 +193,10 @@ class GetKeywordTypes(DynamicMethod):
     def _handle_return_value(self, value):
         return value if self else {}
 
+    def process_value(self, value):
+        # Copy to avoid mutating library information when return type is popped.
+        return dict(value) if is_dict_like(value) else value
+
 
 class GetKeywordTags(DynamicMethod):
     _underscore_name = "get_keyword_tags"
@@ -20,6 +20,8 @@ from robot.output import LOGGER
 from robot.utils import normpath, seq2str, seq2str2
 
 from .builder import ResourceFileBuilder
+from .builder.parsecache import ParseCache
+from .librarycache import LibraryCache
 from .testlibraries import TestLibrary
 
 RESOURCE_EXTENSIONS = {
@@ -38,12 +40,14 @@ RESOURCE_EXTENSIONS = {
 
 class Importer:
 
-    def __init__(self):
+    def __init__(self, parse_cache=None, library_cache=None):
         self._library_cache = ImportCache()
         self._resource_cache = ImportCache()
+        self._parse_cache = ParseCache(parse_cache) if parse_cache else None
+        self._keyword_cache = LibraryCache(library_cache) if library_cache else None
 
-    def reset(self):
-        self.__init__()
+    def reset(self, parse_cache=None, library_cache=None):
+        self.__init__(parse_cache, library_cache)
 
     def close_global_library_listeners(self):
         for lib in self._library_cache.values():
@@ -63,7 +67,7 @@ class Importer:
             LOGGER.info(f"Found library '{name}' with arguments {args_str} from cache.")
             lib = self._library_cache[key]
         else:
-            lib.create_keywords()
+            lib.create_keywords(self._keyword_cache)
             if lib.scope is not lib.scope.GLOBAL:
                 lib.instance = None
             self._library_cache[key] = lib
@@ -79,7 +83,8 @@ class Importer:
         if path in self._resource_cache:
             LOGGER.info(f"Found resource file '{path}' from cache.")
         else:
-            resource = ResourceFileBuilder(lang=lang).build(path)
+            builder = ResourceFileBuilder(lang=lang, parse_cache=self._parse_cache)
+            resource = builder.build(path)
             self._resource_cache[path] = resource
         return self._resource_cache[path]
 
@@ -108,33 +113,48 @@ class ImportCache:
 
     Handles paths in keys case-insensitively on case-insensitive OSes.
     Unlike dicts, this storage accepts mutable values in keys.
+
+    Keys are indexed using their frozen versions where lists, dictionaries
+    and sets are converted to hashable counterparts. Keys containing values
+    that cannot be hashed are still supported, but finding them requires
+    comparing them with other such keys one by one.
     """
 
     def __init__(self):
         self._keys = []
         self._items = []
+        self._index = {}
+        self._unhashable = []
 
     def __setitem__(self, key, item):
         if not isinstance(key, (str, tuple)):
             raise FrameworkError("Invalid key for ImportCache")
         key = self._norm_path_key(key)
-        if key not in self._keys:
+        frozen = self._freeze(key)
+        index = self._find(key, frozen)
+        if index is None:
+            if frozen is not None:
+                self._index[frozen] = len(self._keys)
+            else:
+                self._unhashable.append(len(self._keys))
             self._keys.append(key)
             self._items.append(item)
         else:
-            self._items[self._keys.index(key)] = item
+            self._items[index] = item
 
     def add(self, key, item=None):
         self.__setitem__(key, item)
 
     def __getitem__(self, key):
         key = self._norm_path_key(key)
-        if key not in self._keys:
+        index = self._find(key, self._freeze(key))
+        if index is None:
             raise KeyError
-        return self._items[self._keys.index(key)]
+        return self._items[index]
 
     def __contains__(self, key):
-        return self._norm_path_key(key) in self._keys
+        key = self._norm_path_key(key)
+        return self._find(key, self._freeze(key)) is not None
 
     def values(self):
         return self._items
@@ -148,3 +168,36 @@ class ImportCache:
 
     def _is_path(self, key):
         return isinstance(key, str) and os.path.isabs(key) and os.path.exists(key)
+
+    def _find(self, key, frozen):
+        if frozen is not None:
+            return self._index.get(frozen)
+        for index in self._unhashable:
+            if self._keys[index] == key:
+                return index
+        return None
+
+    def _freeze(self, key):
+        """Return a hashable version of the key or ``None`` if it is not possible.
+
+        Types of lists, tuples, dicts and sets are preserved in the frozen
+        key so that frozen keys are equal only if the original keys are.
+        """
+        if isinstance(key, str):
+            return key
+        try:
+            frozen = self._freeze_value(key)
+            hash(frozen)
+        except TypeError:
+            return None
+        return frozen
+
+    def _freeze_value(self, value):
+        if isinstance(value, (list, tuple)):
+            kind = list if isinstance(value, list) else tuple
+            return kind, tuple(self._freeze_value(v) for v in value)
+        if isinstance(value, dict):
+            return dict, frozenset((k, self._freeze_value(v)) for k, v in value.items())
+        if isinstance(value, (set, frozenset)):
+            return set, frozenset(self._freeze_value(v) for v in value)
+        return value
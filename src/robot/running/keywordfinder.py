@@ -62,23 +62,42 @@ class KeywordFinder(Generic[K]):
 
 
 class KeywordCache(Generic[K]):
+    # Number of leading characters used when indexing embedded keywords.
+    index_length = 10
 
     def __init__(self, keywords: "list[K]"):
         self.normal = NormalizedDict[K](ignore="_")
         self.embedded: list[K] = []
+        self.embedded_index: "dict[str, list[tuple[int, K]]]" = {}
         add_normal = self.normal.__setitem__
-        add_embedded = self.embedded.append
+        add_embedded = self._add_embedded
         for kw in keywords:
             if kw.embedded:
                 add_embedded(kw)
             else:
                 add_normal(kw.name, kw)
 
+    def _add_embedded(self, kw: K):
+        # Embedded keywords are indexed based on the literal text their name
+        # pattern starts with. `re.escape` does not escape ASCII letters and
+        # digits, so they are literal characters in the pattern.
+        key = self._get_index_key(kw.embedded.name.pattern)
+        self.embedded_index.setdefault(key, []).append((len(self.embedded), kw))
+        self.embedded.append(kw)
+
+    def _get_index_key(self, string: str) -> str:
+        # Only ASCII letters and digits are used to guarantee that case-insensitive
+        # matching works the same way as with regular expressions.
+        for index, char in enumerate(string[: self.index_length]):
+            if not (char.isascii() and char.isalnum()):
+                return string[:index].lower()
+        return string[: self.index_length].lower()
+
     def find(self, name: str, count: "int | None" = None) -> "list[K] | K":
         try:
             keywords = [self.normal[name]]
         except KeyError:
-            keywords = [kw for kw in self.embedded if kw.matches(name)]
+            keywords = self._find_embedded(name)
         if count is not None:
             if len(keywords) != count:
                 names = ": " + seq2str([k.name for k in keywords]) if keywords else "."
@@ -89,3 +108,21 @@ class KeywordCache(Generic[K]):
             if count == 1:
                 return keywords[0]
         return keywords
+
+    def _find_embedded(self, name: str) -> "list[K]":
+        # Only keywords whose literal prefix is a prefix of the name can match.
+        # Keywords starting with an argument or with other characters than ASCII
+        # letters and digits have an empty prefix and are always candidates.
+        # Non-ASCII characters can match ASCII letters case-insensitively
+        # (e.g. KELVIN SIGN matches "k"), so all keywords are checked with them.
+        if not name[: self.index_length].isascii():
+            return [kw for kw in self.embedded if kw.matches(name)]
+        key = self._get_index_key(name)
+        index = self.embedded_index
+        candidates = []
+        for length in range(len(key) + 1):
+            if key[:length] in index:
+                candidates.extend(index[key[:length]])
+        if len(candidates) > 1:
+            candidates.sort(key=lambda item: item[0])
+        return [kw for _, kw in candidates if kw.matches(name)]
@@ -0,0 +1,484 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+from enum import Enum
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Iterator, Sequence, TYPE_CHECKING, TypeVar
+
+from robot.errors import DataError
+from robot.output import LOGGER
+from robot.utils import get_error_message
+from robot.version import VERSION
+
+from .arguments import ArgumentSpec, TypeInfo
+from .librarykeyword import DynamicKeyword, KeywordCreator, LibraryKeyword
+
+if TYPE_CHECKING:
+    from .testlibraries import TestLibrary
+
+
+K = TypeVar("K", bound=LibraryKeyword)
+# Objects that cannot be referred to using their module and name.
+SPECIAL_OBJECTS = {"NoneType": type(None), "Ellipsis": Ellipsis}
+# Modules, in addition to library modules and `robot` itself, that references
+# can point to. Contain types supported by Robot's argument conversion.
+ALLOWED_MODULES = frozenset(
+    (
+        "builtins",
+        "collections",
+        "datetime",
+        "decimal",
+        "enum",
+        "numbers",
+        "os",
+        "pathlib",
+        "robot",
+        "typing",
+    )
+)
+
+
+class LibraryCache:
+    """Persistent cache of library keyword metadata.
+
+    Creating keywords requires inspecting keyword methods and, with dynamic
+    libraries, calling methods like ``get_keyword_arguments`` separately for
+    each keyword. This cache stores keyword names, argument specifications,
+    types, documentation and tags as JSON files into the given directory.
+
+    Entries are keyed by the library code, the content of its source file,
+    its version and the arguments used when importing it. Before an entry is
+    used, keyword names and modification times of files where keyword methods
+    are implemented are validated. Types and default values are stored as
+    references to the actual objects, and keywords using types or default
+    values that cannot be referenced are always created normally. References
+    are allowed only to the modules of the library itself, to Robot Framework
+    modules and to standard modules containing types supported by argument
+    conversion. Entries referring to other modules are considered invalid so
+    that cache files cannot be used for importing arbitrary modules.
+
+    Keyword information of dynamic libraries can depend on runtime data that
+    the above does not cover. They are thus cached only if they explicitly
+    allow it by setting ``ROBOT_LIBRARY_CACHE`` to a true value.
+    """
+
+    def __init__(self, directory: "Path | str"):
+        self.directory = Path(directory)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        except OSError as err:
+            raise DataError(
+                f"Creating library cache directory '{self.directory}' failed: {err}"
+            )
+
+    def get_key(self, library: "TestLibrary") -> "str | None":
+        source = library.source
+        if not source:
+            return None
+        if source.is_dir():
+            source = source / "__init__.py"
+        try:
+            content = source.read_bytes()
+        except OSError:
+            return None
+        code = library.code
+        config = repr(
+            (
+                type(library).__name__,
+                code.__module__ if inspect.isclass(code) else code.__name__,
+                code.__qualname__ if inspect.isclass(code) else None,
+                library.real_name,
+                library.version,
+                library.init.positional,
+                library.init.named,
+            )
+        )
+        digest = hashlib.sha256()
+        for part in (VERSION, str(source), config):
+            digest.update(part.encode("UTF-8") + b"\0")
+        digest.update(content)
+        return digest.hexdigest()
+
+    def get(
+        self,
+        library: "TestLibrary",
+        names: "Sequence[str]",
+    ) -> "CachedLibrary | None":
+        """Return cached keyword metadata or ``None`` if there is no valid entry."""
+        key = self.get_key(library)
+        if not key:
+            return None
+        try:
+            with open(self.directory / f"{key}.json", encoding="UTF-8") as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+        try:
+            if entry["names"] != list(names):
+                return None
+            for path, stat in entry["files"].items():
+                if self._get_stat(path) != stat:
+                    return None
+            modules = self._get_modules(library)
+            cached = CachedLibrary(entry["keywords"], entry["types"], modules)
+            if not cached.references_allowed():
+                return None
+            return cached
+        except (AttributeError, KeyError, TypeError):
+            return None
+
+    def set(
+        self,
+        library: "TestLibrary",
+        names: "Sequence[str]",
+        keywords: "dict[str, LibraryKeyword]",
+    ):
+        key = self.get_key(library)
+        if not key:
+            return
+        files = {str(library.source)}
+        for cls in type(library.instance).__mro__:
+            files.add(getattr(sys.modules.get(cls.__module__), "__file__", None))
+        serializer = ArgumentSpecSerializer(modules=self._get_modules(library))
+        metadata = {}
+        for name, kw in keywords.items():
+            metadata[name] = self._get_metadata(name, kw, serializer)
+            if not isinstance(kw, DynamicKeyword):
+                code = getattr(inspect.unwrap(kw.method), "__code__", None)
+                files.add(getattr(code, "co_filename", None))
+        entry = {
+            "names": list(names),
+            "files": {f: self._get_stat(f) for f in sorted(files - {None})},
+            "keywords": metadata,
+            "types": serializer.types,
+        }
+        path = self.directory / f"{key}.json"
+        temp = path.with_name(f"{key}.{os.getpid()}.tmp")
+        try:
+            with open(temp, "w", encoding="UTF-8") as file:
+                json.dump(entry, file, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temp, path)
+        except (OSError, TypeError, ValueError):
+            LOGGER.warn(
+                f"Writing library cache entry '{path}' failed: {get_error_message()}"
+            )
+            if temp.exists():
+                temp.unlink()
+
+    def _get_modules(self, library: "TestLibrary") -> "set[str]":
+        code = library.code
+        if inspect.isclass(code):
+            return {cls.__module__ for cls in code.__mro__}
+        return {code.__name__}
+
+    def _get_stat(self, path: str) -> "list[int] | None":
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _get_metadata(
+        self,
+        name: str,
+        kw: LibraryKeyword,
+        serializer: "ArgumentSpecSerializer",
+    ) -> "dict | None":
+        try:
+            return {
+                # Dynamic keywords get their final name from the original name.
+                "name": name if isinstance(kw, DynamicKeyword) else kw.name,
+                "args": serializer.serialize(kw.args),
+                "doc": kw.doc,
+                "tags": list(kw.tags),
+            }
+        except TypeError:
+            return None
+
+
+class CachedLibrary:
+    """Keyword metadata of a library got from :class:`LibraryCache`."""
+
+    def __init__(
+        self,
+        keywords: "dict[str, dict | None]",
+        types: "list[dict]",
+        modules: "Sequence[str]" = (),
+    ):
+        self.keywords = keywords
+        self.serializer = ArgumentSpecSerializer(types, modules)
+
+    def references_allowed(self) -> bool:
+        """Return ``True`` if all references point to allowed modules."""
+        defaults = [
+            value
+            for metadata in self.keywords.values()
+            if metadata
+            for value in metadata["args"]["defaults"].values()
+        ]
+        return all(
+            self.serializer.is_allowed(reference)
+            for reference in self.serializer.get_references(defaults)
+        )
+
+    def create_keyword(
+        self,
+        keyword_class: "type[K]",
+        name: str,
+        library: "TestLibrary",
+        **extra,
+    ) -> "K | None":
+        """Create a keyword based on cached metadata.
+
+        ``None`` is returned if the keyword could not be cached or if cached
+        data is invalid, for example, if a type it refers to does not exist.
+        """
+        metadata = self.keywords.get(name)
+        if not metadata:
+            return None
+        try:
+            creator = CachedKeywordCreator(
+                keyword_class, name, library, metadata, self.serializer
+            )
+            return creator.create(**extra)
+        except (
+            AttributeError,
+            DataError,
+            ImportError,
+            KeyError,
+            TypeError,
+            ValueError,
+        ):
+            return None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.keywords
+
+
+class CachedKeywordCreator(KeywordCreator[K]):
+
+    def __init__(
+        self,
+        keyword_class: "type[K]",
+        name: str,
+        library: "TestLibrary",
+        metadata: dict,
+        serializer: "ArgumentSpecSerializer",
+    ):
+        super().__init__(name, library)
+        self.keyword_class = keyword_class
+        self.metadata = metadata
+        self.serializer = serializer
+
+    def get_name(self) -> str:
+        return self.metadata["name"]
+
+    def get_args(self) -> ArgumentSpec:
+        return self.serializer.deserialize(self.metadata["args"])
+
+    def get_doc(self) -> str:
+        return self.metadata["doc"]
+
+    def get_tags(self) -> "list[str]":
+        return self.metadata["tags"]
+
+
+class ArgumentSpecSerializer:
+    """Converts :class:`ArgumentSpec` objects to JSON compatible data and back.
+
+    Types and other objects that are not supported by JSON are stored as
+    references like ``module:Class``. Serializing raises a ``TypeError`` if
+    the spec contains objects that cannot be restored based on such data.
+
+    Type information is stored separately in :attr:`types` so that each type
+    used by multiple keywords is stored and restored only once. Restored
+    :class:`TypeInfo` objects are shared by keywords.
+
+    References can point only to the given ``modules``, their submodules and
+    modules in :data:`ALLOWED_MODULES`.
+    """
+
+    def __init__(
+        self,
+        types: "list[dict] | None" = None,
+        modules: "Sequence[str]" = (),
+    ):
+        self.types = types or []
+        self.modules = ALLOWED_MODULES | set(modules)
+        self._indices = {json.dumps(t): i for i, t in enumerate(self.types)}
+        self._restored: "dict[int, TypeInfo]" = {}
+        self._resolved: "dict[str, Any]" = {}
+
+    def serialize(self, spec: ArgumentSpec) -> dict:
+        return {
+            "type": spec.type,
+            "positional_only": list(spec.positional_only),
+            "positional_or_named": list(spec.positional_or_named),
+            "var_positional": spec.var_positional,
+            "named_only": list(spec.named_only),
+            "var_named": spec.var_named,
+            "defaults": {n: self._value(v) for n, v in spec.defaults.items()},
+            "types": (
+                {n: self._type_index(t) for n, t in spec.types.items()}
+                if spec.types is not None
+                else None
+            ),
+            "return_type": (
+                self._type_index(spec.return_type) if spec.return_type else None
+            ),
+        }
+
+    def _type_index(self, info: TypeInfo) -> int:
+        data = json.dumps(self._type_info(info))
+        if data not in self._indices:
+            self._indices[data] = len(self.types)
+            self.types.append(json.loads(data))
+        return self._indices[data]
+
+    def _type_info(self, info: TypeInfo) -> dict:
+        if type(info) is not TypeInfo:
+            raise TypeError(f"Cannot serialize '{type(info).__name__}'.")
+        return {
+            "name": info.name,
+            "type": self._value(info.type),
+            "nested": (
+                [self._type_info(n) for n in info.nested]
+                if info.nested is not None
+                else None
+            ),
+        }
+
+    def _value(self, value: Any) -> Any:
+        if type(value) in (type(None), str, bool, int, float):
+            return value
+        if type(value) is tuple:
+            return {"tuple": [self._value(v) for v in value]}
+        if isinstance(value, Enum):
+            return {"enum": self._reference(type(value)), "name": value.name}
+        for name, obj in SPECIAL_OBJECTS.items():
+            if value is obj:
+                return {"special": name}
+        return {"ref": self._reference(value)}
+
+    def _reference(self, obj: Any) -> str:
+        module = getattr(obj, "__module__", None)
+        qualname = getattr(obj, "__qualname__", None)
+        if not (isinstance(module, str) and isinstance(qualname, str)):
+            raise TypeError(f"Cannot reference {obj!r}.")
+        reference = f"{module}:{qualname}"
+        try:
+            resolved = self._resolve(reference)
+        except Exception:
+            resolved = None
+        if resolved is not obj:
+            raise TypeError(f"Cannot reference {obj!r}.")
+        return reference
+
+    def deserialize(self, data: dict) -> ArgumentSpec:
+        types = data["types"]
+        return_type = data["return_type"]
+        return ArgumentSpec(
+            type=data["type"],
+            positional_only=data["positional_only"],
+            positional_or_named=data["positional_or_named"],
+            var_positional=data["var_positional"],
+            named_only=data["named_only"],
+            var_named=data["var_named"],
+            defaults={n: self._restore(v) for n, v in data["defaults"].items()},
+            types=(
+                {n: self._restore_type(i) for n, i in types.items()}
+                if types is not None
+                else None
+            ),
+            return_type=(
+                self._restore_type(return_type) if return_type is not None else None
+            ),
+        )
+
+    def _restore_type(self, index: int) -> TypeInfo:
+        if index not in self._restored:
+            self._restored[index] = self._restore_type_info(self.types[index])
+        return self._restored[index]
+
+    def _restore_type_info(self, data: dict) -> TypeInfo:
+        nested = data["nested"]
+        return TypeInfo(
+            data["name"],
+            self._restore(data["type"]),
+            (
+                [self._restore_type_info(n) for n in nested]
+                if nested is not None
+                else None
+            ),
+        )
+
+    def _restore(self, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+        if "tuple" in data:
+            return tuple(self._restore(v) for v in data["tuple"])
+        if "enum" in data:
+            return self._resolve(data["enum"])[data["name"]]
+        if "special" in data:
+            return SPECIAL_OBJECTS[data["special"]]
+        return self._resolve(data["ref"])
+
+    def is_allowed(self, reference: str) -> bool:
+        module, qualname = reference.split(":")
+        if any(name.startswith("__") for name in qualname.split(".")):
+            return False
+        while module not in self.modules:
+            if "." not in module:
+                return False
+            module = module.rsplit(".", 1)[0]
+        return True
+
+    def get_references(self, values: "Sequence[Any]" = ()) -> "Iterator[str]":
+        """Yield references used by :attr:`types` and by the given values."""
+        types = list(self.types)
+        while types:
+            info = types.pop()
+            yield from self._get_references(info["type"])
+            types.extend(info["nested"] or ())
+        for value in values:
+            yield from self._get_references(value)
+
+    def _get_references(self, data: Any) -> "Iterator[str]":
+        if not isinstance(data, dict):
+            return
+        if "tuple" in data:
+            for value in data["tuple"]:
+                yield from self._get_references(value)
+        elif "enum" in data:
+            yield data["enum"]
+        elif "ref" in data:
+            yield data["ref"]
+
+    def _resolve(self, reference: str) -> Any:
+        if reference not in self._resolved:
+            if not self.is_allowed(reference):
+                raise ValueError(f"Reference '{reference}' is not allowed.")
+            module, qualname = reference.split(":")
+            obj = sys.modules.get(module) or import_module(module)
+            for name in qualname.split("."):
+                obj = getattr(obj, name)
+            self._resolved[reference] = obj
+        return self._resolved[reference]
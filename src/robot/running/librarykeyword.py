@@ -14,6 +14,7 @@
 #  limitations under the License.
 
 import inspect
+from functools import partial
 from os.path import normpath
 from pathlib import Path
 from typing import Any, Callable, Generic, Mapping, Sequence, TYPE_CHECKING, TypeVar
@@ -24,10 +25,12 @@ from robot.utils import (
     is_init, is_list_like, printable_name, split_tags_from_doc, type_name
 )
 
-from .arguments import ArgumentSpec, DynamicArgumentParser, PythonArgumentParser
+from .arguments import (
+    ArgumentSpec, DynamicArgumentParser, PythonArgumentParser, TypeInfo
+)
 from .dynamicmethods import (
-    GetKeywordArguments, GetKeywordDocumentation, GetKeywordSource, GetKeywordTags,
-    GetKeywordTypes, RunKeyword
+    DynamicMethod, GetKeywordArguments, GetKeywordDocumentation, GetKeywordSource,
+    GetKeywordTags, GetKeywordTypes, RunKeyword
 )
 from .keywordimplementation import KeywordImplementation
 from .librarykeywordrunner import (
@@ -51,13 +54,13 @@ class LibraryKeyword(KeywordImplementation):
 
     type = KeywordImplementation.LIBRARY_KEYWORD
     owner: "TestLibrary"
-    __slots__ = ("_resolve_args_until",)
+    __slots__ = ("_resolve_args_until", "_args", "_args_factory")
 
     def __init__(
         self,
         owner: "TestLibrary",
         name: str = "",
-        args: "ArgumentSpec | None" = None,
+        args: "ArgumentSpec | Callable[[], ArgumentSpec] | None" = None,
         doc: str = "",
         tags: "Tags | Sequence[str]" = (),
         resolve_args_until: "int | None" = None,
@@ -67,6 +70,39 @@ class LibraryKeyword(KeywordImplementation):
         super().__init__(name, args, doc, tags, owner=owner, parent=parent, error=error)
         self._resolve_args_until = resolve_args_until
 
+    @property
+    def args(self) -> ArgumentSpec:
+        """Information about accepted arguments.
+
+        Can be set also using a callable returning an :class:`ArgumentSpec`.
+        In that case the callable is called when arguments are needed the first
+        time. If it fails, the error is reported and the keyword fails when run.
+        """
+        if self._args_factory:
+            factory, self._args_factory = self._args_factory, None
+            self.args = self._create_args(factory)
+        return self._args
+
+    @args.setter
+    def args(self, spec: "ArgumentSpec | Callable[[], ArgumentSpec] | None"):
+        if callable(spec):
+            self._args_factory = spec
+        else:
+            self._args_factory = None
+            self._args = KeywordImplementation.args.method(self, spec)
+
+    def _create_args(self, factory: "Callable[[], ArgumentSpec]") -> ArgumentSpec:
+        try:
+            return factory()
+        except DataError as err:
+            self.owner.report_error(
+                f"Adding keyword '{self.name}' failed: {err}",
+                err.details,
+                details_level="DEBUG",
+            )
+            self.error = err.message
+            return ArgumentSpec(var_positional="args", var_named="kwargs")
+
     @property
     def method(self) -> Callable[..., Any]:
         raise NotImplementedError
@@ -133,7 +169,7 @@ class StaticKeyword(LibraryKeyword):
         method_name: str,
         owner: "TestLibrary",
         name: str = "",
-        args: "ArgumentSpec | None" = None,
+        args: "ArgumentSpec | Callable[[], ArgumentSpec] | None" = None,
         doc: str = "",
         tags: "Tags | Sequence[str]" = (),
         resolve_args_until: "int | None" = None,
@@ -169,15 +205,20 @@ class StaticKeyword(LibraryKeyword):
         return Path(normpath(source)) if source else super().source
 
     @classmethod
-    def from_name(cls, name: str, owner: "TestLibrary") -> "StaticKeyword":
-        return StaticKeywordCreator(name, owner).create(method_name=name)
+    def from_name(
+        cls,
+        name: str,
+        owner: "TestLibrary",
+        deferrer: "ArgumentDeferrer | None" = None,
+    ) -> "StaticKeyword":
+        return StaticKeywordCreator(name, owner, deferrer).create(method_name=name)
 
     def copy(self, **attributes) -> "StaticKeyword":
         return StaticKeyword(
             self.method_name,
             self.owner,
             self.name,
-            self.args,
+            self._args_factory or self.args,
             self._doc,
             self.tags,
             self._resolve_args_until,
@@ -241,7 +282,9 @@ class DynamicKeyword(LibraryKeyword):
         if not self.__source_info:
             get_keyword_source = GetKeywordSource(self.owner.instance)
             try:
-                source = get_keyword_source(self._orig_name)
+                source = self.owner.get_keyword_information(
+                    self._orig_name, "source", get_keyword_source
+                )
             except DataError as err:
                 source = None
                 self.owner.report_error(
@@ -282,7 +325,7 @@ class DynamicKeyword(LibraryKeyword):
         return DynamicKeyword(
             self.owner,
             self._orig_name,
-            self.args,
+            self._args_factory or self.args,
             self._doc,
             self.tags,
             self._resolve_args_until,
@@ -317,7 +360,9 @@ class LibraryInit(LibraryKeyword):
         from .testlibraries import DynamicLibrary
 
         if isinstance(self.owner, DynamicLibrary):
-            doc = GetKeywordDocumentation(self.owner.instance)("__init__")
+            doc = self.owner.get_keyword_information(
+                "__init__", "doc", GetKeywordDocumentation(self.owner.instance)
+            )
             if doc:
                 return doc
         return self._doc
@@ -383,13 +428,12 @@ class KeywordCreator(Generic[K]):
             **self.extra,
             **extra,
         )
-        kw.args.name = lambda: kw.full_name
         return kw
 
     def get_name(self) -> str:
         raise NotImplementedError
 
-    def get_args(self) -> ArgumentSpec:
+    def get_args(self) -> "ArgumentSpec | Callable[[], ArgumentSpec]":
         raise NotImplementedError
 
     def get_doc(self) -> str:
@@ -402,9 +446,15 @@ class KeywordCreator(Generic[K]):
 class StaticKeywordCreator(KeywordCreator[StaticKeyword]):
     keyword_class = StaticKeyword
 
-    def __init__(self, name: str, library: "TestLibrary"):
+    def __init__(
+        self,
+        name: str,
+        library: "TestLibrary",
+        deferrer: "ArgumentDeferrer | None" = None,
+    ):
         super().__init__(name, library)
         self.method = getattr(library.instance, name)
+        self.deferrer = deferrer
 
     def get_name(self) -> str:
         robot_name = getattr(self.method, "robot_name", None)
@@ -413,8 +463,11 @@ class StaticKeywordCreator(KeywordCreator[StaticKeyword]):
             raise DataError("Keyword name cannot be empty.")
         return name
 
-    def get_args(self) -> ArgumentSpec:
-        return PythonArgumentParser().parse(self.method)
+    def get_args(self) -> "ArgumentSpec | Callable[[], ArgumentSpec]":
+        parse = partial(PythonArgumentParser().parse, self.method)
+        if self.deferrer and self.deferrer.can_defer(self.method):
+            return parse
+        return parse()
 
     def get_doc(self) -> str:
         return inspect.getdoc(self.method) or ""
@@ -436,7 +489,9 @@ class DynamicKeywordCreator(KeywordCreator[DynamicKeyword]):
     def get_args(self) -> ArgumentSpec:
         supports_named_args = self.library.supports_named_args
         get_keyword_arguments = GetKeywordArguments(self.instance, supports_named_args)
-        spec = DynamicArgumentParser().parse(get_keyword_arguments(self.name))
+        spec = DynamicArgumentParser().parse(
+            self._get_information("args", get_keyword_arguments)
+        )
         if not supports_named_args:
             name = RunKeyword(self.instance).name
             prefix = f"Too few '{name}' method parameters to support "
@@ -444,17 +499,20 @@ class DynamicKeywordCreator(KeywordCreator[DynamicKeyword]):
                 raise DataError(prefix + "named-only arguments.")
             if spec.var_named:
                 raise DataError(prefix + "free named arguments.")
-        types = GetKeywordTypes(self.instance)(self.name)
+        types = self._get_information("types", GetKeywordTypes(self.instance), {})
         if isinstance(types, dict) and "return" in types:
             spec.return_type = types.pop("return")
         spec.types = types
         return spec
 
     def get_doc(self) -> str:
-        return GetKeywordDocumentation(self.instance)(self.name)
+        return self._get_information("doc", GetKeywordDocumentation(self.instance))
 
     def get_tags(self) -> "list[str]":
-        return GetKeywordTags(self.instance)(self.name)
+        return self._get_information("tags", GetKeywordTags(self.instance))
+
+    def _get_information(self, key: str, method: DynamicMethod, default=None) -> Any:
+        return self.library.get_keyword_information(self.name, key, method, default)
 
 
 class LibraryInitCreator(KeywordCreator[LibraryInit]):
@@ -480,3 +538,53 @@ class LibraryInitCreator(KeywordCreator[LibraryInit]):
 
     def get_tags(self) -> "list[str]":
         return []
+
+
+class ArgumentDeferrer:
+    """Decides can creating argument specifications be deferred.
+
+    Parsing arguments and type information of static keywords is relatively
+    expensive and typically only a small part of keywords in big libraries
+    are used. Parsing is deferred until arguments are needed, but only if it
+    is known not to fail. That way possible errors are still reported when
+    the library is imported.
+
+    Validating type hints is cached, which makes validation cheap when
+    keywords use same type hints.
+    """
+
+    def __init__(self):
+        self._valid_hints = {}
+
+    def can_defer(self, method: Callable[..., Any]) -> bool:
+        types = getattr(method, "robot_types", ())
+        if types:
+            return False
+        try:
+            function = inspect.unwrap(getattr(method, "__func__", method))
+            hints = method.__annotations__ if types is not None else {}
+        except Exception:
+            return False
+        if not inspect.isfunction(function) or hasattr(method, "__signature__"):
+            return False
+        names = function.__code__.co_varnames
+        return all(
+            (name == "return" or name in names) and self._is_valid(hint)
+            for name, hint in hints.items()
+        )
+
+    def _is_valid(self, hint: Any) -> bool:
+        try:
+            return self._valid_hints[hint]
+        except KeyError:
+            valid = self._valid_hints[hint] = self._validate(hint)
+            return valid
+        except TypeError:  # Unhashable hint.
+            return self._validate(hint)
+
+    def _validate(self, hint: Any) -> bool:
+        try:
+            TypeInfo.from_type_hint(hint, sequence_is_union=True)
+        except Exception:
+            return False
+        return True
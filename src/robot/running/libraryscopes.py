@@ -17,8 +17,10 @@ from enum import auto, Enum
 from typing import TYPE_CHECKING
 
 from robot.errors import DataError
+from robot.utils import get_error_details
 
 from .context import EXECUTION_CONTEXTS
+from .outputcapture import OutputCapturer
 
 if TYPE_CHECKING:
     from .testlibraries import TestLibrary
@@ -92,16 +94,41 @@ class SuiteScopeManager(ScopeManager):
     def __init__(self, library):
         super().__init__(library)
         self.instance_cache = []
+        self.instance_pool = []
 
     def start_suite(self):
         self.instance_cache.append(self.library._instance)
-        self.library.instance = None
+        self.library.instance = self._get_pooled_instance()
         self.register_listeners()
 
     def end_suite(self):
         self.unregister_listeners(close=True)
+        if self.library._instance is not None and self.library.reuse:
+            self.instance_pool.append(self.library._instance)
         self.library.instance = self.instance_cache.pop()
 
+    def _get_pooled_instance(self):
+        while self.instance_pool:
+            instance = self.instance_pool.pop()
+            try:
+                self._reset(instance)
+            except Exception:
+                message, details = get_error_details()
+                self.library.report_error(
+                    f"Resetting library instance failed: {message}", details
+                )
+            else:
+                return instance
+        return None
+
+    def _reset(self, instance):
+        for name in "reset", "_reset":
+            method = getattr(instance, name, None)
+            if callable(method):
+                with OutputCapturer(library_import=True):
+                    method()
+                return
+
 
 class TestScopeManager(SuiteScopeManager):
 
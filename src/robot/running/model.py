@@ -53,6 +53,7 @@ from .bodyrunner import (
     ForRunner, GroupRunner, IfRunner, KeywordRunner, TryRunner, WhileRunner
 )
 from .randomizer import Randomizer
+from .sharder import Sharder, ShardTimings
 from .statusreporter import StatusReporter
 
 if TYPE_CHECKING:
@@ -806,6 +807,8 @@ class TestSuite(model.TestSuite[Keyword, TestCase]):
         randomize_suites: bool = False,
         randomize_tests: bool = False,
         randomize_seed: "int | None" = None,
+        shard: "tuple[int, int] | None" = None,
+        shard_timings: "ShardTimings | Path | str | None" = None,
         **options,
     ):
         """A shortcut to configure a suite using one method call.
@@ -813,6 +816,8 @@ class TestSuite(model.TestSuite[Keyword, TestCase]):
         Can only be used with the root test suite.
 
         :param randomize_xxx: Passed to :meth:`randomize`.
+        :param shard: Shard to select as a tuple ``(index, total)``. Passed
+            to :meth:`shard` along with ``shard_timings``.
         :param options: Passed to
             :class:`~robot.model.configurer.SuiteConfigurer` that will then
             set suite attributes, call :meth:`filter`, etc. as needed.
@@ -827,6 +832,13 @@ class TestSuite(model.TestSuite[Keyword, TestCase]):
         one call.
         """
         super().configure(**options)
+        if shard:
+            self.shard(*shard, timings=shard_timings)
+            if not (self.has_tests or options.get("empty_suite_ok")):
+                raise DataError(
+                    f"Suite '{self.name}' contains no tests or tasks "
+                    f"in shard {shard[0]}/{shard[1]}."
+                )
         self.randomize(randomize_suites, randomize_tests, randomize_seed)
 
     def randomize(
@@ -844,6 +856,29 @@ class TestSuite(model.TestSuite[Keyword, TestCase]):
         """
         self.visit(Randomizer(suites, tests, seed))
 
+    def shard(
+        self,
+        index: int,
+        total: int,
+        timings: "ShardTimings | Path | str | None" = None,
+    ):
+        """Removes tests that do not belong to the specified shard.
+
+        :param index: Index of the shard to select starting from 1.
+        :param total: Total number of shards.
+        :param timings: Historical test durations as a
+            :class:`~robot.running.sharder.ShardTimings` object or as a path to
+            a file containing them. Used for balancing shards so that they
+            take approximately the same time to run.
+
+        Sharding is deterministic, so running all shards using the same data
+        and timings runs every test exactly once. The selected shard is added
+        to the :attr:`metadata` of this suite as ``Shard: <index>/<total>``.
+        """
+        if isinstance(timings, (Path, str)):
+            timings = ShardTimings.from_file(timings)
+        self.visit(Sharder(index, total, timings))
+
     @setter
     def suites(
         self, suites: "Sequence[TestSuite | DataDict]"
@@ -891,6 +926,13 @@ class TestSuite(model.TestSuite[Keyword, TestCase]):
                                stdout=stdout)
             print(result.return_code)
 
+        If the ``processes`` option is greater than one, child suites of this
+        suite, or its tests if there are no child suites, are executed in
+        parallel in that many worker processes. This suite's own setup and
+        teardown are run in the main process and variables set by the setup
+        are sent to the workers. Listeners must be given as names or paths in
+        that case, because they are used also in worker processes.
+
         To save memory, the returned
         :class:`~robot.result.executionresult.Result` object does not
         have any information about the executed keywords. If that information
@@ -905,6 +947,7 @@ class TestSuite(model.TestSuite[Keyword, TestCase]):
         API for executing tests in files or directories.
         """
         from .namespace import IMPORTER
+        from .parallel import ParallelSuiteRunner
         from .signalhandler import STOP_SIGNAL_MONITOR
         from .suiterunner import SuiteRunner
 
@@ -914,9 +957,12 @@ class TestSuite(model.TestSuite[Keyword, TestCase]):
                 LOGGER.register_console_logger(**settings.console_output_config)
             with pyloggingconf.robot_handler_enabled(settings.log_level):
                 with STOP_SIGNAL_MONITOR:
-                    IMPORTER.reset()
+                    IMPORTER.reset(settings.parse_cache, settings.library_cache)
                     output = Output(settings)
-                    runner = SuiteRunner(output, settings)
+                    if settings.processes > 1 or settings.coordinator:
+                        runner = ParallelSuiteRunner(output, settings)
+                    else:
+                        runner = SuiteRunner(output, settings)
                     self.visit(runner)
                 output.close(runner.result)
         return runner.result
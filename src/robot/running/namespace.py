@@ -100,6 +100,7 @@ class Namespace:
             resource = IMPORTER.import_resource(path, self.languages)
             self.variables.set_from_variable_section(resource.variables, overwrite)
             self._kw_store.resources[path] = resource
+            self._kw_store.clear_cache()
             self._handle_imports(resource.imports)
             LOGGER.resource_import(resource, import_)
         else:
@@ -148,6 +149,7 @@ class Namespace:
         if notify:
             LOGGER.library_import(lib, import_)
         self._kw_store.libraries[lib.name] = lib
+        self._kw_store.clear_cache()
         lib.scope_manager.start_suite()
         if self._running_test:
             lib.scope_manager.start_test()
@@ -244,6 +246,7 @@ class Namespace:
     def reload_library(self, name_or_instance):
         library = self._kw_store.get_library(name_or_instance)
         library.create_keywords()
+        self._kw_store.clear_cache()
         return library
 
     def get_runner(self, name, recommend_on_failure=True):
@@ -258,13 +261,34 @@ class Namespace:
 
 
 class KeywordStore:
+    #: Maximum number of cached keyword runners. The least recently used
+    #: runners are discarded when the cache gets full.
+    runner_cache_size = 1000
 
     def __init__(self, suite_file, languages: Languages):
         self.suite_file = suite_file
         self.libraries = OrderedDict()
         self.resources = ImportCache()
-        self.search_order = ()
+        self._search_order = ()
         self.languages = languages
+        self._runner_cache = OrderedDict()
+
+    @property
+    def search_order(self):
+        return self._search_order
+
+    @search_order.setter
+    def search_order(self, search_order):
+        self._search_order = search_order
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Clears cached keyword runners.
+
+        Must be called when libraries or resources are imported, or when
+        anything else that affects how keyword names are resolved changes.
+        """
+        self._runner_cache.clear()
 
     def get_library(self, name_or_instance):
         if name_or_instance is None:
@@ -293,11 +317,39 @@ class KeywordStore:
         self._no_library_found(instance)
 
     def get_runner(self, name, recommend=True):
+        if not isinstance(name, str):
+            return self._get_uncached_runner(name, recommend)
+        # Resolving a keyword can depend on the source of the caller. Failed
+        # searches are not cached to keep recommendations and errors unchanged.
+        # Runners with pre-run messages are not cached either, because
+        # the messages can contain the name of the caller.
+        key = (name, self._get_caller_source())
+        cache = self._runner_cache
+        if key in cache:
+            cache.move_to_end(key)
+            runner = cache[key]
+        else:
+            runner = self._get_uncached_runner(name, recommend)
+            if not getattr(runner, "pre_run_messages", None):
+                cache[key] = runner
+                if len(cache) > self.runner_cache_size:
+                    cache.popitem(last=False)
+        # Runners are copied because embedded argument runners have state.
+        return copy.copy(runner)
+
+    def _get_uncached_runner(self, name, recommend=True):
         runner = self._get_runner(name)
         if runner is None:
             self._raise_no_keyword_found(name, recommend)
         return runner
 
+    def _get_caller_source(self):
+        ctx = EXECUTION_CONTEXTS.current
+        if not ctx:
+            return None
+        caller = ctx.user_keywords[-1] if ctx.user_keywords else ctx.test
+        return caller.source if caller else None
+
     def _raise_no_keyword_found(self, name, recommend=True):
         if name.strip(": ").upper() == "FOR":
             raise KeywordError(
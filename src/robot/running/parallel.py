@@ -0,0 +1,406 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Running child suites or tests in parallel in worker processes.
+
+The top level suite is run in the main process similarly as normally, but its
+child suites, or its tests if it has no child suites, are sent to worker
+processes as serialized running models. Workers run them with the normal
+:class:`~robot.running.suiterunner.SuiteRunner` and write results to JSON
+output files that the main process reads and adds to its own results in
+the original execution order. Variables set by the top level suite setup are
+sent to workers along with units and set as global variables there.
+"""
+
+import json
+import math
+import os
+import pickle
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from robot.conf import RobotSettings
+from robot.output import LOGGER
+from robot.result import (
+    ExecutionResult, Result, TestCase as TestResult, TestSuite as SuiteResult
+)
+from robot.utils import get_error_message, text
+
+from .model import TestCase as TestData, TestSuite as SuiteData
+from .suiterunner import SuiteRunner
+
+
+class ExecutionUnit:
+    """Suite or tests that are executed as one unit in a worker process."""
+
+    def __init__(
+        self,
+        items: "list[SuiteData | TestData]",
+        data: dict,
+        variables: "dict | None" = None,
+    ):
+        self.items = items
+        self.data = data
+        self.variables = variables or {}
+
+    @property
+    def is_suite(self) -> bool:
+        return isinstance(self.items[0], SuiteData)
+
+    @classmethod
+    def from_suite(
+        cls,
+        suite: SuiteData,
+        variables: "dict | None" = None,
+    ) -> "ExecutionUnit":
+        data = cls._get_parent_data(suite.parent)
+        data["suites"] = [suite.to_dict()]
+        return cls([suite], data, variables)
+
+    @classmethod
+    def from_tests(
+        cls,
+        suite: SuiteData,
+        tests: "list[TestData]",
+        variables: "dict | None" = None,
+    ) -> "ExecutionUnit":
+        data = cls._get_parent_data(suite)
+        data["tests"] = [test.to_dict() for test in tests]
+        return cls(tests, data, variables)
+
+    @staticmethod
+    def _get_parent_data(parent: SuiteData) -> dict:
+        # Items are run in a copy of their parent suite so that their full
+        # names, suite variables, and so on, are same as when run normally.
+        # The parent's own setup and teardown are run in the main process.
+        return parent.copy(setup=None, teardown=None, suites=[], tests=[]).to_dict()
+
+
+class ParallelSuiteRunner(SuiteRunner):
+    """Runs child suites or tests of the top level suite in worker processes.
+
+    The top level suite setup and teardown are run in the main process and
+    execution units are run only if the setup passes. Variables the setup sets
+    so that they are visible to child suites, or to tests if units contain
+    tests, are passed to workers. If they cannot be serialized, units are run
+    in the main process.
+
+    If execution is stopped due to a failure or an error, units that have not
+    yet been started are run in the main process so that their tests get the
+    same statuses and messages as when executing tests sequentially.
+    """
+
+    def __init__(self, output, settings: RobotSettings, processes=None):
+        super().__init__(output, settings)
+        self.processes = processes or settings.processes
+        self.coordinator = settings.coordinator
+        self.worker_settings = settings.get_worker_settings()
+        self.unit_variables = {}
+
+    def visit_suite(self, suite: SuiteData):
+        if self.result or not self._run_in_parallel(suite):
+            super().visit_suite(suite)
+            return
+        self.start_suite(suite)
+        if self.suite_status.passed:
+            units = self.get_units(suite)
+            if self._can_send_variables():
+                self._run_units(units)
+            else:
+                for unit in units:
+                    self._run_locally(unit)
+            if suite.suites:
+                suite.tests.visit(self)
+        else:
+            suite.suites.visit(self)
+            suite.tests.visit(self)
+        self.end_suite(suite)
+
+    def _run_in_parallel(self, suite: SuiteData) -> bool:
+        if self.processes == 1 and not self.coordinator:
+            return False
+        return (len(suite.suites) or len(suite.tests)) > 1
+
+    def _run_setup(self, item, status, result, run=True):
+        if result is not self.result.suite or not self._run_in_parallel(item):
+            super()._run_setup(item, status, result, run)
+            return
+        # Child suites see only global variables and suite variables set with
+        # `children=True`, but tests see all variables of their parent suite.
+        if item.suites:
+            get_variables = self.variables.as_dict_for_child_suite
+        else:
+            get_variables = self.variables.as_dict
+        before = get_variables()
+        super()._run_setup(item, status, result, run)
+        self.unit_variables = {
+            name: value
+            for name, value in get_variables().items()
+            if name not in before or before[name] is not value
+        }
+
+    def _can_send_variables(self) -> bool:
+        try:
+            if self.coordinator:
+                json.dumps(self.unit_variables)
+            else:
+                pickle.dumps(self.unit_variables)
+        except Exception:
+            self.output.warn(
+                f"Running all tests in the main process because variables set "
+                f"by the top level suite setup cannot be sent to workers: "
+                f"{get_error_message()}"
+            )
+            return False
+        return True
+
+    def get_units(self, suite: SuiteData) -> "list[ExecutionUnit]":
+        variables = self.unit_variables
+        if suite.suites:
+            return [
+                ExecutionUnit.from_suite(child, variables) for child in suite.suites
+            ]
+        tests = list(suite.tests)
+        # With remote workers each test is its own unit by default.
+        parts = self.processes if self.processes > 1 else len(tests)
+        size = math.ceil(len(tests) / parts)
+        return [
+            ExecutionUnit.from_tests(suite, tests[index : index + size], variables)
+            for index in range(0, len(tests), size)
+        ]
+
+    def _run_units(self, units: "list[ExecutionUnit]"):
+        with TemporaryDirectory(prefix="robot-parallel-") as directory:
+            with self._get_executor(len(units)) as executor:
+                futures = [
+                    executor.submit(
+                        unit.data,
+                        self.worker_settings,
+                        str(Path(directory, f"unit-{index}.json")),
+                        unit.variables,
+                    )
+                    for index, unit in enumerate(units)
+                ]
+                for unit, future in zip(units, futures):
+                    if self.suite_status.exit and future.cancel():
+                        self._run_locally(unit)
+                        continue
+                    try:
+                        source, _ = future.result()
+                    except Exception:
+                        result = self._get_failed_result(unit, get_error_message())
+                    else:
+                        if not source:
+                            self._run_locally(unit)
+                            continue
+                        result = ExecutionResult(source)
+                    self.add_unit_result(unit, result)
+
+    def _get_executor(self, units: int):
+        if self.coordinator:
+            from .distributed import Coordinator
+
+            return Coordinator(self.coordinator, self.settings.coordinator_timeout)
+        return ProcessExecutor(min(self.processes, units))
+
+    def _run_locally(self, unit: ExecutionUnit):
+        for item in unit.items:
+            item.visit(self)
+
+    def _get_failed_result(self, unit: ExecutionUnit, error: str) -> Result:
+        """Creates a result where all tests of the unit have failed.
+
+        Used if running the unit in a worker fails altogether, for example,
+        because the worker process died or the unit could not be serialized.
+        """
+        message = f"Running in a worker process failed: {error}"
+        suite = SuiteResult(name=self.suite_result.name, rpa=self.settings.rpa)
+        items = suite.suites if unit.is_suite else suite.tests
+        for item in unit.items:
+            items.append(self._create_failed(item, message))
+        return Result(suite=suite, rpa=self.settings.rpa)
+
+    def _create_failed(self, item: "SuiteData | TestData", message: str):
+        now = datetime.now()
+        if isinstance(item, TestData):
+            return TestResult(
+                name=item.name,
+                doc=item.doc,
+                tags=item.tags,
+                lineno=item.lineno,
+                status=TestResult.FAIL,
+                message=message,
+                start_time=now,
+                end_time=now,
+            )
+        suite = SuiteResult(
+            name=item.name,
+            doc=item.doc,
+            metadata=item.metadata,
+            source=item.source,
+            rpa=self.settings.rpa,
+            start_time=now,
+            end_time=now,
+        )
+        for child in item.suites:
+            suite.suites.append(self._create_failed(child, message))
+        for test in item.tests:
+            suite.tests.append(self._create_failed(test, message))
+        return suite
+
+    def add_unit_result(self, unit: ExecutionUnit, result):
+        """Adds results of an execution unit to the results of this run.
+
+        Errors and warnings that occurred in the worker are reported normally,
+        results are written to the output file and console, and the execution
+        status is updated so that exit-on-failure and exit-on-error work also
+        across workers.
+        """
+        for msg in result.errors.messages:
+            LOGGER.message(msg)
+        if unit.is_suite:
+            items, target = list(result.suite.suites), self.suite_result.suites
+        else:
+            items, target = list(result.suite.tests), self.suite_result.tests
+        for item in items:
+            self.executed[-1][item.name] = True
+            target.append(item)
+            self.output.replay_result(item)
+            tests = item.all_tests if isinstance(item, SuiteResult) else [item]
+            for test in tests:
+                self._update_status(test)
+            self._clear_results(item)
+
+    def _update_status(self, test):
+        if test.failed:
+            fatal = test.tags.robot("exit-on-failure")
+            self.suite_status.exit.failure_occurred(fatal)
+        if test.tags.robot("exit"):
+            self._add_exit_combine()
+            if not self.suite_status.exit:
+                self.suite_status.exit.failure_occurred(fatal=True)
+
+    def _clear_results(self, item):
+        if isinstance(item, SuiteResult):
+            for suite in item.suites:
+                self._clear_results(suite)
+            for test in item.tests:
+                self._clear_result(test)
+        self._clear_result(item)
+
+
+class ProcessExecutor:
+    """Runs execution units in a pool of local worker processes.
+
+    Units are submitted using :meth:`submit` that returns a future. Its result
+    is a tuple containing the path to the created output file and information
+    should execution be stopped.
+    """
+
+    def __init__(self, processes: int):
+        context = get_context("spawn")
+        self.stop = context.Event()
+        self.pool = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=context,
+            initializer=init_worker,
+            initargs=(sys.path, self.stop),
+        )
+
+    def submit(
+        self,
+        data: dict,
+        settings: RobotSettings,
+        output: str,
+        variables: "dict | None" = None,
+    ) -> Future:
+        future = self.pool.submit(run_unit, data, settings, output, variables)
+        future.add_done_callback(self._stop_if_needed)
+        return future
+
+    def _stop_if_needed(self, future: Future):
+        if not future.cancelled() and not future.exception():
+            output, stop = future.result()
+            if stop:
+                self.stop.set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.pool.shutdown()
+
+
+_STOP = None
+
+
+def init_worker(sys_path: "list[str]", stop):
+    global _STOP
+    sys.path[:] = sys_path
+    _STOP = stop
+    # The syslog is written only by the main process.
+    os.environ["ROBOT_SYSLOG_FILE"] = "NONE"
+
+
+def run_unit(
+    data: dict,
+    settings: RobotSettings,
+    output: str,
+    variables: "dict | None" = None,
+):
+    """Runs an execution unit in a worker process.
+
+    ``variables`` are set by the top level suite setup in the main process.
+    They are set as global variables before running the unit.
+
+    Returns the path to the created output file and information should
+    execution be stopped. If execution has already been stopped when
+    the unit would be started, it is not run and ``None`` is returned
+    instead of the output path.
+    """
+    if _STOP and _STOP.is_set():
+        return None, True
+    suite = SuiteData.from_dict(data)
+    settings["Output"] = output
+    settings.worker_variables = variables or {}
+    LOGGER.register_console_logger(**settings.console_output_config)
+    old_max_error_lines = text.MAX_ERROR_LINES
+    old_max_assign_length = text.MAX_ASSIGN_LENGTH
+    text.MAX_ERROR_LINES = settings.max_error_lines
+    text.MAX_ASSIGN_LENGTH = settings.max_assign_length
+    try:
+        result = suite.run(settings)
+    finally:
+        text.MAX_ERROR_LINES = old_max_error_lines
+        text.MAX_ASSIGN_LENGTH = old_max_assign_length
+    stop = _execution_stopped(result.suite, settings)
+    if stop and _STOP:
+        _STOP.set()
+    return output, stop
+
+
+def _execution_stopped(suite: SuiteResult, settings: RobotSettings) -> bool:
+    for test in suite.all_tests:
+        if test.tags.robot("exit"):
+            return True
+        if test.failed and (
+            settings.exit_on_failure or test.tags.robot("exit-on-failure")
+        ):
+            return True
+    return False
@@ -17,11 +17,14 @@ from pathlib import Path
 from typing import Any, Final, Iterable, Literal, overload, Sequence, TYPE_CHECKING
 
 from robot import model
+from robot.errors import DataError
 from robot.model import BodyItem, create_fixture, DataDict, ModelObject, Tags
 from robot.output import LOGGER
 from robot.utils import NOT_SET, setter
 
-from .arguments import ArgInfo, ArgumentSpec, UserKeywordArgumentParser
+from .arguments import (
+    ArgInfo, ArgumentSpec, EmbeddedArguments, UserKeywordArgumentParser
+)
 from .keywordfinder import KeywordFinder
 from .keywordimplementation import KeywordImplementation
 from .model import Body, BodyItemParent, Keyword, TestSuite
@@ -288,6 +291,18 @@ class UserKeyword(KeywordImplementation):
         kw.body = self.body.to_dicts()
         return kw
 
+    @classmethod
+    def from_dict(cls, data: DataDict) -> "UserKeyword":
+        if data.get("error") and "${" in data.get("name", ""):
+            try:
+                EmbeddedArguments.from_name(data["name"])
+            except DataError:
+                # Name contains invalid embedded arguments. Need to set `_name`
+                # to bypass `@property` like when the keyword was built.
+                data = {**data, "_name": data["name"]}
+                data.pop("name")
+        return super().from_dict(data)
+
     def to_dict(self) -> DataDict:
         data: DataDict = {"name": self.name}
         for name, value in [
@@ -314,7 +329,8 @@ class UserKeyword(KeywordImplementation):
             deco = "@"
         else:
             deco = "$"
-        result = f"{deco}{{{arg.name}}}"
+        name = f"{arg.name}: {arg.type}" if arg.type else arg.name
+        result = f"{deco}{{{name}}}"
         if arg.default is not NOT_SET:
             result += f"={arg.default}"
         return result
@@ -354,6 +370,8 @@ class Variable(ModelObject):
 
     def to_dict(self) -> DataDict:
         data = {"name": self.name, "value": self.value}
+        if self.separator is not None:
+            data["separator"] = self.separator
         if self.lineno:
             data["lineno"] = self.lineno
         if self.error:
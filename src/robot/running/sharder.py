@@ -0,0 +1,167 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import heapq
+import json
+from pathlib import Path
+from typing import Mapping, TYPE_CHECKING
+
+from robot.errors import DataError
+from robot.model.filter import EmptySuiteRemover
+from robot.utils import get_error_message
+
+if TYPE_CHECKING:
+    from robot.model import TestCase, TestSuite
+
+
+class ShardTimings:
+    """Historical test durations used for balancing shards.
+
+    Timings are stored in a JSON file as a mapping from full test names to
+    elapsed times in seconds. Tests not found from the history get
+    an estimated duration that is the average of the known durations.
+    """
+
+    default_duration = 1.0
+
+    def __init__(self, timings: "Mapping[str, float] | None" = None):
+        self.timings = dict(timings or {})
+        self._average = self._get_average()
+
+    def _get_average(self) -> float:
+        if not self.timings:
+            return self.default_duration
+        return sum(self.timings.values()) / len(self.timings)
+
+    @classmethod
+    def from_file(cls, path: "Path | str") -> "ShardTimings":
+        """Reads timings from the given file.
+
+        If the file does not exist, returns an object without any timings.
+        """
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        try:
+            with open(path, encoding="UTF-8") as file:
+                data = json.load(file)
+            return cls({name: float(data["tests"][name]) for name in data["tests"]})
+        except Exception:
+            raise DataError(
+                f"Reading shard timings from '{path}' failed: {get_error_message()}"
+            )
+
+    def save(self, path: "Path | str"):
+        try:
+            with open(path, "w", encoding="UTF-8") as file:
+                json.dump({"tests": self.timings}, file, indent=2, sort_keys=True)
+        except OSError:
+            raise DataError(
+                f"Writing shard timings to '{path}' failed: {get_error_message()}"
+            )
+
+    def update(self, suite: "TestSuite") -> "ShardTimings":
+        """Updates timings based on the given result suite.
+
+        Skipped tests are ignored because their elapsed times do not
+        represent how long running them normally takes.
+        """
+        for test in suite.all_tests:
+            if not test.skipped:
+                self.timings[test.full_name] = test.elapsed_time.total_seconds()
+        self._average = self._get_average()
+        return self
+
+    def estimate(self, test: "TestCase") -> float:
+        return self.timings.get(test.full_name, self._average)
+
+    def __len__(self) -> int:
+        return len(self.timings)
+
+
+class Sharder(EmptySuiteRemover):
+    """Selects tests belonging to the given shard.
+
+    Tests are distributed to shards using greedy longest-processing-time
+    bin-packing so that all shards take approximately the same time to run.
+    Suites containing tests are assigned to shards as a whole to avoid running
+    their setups and teardowns in multiple shards. If there are fewer such
+    suites than shards, individual tests are assigned instead.
+
+    The selection is deterministic, so running all shards with the same data
+    and timings runs all tests exactly once.
+
+    The selected shard is added to the metadata of the visited top level
+    suite using name ``Shard`` and value like ``1/3``. It is thus shown in
+    logs and reports.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        total: int,
+        timings: "ShardTimings | Mapping[str, float] | None" = None,
+    ):
+        super().__init__()
+        if not 1 <= index <= total:
+            raise ValueError(f"Shard index must be between 1 and {total}, got {index}.")
+        self.index = index
+        self.total = total
+        if not isinstance(timings, ShardTimings):
+            timings = ShardTimings(timings)
+        self.timings = timings
+        self._selected = None
+
+    def start_suite(self, suite: "TestSuite"):
+        if self._selected is None:
+            self._selected = self._select(suite)
+            suite.metadata["Shard"] = f"{self.index}/{self.total}"
+        suite.tests = [t for t in suite.tests if id(t) in self._selected]
+
+    def _select(self, suite: "TestSuite") -> "set[int]":
+        units = self._get_units(suite)
+        shards = self.pack(units, [self._get_duration(u) for u in units])
+        return {id(test) for unit in shards[self.index - 1] for test in unit}
+
+    def _get_units(self, suite: "TestSuite") -> "list[list[TestCase]]":
+        units = [list(s.tests) for s in self._suites_with_tests(suite)]
+        if len(units) < self.total:
+            units = [[test] for test in suite.all_tests]
+        return units
+
+    def _suites_with_tests(self, suite: "TestSuite"):
+        if suite.tests:
+            yield suite
+        for child in suite.suites:
+            yield from self._suites_with_tests(child)
+
+    def _get_duration(self, unit: "list[TestCase]") -> float:
+        return sum(self.timings.estimate(test) for test in unit)
+
+    def pack(self, units: list, durations: "list[float]") -> "list[list]":
+        """Packs units to shards using longest-processing-time first algorithm.
+
+        Units are handled in descending order by their duration and each unit
+        is added to the shard that currently has the smallest total duration.
+        Ties are resolved based on the original order of units and shards.
+        """
+        shards = [[] for _ in range(self.total)]
+        loads = [(0.0, index) for index in range(self.total)]
+        order = sorted(range(len(units)), key=lambda index: -durations[index])
+        for index in order:
+            load, shard = heapq.heappop(loads)
+            shards[shard].append(units[index])
+            heapq.heappush(loads, (load + durations[index], shard))
+        return shards
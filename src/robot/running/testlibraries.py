@@ -17,23 +17,31 @@ import inspect
 from functools import cached_property, partial
 from pathlib import Path
 from types import ModuleType
-from typing import Any, Literal, overload, Sequence, TypeVar
+from typing import Any, Literal, Mapping, overload, Sequence, TYPE_CHECKING, TypeVar
 
 from robot.errors import DataError
 from robot.libraries import STDLIBS
 from robot.output import LOGGER
 from robot.utils import (
-    get_error_details, getdoc, Importer, is_dict_like, is_list_like, normalize,
-    NormalizedDict, seq2str2, setter, type_name
+    get_error_details, getdoc, Importer, is_dict_like, is_list_like, is_truthy,
+    normalize, NormalizedDict, seq2str2, setter, type_name
 )
 
 from .arguments import CustomArgumentConverters
-from .dynamicmethods import GetKeywordDocumentation, GetKeywordNames, RunKeyword
+from .dynamicmethods import (
+    DynamicMethod, GetKeywordDocumentation, GetKeywordNames, GetLibraryInformation,
+    RunKeyword
+)
 from .keywordfinder import KeywordFinder
-from .librarykeyword import DynamicKeyword, LibraryInit, LibraryKeyword, StaticKeyword
+from .librarykeyword import (
+    ArgumentDeferrer, DynamicKeyword, LibraryInit, LibraryKeyword, StaticKeyword
+)
 from .libraryscopes import Scope, ScopeManager
 from .outputcapture import OutputCapturer
 
+if TYPE_CHECKING:
+    from .librarycache import CachedLibrary, LibraryCache
+
 Self = TypeVar("Self", bound="TestLibrary")
 
 
@@ -127,6 +135,18 @@ class TestLibrary:
             return Scope.SUITE
         return Scope.TEST
 
+    @property
+    def reuse(self) -> bool:
+        """Whether instances of a suite scoped library are reused.
+
+        Set using the ``ROBOT_LIBRARY_REUSE`` attribute. With suite scoped
+        libraries instances are then not discarded when suites end, but they
+        are reset and used again in later suites. Other scopes are not affected.
+        """
+        if self.scope is not Scope.SUITE:
+            return False
+        return is_truthy(getattr(self.code, "ROBOT_LIBRARY_REUSE", False))
+
     @setter
     def source(self, source: "Path | str | None") -> "Path | None":
         return Path(source) if source else None
@@ -231,7 +251,7 @@ class TestLibrary:
             klass, name, real_name, source, args, variables, create_keywords, logger
         )
 
-    def create_keywords(self):
+    def create_keywords(self, cache: "LibraryCache | None" = None):
         raise NotImplementedError
 
     @overload
@@ -306,9 +326,10 @@ class ModuleLibrary(TestLibrary):
     def from_class(cls, *args, **kws) -> "TestLibrary":
         raise TypeError(f"Cannot create '{cls.__name__}' from class.")
 
-    def create_keywords(self):
+    def create_keywords(self, cache: "LibraryCache | None" = None):
         includes = getattr(self.code, "__all__", None)
-        StaticKeywordCreator(self, included_names=includes).create_keywords()
+        creator = StaticKeywordCreator(self, included_names=includes, cache=cache)
+        creator.create_keywords()
 
 
 class ClassLibrary(TestLibrary):
@@ -374,20 +395,24 @@ class ClassLibrary(TestLibrary):
             library.create_keywords()
         return library
 
-    def create_keywords(self):
-        StaticKeywordCreator(self, avoid_properties=True).create_keywords()
+    def create_keywords(self, cache: "LibraryCache | None" = None):
+        StaticKeywordCreator(self, avoid_properties=True, cache=cache).create_keywords()
 
 
 class HybridLibrary(ClassLibrary):
 
-    def create_keywords(self):
+    def create_keywords(self, cache: "LibraryCache | None" = None):
         names = DynamicKeywordCreator(self).get_keyword_names()
-        creator = StaticKeywordCreator(self, getting_method_failed_level="ERROR")
+        creator = StaticKeywordCreator(
+            self, getting_method_failed_level="ERROR", cache=cache
+        )
         creator.create_keywords(names)
 
 
 class DynamicLibrary(ClassLibrary):
     _supports_named_args = None
+    _library_information = None
+    _library_information_initialized = False
 
     @property
     def supports_named_args(self) -> bool:
@@ -395,19 +420,86 @@ class DynamicLibrary(ClassLibrary):
             self._supports_named_args = RunKeyword(self.instance).supports_named_args
         return self._supports_named_args
 
+    @property
+    def library_information(self) -> "Mapping | None":
+        """Information returned by the optional ``get_library_information`` method.
+
+        ``None`` if the method is not implemented, if it returns ``None``,
+        or if calling it fails.
+        """
+        if not self._library_information_initialized:
+            try:
+                info = GetLibraryInformation(self.instance)()
+            except DataError as err:
+                self.report_error(err.message, err.details)
+                info = None
+            self._library_information = info
+            self._library_information_initialized = True
+        return self._library_information
+
+    def get_keyword_information(
+        self,
+        name: str,
+        key: str,
+        method: DynamicMethod,
+        default: Any = None,
+    ) -> Any:
+        """Get keyword information from library information or using ``method``.
+
+        If :attr:`library_information` contains an entry for the keyword,
+        the value matching ``key`` is got from it and processed the same way
+        as values returned by ``method``. Missing values are considered to
+        have the given ``default`` value. Otherwise ``method`` is called.
+        """
+        info = self.library_information
+        if info is None or name not in info:
+            return method(name)
+        entry = info[name]
+        if not is_dict_like(entry):
+            raise DataError(
+                f"Library information for '{name}' must be a dictionary, "
+                f"got {type_name(entry)}."
+            )
+        try:
+            return method.process_value(entry.get(key, default))
+        except DataError as err:
+            raise DataError(f"Invalid '{key}' in library information: {err}")
+
     @property
     def doc(self) -> str:
-        return GetKeywordDocumentation(self.instance)("__intro__") or super().doc
+        doc = self.get_keyword_information(
+            "__intro__", "doc", GetKeywordDocumentation(self.instance)
+        )
+        return doc or super().doc
+
+    @property
+    def cache_allowed(self) -> bool:
+        """Whether keyword information can be stored to the library cache.
+
+        Dynamic libraries can create keyword names, arguments and other
+        information based on runtime data, so it is cached only if
+        the library explicitly allows it by setting ``ROBOT_LIBRARY_CACHE``
+        to a true value.
+        """
+        return is_truthy(getattr(self.code, "ROBOT_LIBRARY_CACHE", False))
 
-    def create_keywords(self):
-        DynamicKeywordCreator(self).create_keywords()
+    def create_keywords(self, cache: "LibraryCache | None" = None):
+        if not self.cache_allowed:
+            cache = None
+        DynamicKeywordCreator(self, cache=cache).create_keywords()
 
 
 class KeywordCreator:
 
-    def __init__(self, library: TestLibrary, getting_method_failed_level="INFO"):
+    def __init__(
+        self,
+        library: TestLibrary,
+        getting_method_failed_level="INFO",
+        cache: "LibraryCache | None" = None,
+    ):
         self.library = library
         self.getting_method_failed_level = getting_method_failed_level
+        self.cache = cache
 
     def get_keyword_names(self) -> "list[str]":
         raise NotImplementedError
@@ -419,10 +511,12 @@ class KeywordCreator:
         keywords = library.keywords = []
         if names is None:
             names = self.get_keyword_names()
+        cached = self.cache.get(library, names) if self.cache else None
+        created = {}
         seen = NormalizedDict(ignore="_")
         for name in names:
             try:
-                kw = self._create_keyword(instance, name)
+                kw = self._create_keyword(instance, name, cached)
             except DataError as err:
                 self._adding_keyword_failed(
                     name, err.message, err.details, self.getting_method_failed_level
@@ -430,6 +524,7 @@ class KeywordCreator:
             else:
                 if not kw:
                     continue
+                created[name] = kw
                 try:
                     if kw.embedded:
                         self._validate_embedded(kw)
@@ -440,8 +535,15 @@ class KeywordCreator:
                 else:
                     keywords.append(kw)
                     library._logger.debug(f"Created keyword '{kw.name}'.")
+        if self.cache and (cached is None or any(n not in cached for n in created)):
+            self.cache.set(library, names, created)
 
-    def _create_keyword(self, instance, name) -> "LibraryKeyword | None":
+    def _create_keyword(
+        self,
+        instance,
+        name: str,
+        cached: "CachedLibrary | None" = None,
+    ) -> "LibraryKeyword | None":
         raise NotImplementedError
 
     def _handle_duplicates(self, kw: LibraryKeyword, seen: NormalizedDict):
@@ -485,10 +587,12 @@ class StaticKeywordCreator(KeywordCreator):
         getting_method_failed_level="INFO",
         included_names=None,
         avoid_properties=False,
+        cache: "LibraryCache | None" = None,
     ):
-        super().__init__(library, getting_method_failed_level)
+        super().__init__(library, getting_method_failed_level, cache)
         self.included_names = included_names
         self.avoid_properties = avoid_properties
+        self.deferrer = ArgumentDeferrer()
 
     def get_keyword_names(self) -> "list[str]":
         instance = self.library.instance
@@ -539,7 +643,12 @@ class StaticKeywordCreator(KeywordCreator):
         except Exception:
             return False
 
-    def _create_keyword(self, instance, name) -> "StaticKeyword | None":
+    def _create_keyword(
+        self,
+        instance,
+        name: str,
+        cached: "CachedLibrary | None" = None,
+    ) -> "StaticKeyword | None":
         if self.avoid_properties:
             self._pre_validate_method(instance, name)
         try:
@@ -548,8 +657,14 @@ class StaticKeywordCreator(KeywordCreator):
             message, details = get_error_details()
             raise DataError(f"Getting handler method failed: {message}", details)
         self._validate_method(method)
+        if cached:
+            kw = cached.create_keyword(
+                StaticKeyword, name, self.library, method_name=name
+            )
+            if kw:
+                return kw
         try:
-            return StaticKeyword.from_name(name, self.library)
+            return StaticKeyword.from_name(name, self.library, self.deferrer)
         except DataError as err:
             self._adding_keyword_failed(name, err.message, err.details)
         return None
@@ -574,8 +689,12 @@ class StaticKeywordCreator(KeywordCreator):
 class DynamicKeywordCreator(KeywordCreator):
     library: DynamicLibrary
 
-    def __init__(self, library: "DynamicLibrary | HybridLibrary"):
-        super().__init__(library, getting_method_failed_level="ERROR")
+    def __init__(
+        self,
+        library: "DynamicLibrary | HybridLibrary",
+        cache: "LibraryCache | None" = None,
+    ):
+        super().__init__(library, getting_method_failed_level="ERROR", cache=cache)
 
     def get_keyword_names(self) -> "list[str]":
         try:
@@ -586,5 +705,14 @@ class DynamicKeywordCreator(KeywordCreator):
                 f"failed: {err}"
             )
 
-    def _create_keyword(self, instance, name) -> DynamicKeyword:
+    def _create_keyword(
+        self,
+        instance,
+        name: str,
+        cached: "CachedLibrary | None" = None,
+    ) -> DynamicKeyword:
+        if cached:
+            kw = cached.create_keyword(DynamicKeyword, name, self.library)
+            if kw:
+                return kw
         return DynamicKeyword.from_name(name, self.library)
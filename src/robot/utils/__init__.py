@@ -113,6 +113,9 @@ from .robotio import (
     binary_file_writer as binary_file_writer,
     create_destination_directory as create_destination_directory,
     file_writer as file_writer,
+    get_file_suffix as get_file_suffix,
+    is_compressed as is_compressed,
+    open_file as open_file,
 )
 from .robotpath import (
     abspath as abspath,
@@ -19,6 +19,8 @@ from os import fsdecode
 from pathlib import Path
 from typing import IO, Union
 
+from .robotio import is_compressed, open_file
+
 Source = Union[IO, Path, str, bytes, bytearray]
 
 
@@ -26,14 +28,18 @@ class ETSource:
 
     def __init__(self, source: Source):
         self._source = source
-        self._opened: BytesIO | None = None
+        self._opened: IO | None = None
 
     def __enter__(self) -> "IO | Path | str | bytes":
         self._opened = self._open_if_necessary(self._source)
         return self._opened or self._source
 
-    def _open_if_necessary(self, source: Source) -> "BytesIO | None":
-        if self._is_path(source) or self._is_already_open(source):
+    def _open_if_necessary(self, source: Source) -> "IO | None":
+        if self._is_path(source):
+            if isinstance(source, (Path, str)) and is_compressed(source):
+                return open_file(source, "rb")
+            return None
+        if self._is_already_open(source):
             return None
         if isinstance(source, (bytes, bytearray)):
             return BytesIO(source)
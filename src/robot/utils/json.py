@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import Dict, overload, TextIO
 
 from .error import get_error_message
+from .robotio import open_file
 from .robottypes import type_name
 
 DataDict = Dict[str, object]
@@ -68,7 +69,7 @@ class JsonLoader:
 
     def _load(self, source: "str | bytes | TextIO | Path") -> object:
         if self._is_path(source):
-            with open(source, encoding="UTF-8") as file:
+            with open_file(source, encoding="UTF-8") as file:
                 return json.load(file, **self.config)
         if hasattr(source, "read"):
             return json.load(source, **self.config)
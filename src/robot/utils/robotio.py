@@ -22,19 +22,69 @@ from robot.errors import DataError
 from .error import get_error_message
 
 
-def file_writer(path=None, encoding="UTF-8", newline=None, usage=None):
+def file_writer(
+    path=None,
+    encoding="UTF-8",
+    newline=None,
+    usage=None,
+    compression_level=1,
+):
     if not path:
         return StringIO(newline=newline)
     if isinstance(path, Path):
         path = str(path)
     create_destination_directory(path, usage)
     try:
-        return open(path, "w", encoding=encoding, newline=newline)
+        return open_file(path, "w", encoding, newline, compression_level)
     except EnvironmentError:
         usage = f"{usage} file" if usage else "file"
         raise DataError(f"Opening {usage} '{path}' failed: {get_error_message()}")
 
 
+def is_compressed(path: "Path | str") -> bool:
+    """Returns ``True`` if the path has a ``.gz`` or ``.xz`` suffix."""
+    return os.path.splitext(path)[1].lower() in (".gz", ".xz")
+
+
+def get_file_suffix(path: "Path | str") -> str:
+    """Returns the lower case suffix of the path ignoring compression suffixes.
+
+    For example, the suffix of ``output.json.gz`` is ``.json``.
+    """
+    base, suffix = os.path.splitext(path)
+    if suffix.lower() in (".gz", ".xz"):
+        suffix = os.path.splitext(base)[1]
+    return suffix.lower()
+
+
+def open_file(path, mode="r", encoding=None, newline=None, compression_level=1):
+    """Opens a file so that files with a compression suffix are handled.
+
+    Files with a ``.gz`` suffix are compressed and decompressed using gzip
+    and files with a ``.xz`` suffix using lzma. Other files are opened
+    normally. Opening in text mode works also with compressed files.
+
+    ``compression_level`` is used when writing compressed files. It must be
+    between 0 and 9, and the default is a fast level 1.
+    """
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix not in (".gz", ".xz"):
+        return open(path, mode, encoding=encoding, newline=newline)
+    if "b" not in mode:
+        mode += "t"
+    writing = any(m in mode for m in "wax")
+    # Imported here because they are needed only with compressed files.
+    if suffix == ".gz":
+        import gzip
+
+        level = compression_level if writing else 9
+        return gzip.open(path, mode, level, encoding=encoding, newline=newline)
+    import lzma
+
+    preset = compression_level if writing else None
+    return lzma.open(path, mode, preset=preset, encoding=encoding, newline=newline)
+
+
 def binary_file_writer(path=None):
     if path:
         if isinstance(path, Path):
@@ -17,7 +17,6 @@ import os
 import os.path
 import sys
 from pathlib import Path
-from urllib.request import pathname2url as path_to_url
 
 from robot.errors import DataError
 
@@ -77,8 +76,11 @@ def get_link_path(target, base):
     The returned path is URL encoded. On Windows returns an absolute path with
     ``file:`` prefix if the target is on a different drive.
     """
+    # Importing `urllib.request` is slow and it is not needed otherwise.
+    from urllib.request import pathname2url
+
     path = _get_link_path(target, base)
-    url = path_to_url(path)
+    url = pathname2url(path)
     if os.path.isabs(path):
         url = "file:" + url
     return url
@@ -17,6 +17,7 @@ import builtins
 import re
 import token
 from collections.abc import MutableMapping
+from functools import lru_cache
 from io import StringIO
 from tokenize import generate_tokens, untokenize
 
@@ -66,8 +67,19 @@ def evaluate_expression(
 
 
 def _evaluate(expression, variable_store, modules=None, namespace=None):
-    if "$" in expression:
-        expression = _decorate_variables(expression, variable_store)
+    try:
+        code, variables = _compile(expression)
+    except Exception:
+        # Invalid expressions are not cached. Handling them normally makes sure
+        # that possible non-existing variables are reported before syntax errors.
+        if "$" in expression:
+            expression = _decorate_variables(
+                expression, lambda name: _validate_variable(name, variable_store)
+            )
+        code = expression
+    else:
+        for name in variables:
+            _validate_variable(name, variable_store)
     # Given namespace must be included in our custom local namespace to make
     # it possible to detect which names are not found and should be imported
     # automatically as modules. It must be also be used as the global namespace
@@ -77,10 +89,33 @@ def _evaluate(expression, variable_store, modules=None, namespace=None):
     if modules:
         namespace.update(_import_modules(modules))
     local_ns = EvaluationNamespace(variable_store, namespace)
-    return eval(expression, namespace, local_ns)
+    return eval(code, namespace, local_ns)
+
+
+@lru_cache(maxsize=1000)
+def _compile(expression):
+    """Compiles the expression after decorating variables in it.
+
+    Returns the code object and names of the used ``$var`` variables.
+    Results are cached because same expressions are often evaluated
+    repeatedly, for example, as ``WHILE`` loop conditions.
+    """
+    variables = []
+    if "$" in expression:
+        expression = _decorate_variables(expression, variables.append)
+    return compile(expression, "<string>", "eval"), tuple(variables)
+
 
+def _validate_variable(name, variable_store):
+    if name not in variable_store:
+        variable_not_found(
+            f"${name}",
+            variable_store.as_dict(decoration=False),
+            deco_braces=False,
+        )
 
-def _decorate_variables(expression, variable_store):
+
+def _decorate_variables(expression, validate_variable):
     variable_started = False
     variable_found = False
     tokens = []
@@ -88,12 +123,7 @@ def _decorate_variables(expression, variable_store):
     for toknum, tokval, _, _, _ in generate_tokens(StringIO(expression).readline):
         if variable_started:
             if toknum == token.NAME:
-                if tokval not in variable_store:
-                    variable_not_found(
-                        f"${tokval}",
-                        variable_store.as_dict(decoration=False),
-                        deco_braces=False,
-                    )
+                validate_variable(tokval)
                 tokval = "RF_VAR_" + tokval
                 variable_found = True
             else:
@@ -109,15 +139,23 @@ def _decorate_variables(expression, variable_store):
 
 def _import_modules(module_names):
     modules = {}
+    for name in _get_module_names(module_names):
+        modules[name] = __import__(name)
+    return modules
+
+
+@lru_cache(maxsize=100)
+def _get_module_names(module_names):
+    names = []
     for name in module_names.replace(" ", "").split(","):
         if not name:
             continue
-        modules[name] = __import__(name)
+        names.append(name)
         # If we just import module 'root.sub', module 'root' is not found.
         while "." in name:
             name, _ = name.rsplit(".", 1)
-            modules[name] = __import__(name)
-    return modules
+            names.append(name)
+    return tuple(names)
 
 
 def _recommend_special_variables(expression):
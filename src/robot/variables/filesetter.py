@@ -16,11 +16,6 @@
 import inspect
 import json
 
-try:
-    import yaml
-except ImportError:
-    yaml = None
-
 from robot.errors import DataError
 from robot.output import LOGGER
 from robot.utils import (
@@ -171,7 +166,10 @@ class YamlImporter:
         return variables.items()
 
     def _load_yaml(self, stream):
-        if not yaml:
+        # PyYAML is imported only when needed because importing it is slow.
+        try:
+            import yaml
+        except ImportError:
             raise DataError(
                 "Using YAML variable files requires PyYAML module to be installed."
                 "Typically you can install it by running `pip install pyyaml`."
@@ -14,6 +14,7 @@
 #  limitations under the License.
 
 import re
+from functools import lru_cache
 
 from robot.errors import DataError, VariableError
 from robot.utils import (
@@ -134,11 +135,16 @@ class ExtendedFinder:
         except DataError as err:
             raise VariableError(f"Resolving variable '{variable.name}' failed: {err}")
         try:
-            return eval("_BASE_VAR_" + extended, {"_BASE_VAR_": base_var})
+            return eval(self._compile(extended), {"_BASE_VAR_": base_var})
         except Exception:
             msg = get_error_message()
             raise VariableError(f"Resolving variable '{variable.name}' failed: {msg}")
 
+    @staticmethod
+    @lru_cache(maxsize=1000)
+    def _compile(extended):
+        return compile("_BASE_VAR_" + extended, "<string>", "eval")
+
 
 class EnvironmentFinder:
     identifiers = "%"
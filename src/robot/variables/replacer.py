@@ -13,6 +13,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from functools import lru_cache
+
 from robot.errors import DataError, VariableError
 from robot.output import librarylogger as logger
 from robot.utils import (
@@ -21,7 +23,7 @@ from robot.utils import (
 )
 
 from .finders import VariableFinder
-from .search import search_variable, VariableMatch
+from .search import search_variable, unescape_variable_syntax, VariableMatch
 
 
 class VariableReplacer:
@@ -60,9 +62,15 @@ class VariableReplacer:
     def _replace_list(self, items, ignore_errors):
         result = []
         for item in items:
-            match = search_variable(item, ignore_errors=ignore_errors)
-            value = self._replace(match, ignore_errors)
-            if match.is_list_variable() and is_list_like(value):
+            if isinstance(item, str):
+                template = get_template(item, ignore_errors)
+                value = template.replace(self, ignore_errors)
+                is_list_variable = template.is_list_variable
+            else:
+                match = search_variable(item, ignore_errors=ignore_errors)
+                value = self._replace(match, ignore_errors)
+                is_list_variable = match.is_list_variable()
+            if is_list_variable and is_list_like(value):
                 result.extend(value)
             else:
                 result.append(value)
@@ -75,6 +83,8 @@ class VariableReplacer:
         its value is returned. Otherwise, possible variables are replaced with
         'replace_string'. Result may be any object.
         """
+        if isinstance(item, str):
+            return get_template(item, ignore_errors).replace(self, ignore_errors)
         if isinstance(item, VariableMatch):
             match = item
         else:
@@ -86,6 +96,10 @@ class VariableReplacer:
 
         Input can also be an already found VariableMatch.
         """
+        if isinstance(item, str):
+            template = get_template(item, ignore_errors)
+            result = template.replace(self, ignore_errors, custom_unescaper)
+            return safe_str(result)
         if isinstance(item, VariableMatch):
             match = item
         else:
@@ -110,8 +124,9 @@ class VariableReplacer:
             return b"".join(parts)
         return "".join(safe_str(p) for p in parts)
 
-    def _get_variable_value(self, match, ignore_errors):
-        match.resolve_base(self, ignore_errors)
+    def _get_variable_value(self, match, ignore_errors, resolve_base=True):
+        if resolve_base:
+            match.resolve_base(self, ignore_errors)
         # TODO: Do we anymore need to reserve `*{var}` syntax for anything?
         if match.identifier == "*":
             logger.warn(
@@ -209,3 +224,99 @@ class VariableReplacer:
                 )
             return DotDict(value)
         return value
+
+
+@lru_cache(maxsize=10000)
+def get_template(string: str, ignore_errors: bool = False) -> "ReplacementTemplate":
+    """Returns a cached :class:`ReplacementTemplate` for the given string.
+
+    Templates are cached by the string and the ``ignore_errors`` flag and
+    the least recently used ones are discarded when the cache gets full.
+    Strings with invalid variable syntax are not cached, because
+    :class:`~robot.errors.VariableError` is raised when parsing them.
+    """
+    return ReplacementTemplate(string, ignore_errors)
+
+
+class ReplacementTemplate:
+    """String parsed to literal parts and variables it contains.
+
+    Searching variables is relatively slow and same strings, for example,
+    keyword arguments in the running model, are typically replaced many times.
+    Templates allow parsing strings only once so that replacing them requires
+    only finding variable values.
+
+    Parsed :class:`~robot.variables.search.VariableMatch` objects are never
+    modified. Copies are used when replacing, because resolving possible
+    nested variables in variable bases changes the match.
+    """
+
+    def __init__(self, string: str, ignore_errors: bool = False):
+        self.string = string
+        match = search_variable(string, ignore_errors=ignore_errors)
+        self.is_variable = match.is_variable()
+        self.is_list_variable = match.is_list_variable()
+        self.parts = []
+        self.error = None
+        self._unescaped = {}
+        while match:
+            if match.before:
+                self.parts.append(match.before)
+            self.parts.append(TemplateVariable(match))
+            try:
+                match = search_variable(match.after, ignore_errors=ignore_errors)
+            except VariableError as err:
+                # Error is reported only after preceding variables are
+                # replaced to preserve the error that occurs first.
+                self.error = err.message
+                break
+        else:
+            if match.string:
+                self.parts.append(match.string)
+
+    def replace(self, replacer: VariableReplacer, ignore_errors=False, unescaper=None):
+        if self.is_variable:
+            return self.parts[0].replace(replacer, ignore_errors)
+        parts = []
+        for part in self.parts:
+            if isinstance(part, TemplateVariable):
+                parts.append(part.replace(replacer, ignore_errors))
+            elif unescaper:
+                parts.append(unescaper(part))
+            else:
+                parts.append(self._unescape(part))
+        if self.error:
+            raise VariableError(self.error)
+        if len(parts) == 1 and not isinstance(self.parts[0], TemplateVariable):
+            return parts[0]
+        if not parts:
+            return unescaper(self.string) if unescaper else self.string
+        if all(isinstance(p, (bytes, bytearray)) for p in parts):
+            return b"".join(parts)
+        return "".join(safe_str(p) for p in parts)
+
+    def _unescape(self, string):
+        if string not in self._unescaped:
+            self._unescaped[string] = unescape(string)
+        return self._unescaped[string]
+
+
+class TemplateVariable:
+    """Variable in a :class:`ReplacementTemplate`."""
+
+    def __init__(self, match: VariableMatch):
+        self.match = match
+        # Bases without possible nested variables can be resolved beforehand.
+        if "{" in match.base:
+            self.base = None
+        else:
+            self.base = unescape_variable_syntax(match.base)
+
+    def replace(self, replacer: VariableReplacer, ignore_errors=False):
+        m = self.match
+        match = VariableMatch(
+            m.string, m.identifier, self.base or m.base, m.type, m.items, m.start, m.end
+        )
+        return replacer._get_variable_value(
+            match, ignore_errors, resolve_base=self.base is None
+        )
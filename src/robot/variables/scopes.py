@@ -72,7 +72,7 @@ class VariableScopes:
         self._variables_set.end_suite()
 
     def start_test(self):
-        self._test = self._suite.copy(update=self._suite_locals[-1])
+        self._test = self._suite.layered_copy(update=self._suite_locals[-1])
         self._scopes.append(self._test)
         self._variables_set.start_test()
 
@@ -83,7 +83,7 @@ class VariableScopes:
 
     def start_keyword(self):
         update = self._suite_locals[-1] if self._test else None
-        kw = self._suite.copy(update)
+        kw = self._suite.layered_copy(update)
         self._variables_set.start_keyword()
         self._variables_set.update(kw)
         self._scopes.append(kw)
@@ -141,6 +141,10 @@ class VariableScopes:
 
     def set_suite(self, name, value, top=False, children=False):
         if top:
+            # Scopes started earlier must not see the new value. They share
+            # unchanged variables with the suite, so the old value is detached.
+            for scope in self._scopes[2:]:
+                scope.store.detach(name)
             self._scopes[1][name] = value
             return
         for scope in self._scopes_until_suite:
@@ -173,6 +177,15 @@ class VariableScopes:
     def as_dict(self, decoration=True):
         return self.current.as_dict(decoration=decoration)
 
+    def as_dict_for_child_suite(self, decoration=True):
+        """Returns variables that a child suite of the current suite would see.
+
+        New in Robot Framework 7.5.
+        """
+        variables = self._global.copy()
+        self._variables_set.update(variables)
+        return variables.as_dict(decoration=decoration)
+
 
 class GlobalVariables(Variables):
     _import_by_path_ends = (".py", "/", os.sep, ".yaml", ".yml", ".json")
@@ -181,6 +194,8 @@ class GlobalVariables(Variables):
         super().__init__()
         self._set_built_in_variables(settings)
         self._set_cli_variables(settings)
+        for name, value in settings.worker_variables.items():
+            self[name] = value
 
     def _set_cli_variables(self, settings):
         for name, args in settings.variable_files:
@@ -23,6 +23,107 @@ from .resolvable import GlobalVariableValue, Resolvable
 from .search import search_variable
 
 
+class LayeredData(NormalizedDict):
+    """Variable data that falls back to the data of a parent scope.
+
+    Only variables set in this scope are stored locally. Variables removed in
+    this scope are hidden from the parent data. Changes in the parent data are
+    visible unless the same variable has been set or removed locally.
+    """
+
+    def __init__(self, parent: NormalizedDict):
+        super().__init__(ignore="_")
+        self.parent = parent
+        self._normalize = parent._normalize
+        self._removed = set()
+
+    def _in_parent(self, norm_key: str) -> bool:
+        return norm_key in self.parent._data and norm_key not in self._removed
+
+    def __getitem__(self, key):
+        if not isinstance(key, str):
+            raise KeyError(key)
+        norm_key = self._normalize(key)
+        if norm_key in self._data:
+            return self._data[norm_key]
+        if self._in_parent(norm_key):
+            return self.parent._data[norm_key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if isinstance(key, str):
+            norm_key = self._normalize(key)
+            if norm_key not in self._keys and self._in_parent(norm_key):
+                # Preserve the original name like copying parent data would.
+                key = self.parent._keys[norm_key]
+            self._removed.discard(norm_key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        if not isinstance(key, str):
+            raise KeyError(key)
+        norm_key = self._normalize(key)
+        if norm_key not in self._data and not self._in_parent(norm_key):
+            raise KeyError(key)
+        self._data.pop(norm_key, None)
+        self._keys.pop(norm_key, None)
+        self._removed.add(norm_key)
+
+    def __contains__(self, key):
+        if not isinstance(key, str):
+            return False
+        norm_key = self._normalize(key)
+        return norm_key in self._data or self._in_parent(norm_key)
+
+    @property
+    def normalized_keys(self) -> "tuple[str, ...]":
+        keys = dict.fromkeys(self.parent._keys)
+        keys.update(self._keys)
+        return tuple(k for k in keys if k in self._data or self._in_parent(k))
+
+    def __iter__(self):
+        for norm_key in sorted(self.normalized_keys):
+            if norm_key in self._keys:
+                yield self._keys[norm_key]
+            else:
+                yield self.parent._keys[norm_key]
+
+    def __len__(self):
+        return len(self.normalized_keys)
+
+    def detach(self, key: str):
+        """Stores the current value of ``key`` locally.
+
+        After that changes to the variable in the parent data are not visible.
+        """
+        norm_key = self._normalize(key)
+        if norm_key not in self._data:
+            if self._in_parent(norm_key):
+                self[key] = self.parent._data[norm_key]
+            else:
+                self._removed.add(norm_key)
+
+    def __eq__(self, other):
+        return self.copy() == other
+
+    def clear(self):
+        super().clear()
+        self._removed.update(self.parent._keys)
+
+    def copy(self) -> NormalizedDict:
+        """Returns a normal :class:`NormalizedDict` containing all variables."""
+        copy = NormalizedDict(ignore="_")
+        copy._normalize = self._normalize
+        for norm_key in self.normalized_keys:
+            if norm_key in self._data:
+                copy._keys[norm_key] = self._keys[norm_key]
+                copy._data[norm_key] = self._data[norm_key]
+            else:
+                copy._keys[norm_key] = self.parent._keys[norm_key]
+                copy._data[norm_key] = self.parent._data[norm_key]
+        return copy
+
+
 class VariableStore:
 
     def __init__(self, variables):
@@ -78,6 +179,16 @@ class VariableStore:
     def update(self, store):
         self.data.update(store.data)
 
+    def detach(self, name, decorated=True):
+        """Makes changes to the variable in the parent scope invisible.
+
+        Only has an effect if the store is layered on top of another store.
+        """
+        if isinstance(self.data, LayeredData):
+            if decorated:
+                name = self._undecorate(name)
+            self.data.detach(name)
+
     def clear(self):
         self.data.clear()
 
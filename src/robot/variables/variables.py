@@ -17,7 +17,7 @@ from robot.utils import is_list_like, type_name
 
 from .filesetter import VariableFileSetter
 from .replacer import VariableReplacer
-from .store import VariableStore
+from .store import LayeredData, VariableStore
 from .tablesetter import VariableTableSetter
 
 
@@ -86,6 +86,26 @@ class Variables:
                     del variables[name]
         return variables
 
+    def layered_copy(self, update=None):
+        """Returns a copy that shares unchanged variables with these variables.
+
+        Unlike with :meth:`copy`, variables are not copied. The returned object
+        stores only variables set to it and falls back to these variables
+        otherwise. Changes to these variables are thus visible in the copy.
+        """
+        data = self.store.data
+        if isinstance(data, LayeredData):
+            data = data.copy()
+        variables = Variables()
+        variables.store.data = LayeredData(data)
+        if update:
+            for name, value in update.items():
+                if value is not None:
+                    variables[name] = value
+                else:
+                    del variables[name]
+        return variables
+
     def update(self, variables):
         self.store.update(variables.store)
 
@@ -64,6 +64,13 @@ class TestLibrary(unittest.TestCase):
 
         self._validate_lib(lib, "GLOBAL", "v", "HTML", "xx")
 
+    def test_reuse(self):
+        @library(scope="SUITE", reuse=True)
+        class lib:
+            pass
+
+        self._validate_lib(lib, "SUITE", reuse=True)
+
     def test_override_class_level_attributes(self):
         @library(
             doc_format="HTML",
@@ -89,12 +96,14 @@ class TestLibrary(unittest.TestCase):
         doc_format=None,
         listener=None,
         auto_keywords=False,
+        reuse=None,
     ):
         self._validate_attr(lib, "ROBOT_LIBRARY_SCOPE", scope)
         self._validate_attr(lib, "ROBOT_LIBRARY_VERSION", version)
         self._validate_attr(lib, "ROBOT_LIBRARY_DOC_FORMAT", doc_format)
         self._validate_attr(lib, "ROBOT_LIBRARY_LISTENER", listener)
         self._validate_attr(lib, "ROBOT_AUTO_KEYWORDS", auto_keywords)
+        self._validate_attr(lib, "ROBOT_LIBRARY_REUSE", reuse)
 
     def _validate_attr(self, lib, attr, value):
         if value is None:
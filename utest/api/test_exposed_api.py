@@ -24,6 +24,13 @@ class TestExposedApi(unittest.TestCase):
     def test_typeinfo(self):
         assert_equal(api.TypeInfo, running.TypeInfo)
 
+    def test_star_import(self):
+        namespace = {}
+        exec("from robot.api import *", namespace)
+        for name in ("ExecutionResult", "TestSuite", "Token", "SkipExecution"):
+            assert_equal(namespace[name], getattr(api, name))
+        assert_true("import_module" not in namespace)
+
     def test_deprecated_parsing(self):
         assert_equal(api.get_model, parsing.get_model)
         assert_equal(api.get_resource_model, parsing.get_resource_model)
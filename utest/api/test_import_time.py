@@ -0,0 +1,77 @@
+import subprocess
+import sys
+import unittest
+from os import environ
+from pathlib import Path
+
+ROOT = Path(__file__).absolute().parent.parent.parent
+GOLDEN_XML = ROOT / "utest/result/golden.xml"
+# The budget is generous, but it is still clearly lower than the number of
+# modules imported if everything would be imported eagerly. Import time itself
+# is not verified, because it depends too much on the machine and its load.
+MODULE_BUDGET = 60
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_import_robot(self):
+        modules = self._import("-c", "import robot")
+        self._verify_not_imported(modules, "running", "result", "parsing", "output")
+        self._verify_budget(modules)
+
+    def test_import_api(self):
+        modules = self._import("-c", "import robot.api")
+        self._verify_not_imported(modules, "running", "result", "parsing", "output")
+        self._verify_budget(modules)
+
+    def test_robot_version(self):
+        modules = self._import("-m", "robot", "--version")
+        self._verify_not_imported(modules, "running", "parsing", "reporting")
+
+    def test_rebot(self):
+        options = ["--output", "NONE", "--log", "NONE", "--report", "NONE"]
+        modules = self._import("-m", "robot.rebot", *options, str(GOLDEN_XML))
+        self._verify_not_imported(modules, "running", "parsing")
+
+    def test_libdoc_version(self):
+        modules = self._import("-m", "robot.libdoc", "--version")
+        self._verify_not_imported(modules, "running", "result", "parsing", "output")
+        self._verify_budget(modules)
+
+    def _import(self, *args):
+        # With `-X importtime` each imported module is reported to stderr.
+        env = dict(environ, PYTHONPATH=str(ROOT / "src"))
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", *args],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            encoding="UTF-8",
+        )
+        if "Traceback" in process.stderr:
+            raise AssertionError(f"Running {args} failed:\n{process.stderr}")
+        modules = set()
+        for line in process.stderr.splitlines():
+            if line.startswith("import time:") and "|" in line:
+                name = line.split("|")[-1].strip()
+                if name != "imported package":
+                    modules.add(name)
+        return modules
+
+    def _verify_not_imported(self, modules, *packages):
+        for package in packages:
+            name = f"robot.{package}"
+            if name in modules:
+                raise AssertionError(f"'{name}' was imported.")
+
+    def _verify_budget(self, modules):
+        robot_modules = [m for m in modules if m.split(".")[0] == "robot"]
+        if len(robot_modules) > MODULE_BUDGET:
+            raise AssertionError(
+                f"Imported {len(robot_modules)} Robot Framework modules, "
+                f"budget is {MODULE_BUDGET}."
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+"""Helper script to benchmark tokenizing Robot Framework data.
+
+usage: utest/benchmark_tokenizer.py [options] [path ...]
+
+options:
+    -r, --rounds N    Number of rounds to run. The best round is reported.
+                      Default is 3.
+    -m, --multiply N  Repeat data N times to get a bigger corpus.
+                      Default is 4.
+    -h, --help        Show help
+
+`path` is a data file or a directory containing data files. All data files
+are concatenated and tokenized both with and without `data_only`. If no
+path is given, all data files under `atest/testdata` are used.
+
+examples:
+$ utest/benchmark_tokenizer.py
+$ utest/benchmark_tokenizer.py --rounds 5 path/to/tests
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+base = Path(__file__).absolute().parent
+sys.path.insert(0, str(base.parent / "src"))
+
+from robot.parsing.lexer.tokenizer import Tokenizer  # noqa: E402
+
+EXTENSIONS = {".robot", ".resource"}
+
+
+def get_data(paths):
+    data = []
+    for path in paths:
+        if path.is_dir():
+            files = sorted(p for p in path.rglob("*") if p.suffix in EXTENSIONS)
+        else:
+            files = [path]
+        for file in files:
+            data.append(file.read_text(encoding="UTF-8", errors="replace"))
+    return "\n".join(data)
+
+
+def benchmark(data, data_only, rounds):
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in Tokenizer().tokenize(data, data_only):
+            pass
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(args):
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("-r", "--rounds", type=int, default=3)
+    parser.add_argument("-m", "--multiply", type=int, default=4)
+    parser.add_argument("-h", "--help", action="store_true")
+    parser.add_argument("paths", nargs="*", type=Path)
+    opts = parser.parse_args(args)
+    if opts.help:
+        print(__doc__)
+        return 251
+    paths = opts.paths or [base.parent / "atest" / "testdata"]
+    data = "\n".join([get_data(paths)] * opts.multiply)
+    size = len(data.encode("UTF-8")) / 1024 / 1024
+    lines = data.count("\n") + 1
+    print(f"Data: {size:.1f} MB, {lines} lines")
+    for name, data_only in [("full", False), ("data only", True)]:
+        elapsed = benchmark(data, data_only, opts.rounds)
+        print(f"{name:10} {elapsed:.3f} s ({size / elapsed:.1f} MB/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
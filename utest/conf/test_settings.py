@@ -82,6 +82,33 @@ class TestRobotAndRebotSettings(unittest.TestCase):
                     re.sub(r"20\d{6}-\d{6}", "<timestamp>", path.name),
                 )
 
+    def test_compressed_output_files_with_timestamps(self):
+        for value in "test.xml.gz", "test.json.xz":
+            path = RobotSettings({"output": value, "timestampoutputs": True}).output
+            base, ext = value.split(".", 1)
+            assert_equal(
+                f"{base}-<timestamp>.{ext}",
+                re.sub(r"20\d{6}-\d{6}", "<timestamp>", path.name),
+            )
+
+    def test_compression_level(self):
+        assert_equal(RobotSettings().compression_level, 1)
+        assert_equal(RebotSettings().compression_level, 1)
+        for value in "0", "9", 5:
+            for settings in RobotSettings, RebotSettings:
+                level = settings(compressionlevel=value).compression_level
+                assert_equal(level, int(value))
+        for value in "10", "-1", "fast":
+            for settings in RobotSettings, RebotSettings:
+                self.assertRaises(DataError, settings, compressionlevel=value)
+
+    def test_coordinator_timeout(self):
+        assert_equal(RobotSettings().coordinator_timeout, 600)
+        for value, expected in [("1 minute", 60), ("0.5", 0.5), ("0", None)]:
+            timeout = RobotSettings(coordinatortimeout=value).coordinator_timeout
+            assert_equal(timeout, expected)
+        self.assertRaises(DataError, RobotSettings, coordinatortimeout="invalid")
+
     def test_result_files_as_none(self):
         for name in "Output", "Report", "Log", "XUnit", "DebugFile":
             attr = (name[:-4] if name.endswith("File") else name).lower()
@@ -7,7 +7,8 @@ from pathlib import Path
 from parsing_test_utils import assert_model, remove_non_data
 
 from robot.parsing import (
-    get_model, get_resource_model, ModelTransformer, ModelVisitor, Token
+    get_model, get_resource_model, ModelTransformer, ModelVisitor, Token, update_model,
+    update_resource_model
 )
 from robot.parsing.model.blocks import (
     File, For, Group, If, ImplicitCommentSection, InvalidSection, Keyword,
@@ -236,6 +237,132 @@ class TestSaveModel(unittest.TestCase):
             assert_raises_with_msg(TypeError, message, get_model(f).save)
 
 
+class TestUpdateModel(unittest.TestCase):
+    data = """\
+# Language: fi
+*** Settings ***
+Test Setup        Log    Setup
+
+*** Variables ***
+${VAR}            value
+@{LIST}           a    b
+...               c    # comment
+
+*** Test Cases ***
+# Comment before tests.
+First
+    Keyword    ${VAR}
+    FOR    ${x}    IN    @{LIST}
+        Log    ${x}
+    END
+
+Second
+    [Template]    Log
+    arg    # comment
+    ...    more
+
+*** Keywords ***
+Keyword
+    [Arguments]    ${arg}
+    IF    $arg    Log    ${arg}    ELSE    Fail
+"""
+
+    def test_edit_inside_test(self):
+        model = get_model(self.data)
+        keywords = model.sections[-1]
+        second = model.sections[-2].body[2]
+        self._update(model, (13, 4), (13, 11), "Log")
+        assert_equal(model.sections[-2].body[1].body[0].keyword, "Log")
+        assert_equal(model.sections[-1] is keywords, True)
+        assert_equal(model.sections[-2].body[2] is second, True)
+
+    def test_adding_lines_updates_following_line_numbers(self):
+        model = get_model(self.data)
+        keyword = model.sections[-1].body[0]
+        self._update(model, (14, 0), (14, 0), "    No Operation\n" * 3)
+        assert_equal(model.sections[-1].body[0] is keyword, True)
+        assert_equal(keyword.lineno, 27)
+
+    def test_removing_test_name(self):
+        model = get_model(self.data)
+        self._update(model, (18, 0), (18, 6), "")
+        assert_equal(len(model.sections[-2].body), 2)
+
+    def test_adding_test(self):
+        model = get_model(self.data)
+        self._update(model, (17, 0), (17, 0), "Third\n    No Operation\n")
+        assert_equal(len(model.sections[-2].body), 4)
+
+    def test_continuation_after_comments_and_empty_lines(self):
+        data = "*** Variables ***\n${A}    1\n# comment\n\n${B}    2\n"
+        model = get_model(data)
+        self._update(model, (5, 0), (5, 4), "...", data)
+        assert_equal(model.sections[0].body[0].value, ("1", "2"))
+
+    def test_edits_affecting_other_sections(self):
+        for start, end, text in [
+            ((1, 0), (1, 0), "Language: fi\n"),
+            ((3, 0), (3, 10), "Test Template"),
+            ((10, 0), (10, 0), "*** Keywords ***\n"),
+            ((11, 0), (11, 0), "*** Settings ***\nTest Template    Log\n"),
+            ((12, 0), (12, 0), "...    "),
+            ((23, 0), (24, 0), ""),
+        ]:
+            self._update(get_model(self.data), start, end, text)
+
+    def test_every_line_with_different_edits(self):
+        lines = self.data.splitlines(keepends=True)
+        for lineno, line in enumerate(lines, start=1):
+            for start, end in [(0, 0), (0, len(line) - 1), (4, 4), (0, None)]:
+                start = (lineno, min(start, len(line) - 1))
+                end = (lineno, min(end, len(line) - 1)) if end is not None else None
+                end = end or (lineno + 1, 0)
+                for text in ["", "\n", "X", "    ", "...    X", "# X", "END\n"]:
+                    self._update(get_model(self.data), start, end, text)
+
+    def test_resource_file(self):
+        data = "*** Keywords ***\nKeyword\n    No Operation\n"
+        model = get_resource_model(data)
+        update_resource_model(model, (3, 4), (3, 16), "Log    Hello!")
+        expected = get_resource_model(data.replace("No Operation", "Log    Hello!"))
+        assert_model(model, expected)
+
+    def test_data_only_model_is_not_supported(self):
+        assert_raises_with_msg(
+            ValueError,
+            "Updating model requires model created using 'data_only=False'.",
+            update_model,
+            get_model(self.data, data_only=True),
+            (1, 0),
+            (1, 0),
+            "",
+        )
+
+    def test_invalid_position(self):
+        for position in [(100, 0), (17, 1), (13, 22), (13, -1)]:
+            assert_raises_with_msg(
+                ValueError,
+                f"Invalid position {position}.",
+                update_model,
+                get_model(self.data),
+                position,
+                position,
+                "x",
+            )
+
+    def test_position_at_end_of_line(self):
+        self._update(get_model(self.data), (17, 0), (17, 0), "x")
+        self._update(get_model(self.data), (13, 21), (13, 21), "    x")
+
+    def _update(self, model, start, end, text, data=None):
+        lines = (data or self.data).splitlines(keepends=True)
+        start_offset = sum(len(line) for line in lines[: start[0] - 1]) + start[1]
+        end_offset = sum(len(line) for line in lines[: end[0] - 1]) + end[1]
+        data = "".join(lines)
+        expected = get_model(data[:start_offset] + text + data[end_offset:])
+        assert_model(update_model(model, start, end, text), expected)
+
+
 class TestForLoop(unittest.TestCase):
 
     def test_valid(self):
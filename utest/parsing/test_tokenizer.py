@@ -1,4 +1,5 @@
 import unittest
+from pathlib import Path
 
 from robot.parsing.lexer.tokenizer import Tokenizer
 from robot.parsing.lexer.tokens import Token
@@ -1103,5 +1104,47 @@ class TestComments(unittest.TestCase):
         )
 
 
+class TestDataOnly(unittest.TestCase):
+    data_dir = Path(__file__).parent / "../../atest/testdata"
+
+    def test_same_data_tokens_as_when_tokenizing_all(self):
+        for path in sorted(self.data_dir.glob("parsing/**/*.robot")):
+            if path.parent.name == "invalid_encoding":
+                continue
+            data = path.read_text(encoding="UTF-8")
+            assert_equal(
+                self._tokenize(data, data_only=True),
+                self._tokenize(data),
+                str(path),
+            )
+
+    def test_mixed_formats_and_edge_cases(self):
+        data = (
+            "*** Test Cases ***\n"
+            "| Test | Keyword | arg |  |\n"
+            "| | ... | more | # comment | ignored |\n"
+            "Test 2\n"
+            " # comment\n"
+            "\t...\n"
+            "    ...    \n"
+            "    ...    ...    # comment\n"
+            "\tKeyword\t\targ\t#\n"
+            "| | | # comment\n"
+        )
+        assert_equal(self._tokenize(data, data_only=True), self._tokenize(data))
+
+    def _tokenize(self, data, data_only=False):
+        statements = []
+        for statement in Tokenizer().tokenize(data, data_only):
+            tokens = [
+                (t.type, t.value, t.lineno, t.col_offset)
+                for t in statement
+                if t.type is None
+            ]
+            if tokens:
+                statements.append(tokens)
+        return statements
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -139,6 +139,9 @@ class StubSettings:
     xunit_skip_noncritical = False
     expand_keywords = None
     legacy_output = False
+    shard_timings = None
+    index = False
+    compression_level = 1
 
     def __init__(self, **settings):
         self.__dict__.update(settings)
@@ -0,0 +1,194 @@
+import unittest
+
+from robot.errors import DataError
+from robot.result import Result, TestSuite
+from robot.result.merger import Merger
+from robot.utils.asserts import assert_equal, assert_raises_with_msg
+
+MERGE_HEADER = (
+    '<span class="merge">Test has been re-executed and results merged.</span>'
+)
+SKIP_HEADER = (
+    "*HTML* Test has been re-executed and results merged. Latter result had "
+    '<span class="skip">SKIP</span> status and was ignored. Message:\n'
+)
+
+
+def create_suite(name, *tests, suites=()):
+    suite = TestSuite(name=name)
+    for test, status, message in tests:
+        suite.tests.create(name=test, status=status, message=message)
+    for child in suites:
+        suite.suites.append(child)
+    return suite
+
+
+def status(state, status, message=""):
+    text = (
+        f'<span class="{state.lower()}-status">{state} status:</span> '
+        f'<span class="{status.lower()}">{status}</span><br>'
+    )
+    if message:
+        text += f'<span class="{state.lower()}-message">{state} message:</span> '
+        text += f"{message}<br>"
+    return text
+
+
+def merge_message(*statuses, html=True):
+    message = "<hr>".join([MERGE_HEADER, *statuses])
+    return f"*HTML* {message}" if html else message
+
+
+class TestMerger(unittest.TestCase):
+
+    def setUp(self):
+        self.suite = create_suite(
+            "Root",
+            ("A", "PASS", ""),
+            ("B", "FAIL", "Old B"),
+            ("C", "PASS", ""),
+            suites=[create_suite("Child", ("D", "PASS", ""))],
+        )
+        self.merger = Merger(Result(suite=self.suite))
+
+    def merge(self, *tests, suites=()):
+        merged = create_suite("Root", *tests, suites=suites)
+        self.merger.merge(Result(suite=merged))
+
+    def verify_tests(self, suite, *expected):
+        actual = [(t.name, t.status, t.message) for t in suite.tests]
+        assert_equal(actual, list(expected))
+
+    def test_replaced_test_keeps_its_position(self):
+        self.merge(("B", "PASS", "New B"))
+        self.verify_tests(
+            self.suite,
+            ("A", "PASS", ""),
+            (
+                "B",
+                "PASS",
+                merge_message(
+                    status("New", "PASS", "New B"), status("Old", "FAIL", "Old B")
+                ),
+            ),
+            ("C", "PASS", ""),
+        )
+
+    def test_merging_same_test_multiple_times(self):
+        self.merge(("B", "FAIL", "Second"))
+        self.merge(("B", "PASS", ""))
+        self.verify_tests(
+            self.suite,
+            ("A", "PASS", ""),
+            (
+                "B",
+                "PASS",
+                merge_message(
+                    status("New", "PASS"),
+                    status("Old", "FAIL", "Second"),
+                    status("Old", "FAIL", "Old B"),
+                ),
+            ),
+            ("C", "PASS", ""),
+        )
+
+    def test_added_test(self):
+        self.merge(("New", "FAIL", "<b>Bang</b>"))
+        self.verify_tests(
+            self.suite,
+            ("A", "PASS", ""),
+            ("B", "FAIL", "Old B"),
+            ("C", "PASS", ""),
+            (
+                "New",
+                "FAIL",
+                "*HTML* Test added from merged output.<hr>&lt;b&gt;Bang&lt;/b&gt;",
+            ),
+        )
+
+    def test_added_test_is_found_in_later_merges(self):
+        self.merge(("New", "FAIL", ""), ("Other", "PASS", ""))
+        self.merge(("Other", "FAIL", "Second"), ("New", "PASS", ""))
+        self.verify_tests(
+            self.suite,
+            ("A", "PASS", ""),
+            ("B", "FAIL", "Old B"),
+            ("C", "PASS", ""),
+            (
+                "New",
+                "PASS",
+                merge_message(
+                    status("New", "PASS"),
+                    status("Old", "FAIL", "Test added from merged output."),
+                ),
+            ),
+            (
+                "Other",
+                "FAIL",
+                merge_message(
+                    status("New", "FAIL", "Second"),
+                    status("Old", "PASS", "Test added from merged output."),
+                ),
+            ),
+        )
+
+    def test_skipped_test_is_ignored(self):
+        self.merge(("B", "SKIP", "Skipped"), ("C", "SKIP", ""))
+        self.verify_tests(
+            self.suite,
+            ("A", "PASS", ""),
+            ("B", "FAIL", SKIP_HEADER + "Skipped<hr>Original message:\nOld B"),
+            ("C", "PASS", SKIP_HEADER),
+        )
+
+    def test_first_test_with_same_name_is_used(self):
+        self.suite.tests.create(name="B", status="FAIL", message="Second B")
+        self.merge(("B", "PASS", ""))
+        self.merge(("B", "SKIP", "Skipped"))
+        replaced = merge_message(
+            status("New", "PASS"), status("Old", "FAIL", "Old B"), html=False
+        )
+        self.verify_tests(
+            self.suite,
+            ("A", "PASS", ""),
+            (
+                "B",
+                "PASS",
+                SKIP_HEADER + "Skipped<hr>Original message:\n" + replaced,
+            ),
+            ("C", "PASS", ""),
+            ("B", "FAIL", "Second B"),
+        )
+
+    def test_child_suites(self):
+        self.merge(
+            suites=[
+                create_suite("Child", ("D", "FAIL", ""), ("E", "PASS", "")),
+                create_suite("New", ("F", "PASS", "")),
+            ]
+        )
+        self.merge(suites=[create_suite("New", ("F", "FAIL", ""))])
+        child, new = self.suite.suites
+        self.verify_tests(
+            child,
+            ("D", "FAIL", merge_message(status("New", "FAIL"), status("Old", "PASS"))),
+            ("E", "PASS", "*HTML* Test added from merged output."),
+        )
+        assert_equal(new.message, "*HTML* Suite added from merged output.")
+        self.verify_tests(
+            new,
+            ("F", "FAIL", merge_message(status("New", "FAIL"), status("Old", "PASS"))),
+        )
+
+    def test_different_root_suites(self):
+        assert_raises_with_msg(
+            DataError,
+            "Cannot merge outputs containing different root suites. "
+            "Original suite is 'Root' and merged is 'Other'.",
+            self.merger.merge,
+            Result(suite=create_suite("Other")),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,7 @@ from pathlib import Path
 
 from robot.errors import DataError
 from robot.result import ExecutionResult, ExecutionResultBuilder, Result, TestSuite
+from robot.result.outputindex import OutputIndex
 from robot.utils.asserts import assert_equal, assert_false, assert_raises, assert_true
 
 CURDIR = Path(__file__).resolve().parent
@@ -222,6 +223,228 @@ class TestMergingSuites(unittest.TestCase):
         assert_true('<span class="old-message">Old message:</span>' not in message)
 
 
+class TestReadingInParallel(unittest.TestCase):
+
+    def test_combine(self):
+        sources = [GOLDEN_XML, CURDIR / "golden.xml", GOLDEN_XML_TWICE.encode("UTF-8")]
+        self._verify(ExecutionResult(*sources, processes=2), ExecutionResult(*sources))
+
+    def test_merge(self):
+        sources = [GOLDEN_XML, GOLDEN_XML, CURDIR / "golden.xml"]
+        self._verify(
+            ExecutionResult(*sources, merge=True, processes=3),
+            ExecutionResult(*sources, merge=True),
+        )
+
+    def test_keywords_are_flattened_and_omitted_in_workers(self):
+        for options in [
+            {"include_keywords": False},
+            {"flattened_keywords": ["name:*"]},
+        ]:
+            self._verify(
+                ExecutionResult(GOLDEN_XML, GOLDEN_XML, processes=2, **options),
+                ExecutionResult(GOLDEN_XML, GOLDEN_XML, **options),
+            )
+
+    def test_open_files_are_read_sequentially(self):
+        result = ExecutionResult(StringIO(GOLDEN_XML), GOLDEN_XML, processes=2)
+        self._verify(result, ExecutionResult(GOLDEN_XML, GOLDEN_XML))
+
+    def test_errors_are_reported(self):
+        assert_raises(
+            DataError, ExecutionResult, GOLDEN_XML, "<robot><invalid>", processes=2
+        )
+
+    def _verify(self, result, expected):
+        assert_equal(result.suite.to_dict(), expected.suite.to_dict())
+        assert_equal(
+            result.errors.messages.to_dicts(), expected.errors.messages.to_dicts()
+        )
+        assert_equal(result.rpa, expected.rpa)
+
+
+class TestReadingLazily(unittest.TestCase):
+
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.path = Path(self._tempdir.name, "output.xml")
+        suite = TestSuite(name="Root")
+        sub = suite.suites.create(name="Sub")
+        sub.setup.config(name="Suite setup", status="PASS")
+        test = sub.tests.create(name="Passing", status="PASS")
+        test.setup.config(name="Setup", status="PASS")
+        kw = test.body.create_keyword(name="Keyword", status="PASS")
+        kw.body.create_message("Hello!")
+        test.teardown.config(name="Teardown", status="PASS")
+        test = sub.tests.create(name="Failing", status="FAIL", message="Oops")
+        test.body.create_keyword(name="Fail", status="FAIL").body.create_message(
+            "Oops", level="FAIL"
+        )
+        sub.tests.create(name="Empty", status="FAIL", message="No body")
+        sub.teardown.config(name="Suite teardown", status="FAIL", message="Bang")
+        Result(suite=suite).save(self.path)
+        # Suite teardown failures are handled only with outputs created by Robot.
+        xml = self.path.read_bytes().replace(b'generator="Rebot', b'generator="Robot')
+        self.path.write_bytes(xml)
+
+    def tearDown(self):
+        self._tempdir.cleanup()
+
+    def test_bodies_are_read_when_accessed(self):
+        result = ExecutionResult(self.path, lazy=True)
+        test = result.suite.suites[0].tests[0]
+        assert_true(test._lazy_loader)
+        assert_equal(test.status, "FAIL")
+        assert_equal(test.body[0].name, "Keyword")
+        assert_equal(test.body[0].parent, test)
+        assert_equal(test.body[0].body[0].message, "Hello!")
+        assert_false(test._lazy_loader)
+        self._verify(result, ExecutionResult(self.path))
+
+    def test_setup_and_teardown_are_read_when_accessed(self):
+        result = ExecutionResult(self.path, lazy=True)
+        expected = ExecutionResult(self.path)
+        for test, exp in zip(result.suite.all_tests, expected.suite.all_tests):
+            assert_equal(test.has_setup, exp.has_setup)
+            assert_equal(test.has_teardown, exp.has_teardown)
+            assert_equal(test.setup.to_dict(), exp.setup.to_dict())
+            assert_equal(test.teardown.to_dict(), exp.teardown.to_dict())
+
+    def test_tests_without_body(self):
+        result = ExecutionResult(self.path, lazy=True)
+        test = result.suite.suites[0].tests[2]
+        assert_false(test._lazy_loader)
+        assert_equal(list(test.body), [])
+
+    def test_suite_teardown_failures(self):
+        result = ExecutionResult(self.path, lazy=True)
+        test = result.suite.suites[0].tests[0]
+        assert_equal(test.message, "Parent suite teardown failed:\nBang")
+        assert_equal(len(test.body), 1)
+        assert_equal(test.message, "Parent suite teardown failed:\nBang")
+
+    def test_index_is_not_saved_when_reading(self):
+        ExecutionResult(self.path, lazy=True)
+        assert_false(OutputIndex.get_path(self.path).exists())
+
+    def test_index_is_reused(self):
+        index_path = OutputIndex.get_path(self.path)
+        OutputIndex.build(self.path).save()
+        index = OutputIndex.load(self.path)
+        assert_equal(sorted(index.suites), ["s1", "s1-s1"])
+        assert_equal(sorted(index.tests), ["s1-s1-t1", "s1-s1-t2", "s1-s1-t3"])
+        assert_equal(index.tests["s1-s1-t3"][2:], [None, None])
+        mtime = index_path.stat().st_mtime_ns
+        self._verify(ExecutionResult(self.path, lazy=True), ExecutionResult(self.path))
+        assert_equal(index_path.stat().st_mtime_ns, mtime)
+
+    def test_write_for(self):
+        OutputIndex.write_for(self.path)
+        index = OutputIndex.load(self.path)
+        assert_equal(index.tests, OutputIndex.build(self.path).tests)
+        for name in "output.json", "output.JSON", "output.xml.gz", "output.xml.xz":
+            path = self.path.with_name(name)
+            OutputIndex.write_for(path)
+            assert_false(OutputIndex.get_path(path).exists())
+        OutputIndex.write_for(None)
+
+    def test_index_offsets(self):
+        index = OutputIndex.build(self.path)
+        data = self.path.read_bytes()
+        for name, offsets in [*index.suites.items(), *index.tests.items()]:
+            element = data[offsets[0] : offsets[1]].decode("UTF-8")
+            tag = "test" if "t" in name else "suite"
+            assert_true(element.startswith(f'<{tag} id="{name}"'), element)
+            assert_true(element.endswith(f"</{tag}>"), element)
+        start, end, body_start, body_end = index.tests["s1-s1-t1"]
+        assert_true(start < body_start < body_end < end)
+        assert_true(data[body_start:].startswith(b'<kw name="Setup" type="SETUP">'))
+        assert_true(data[body_end:].startswith(b"<status "))
+
+    def test_outdated_index_is_ignored(self):
+        OutputIndex.build(self.path).save()
+        self.path.write_bytes(self.path.read_bytes().replace(b"<kw", b"\n<kw"))
+        assert_equal(OutputIndex.load(self.path), None)
+        self._verify(ExecutionResult(self.path, lazy=True), ExecutionResult(self.path))
+
+    def test_index_is_outdated_if_modification_time_changes(self):
+        OutputIndex.build(self.path).save()
+        mtime = self.path.stat().st_mtime_ns
+        os.utime(self.path, ns=(mtime, mtime + 1))
+        assert_equal(OutputIndex.load(self.path), None)
+        self._verify(ExecutionResult(self.path, lazy=True), ExecutionResult(self.path))
+
+    def test_flattened_and_omitted_keywords(self):
+        for options in [
+            {"include_keywords": False},
+            {"flattened_keywords": ["name:*"]},
+            {"flattened_keywords": ["name:Keyword"]},
+        ]:
+            self._verify(
+                ExecutionResult(self.path, lazy=True, **options),
+                ExecutionResult(self.path, **options),
+            )
+
+    def test_in_memory_sources_are_read_normally(self):
+        result = ExecutionResult(GOLDEN_XML, lazy=True)
+        for test in result.suite.all_tests:
+            assert_false(test._lazy_loader)
+        self._verify(result, ExecutionResult(GOLDEN_XML))
+
+    def _verify(self, result, expected):
+        assert_equal(result.suite.to_dict(), expected.suite.to_dict())
+
+
+class TestCompressedOutputs(unittest.TestCase):
+
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.directory = Path(self._tempdir.name)
+        self.result = ExecutionResult(GOLDEN_XML)
+
+    def tearDown(self):
+        self._tempdir.cleanup()
+
+    def test_save_and_read(self):
+        for name in "out.xml.gz", "out.xml.xz", "out.json.gz", "out.json.xz":
+            path = self.directory / name
+            self.result.save(path)
+            for source in path, str(path):
+                result = ExecutionResult(source)
+                assert_equal(result.suite.to_dict(), self.result.suite.to_dict())
+                assert_equal(result.source, Path(source))
+
+    def test_files_are_compressed(self):
+        for name, magic in [("out.xml.gz", b"\x1f\x8b"), ("out.json.xz", b"\xfd7zXZ")]:
+            path = self.directory / name
+            self.result.save(path)
+            assert_equal(path.read_bytes()[: len(magic)], magic)
+
+    def test_compression_level(self):
+        sizes = []
+        for level in 0, 9:
+            path = self.directory / f"out-{level}.xml.gz"
+            self.result.save(path, compression_level=level)
+            sizes.append(path.stat().st_size)
+        assert_true(sizes[0] > sizes[1])
+
+    def test_combine_and_merge(self):
+        paths = [self.directory / "out.xml.gz", self.directory / "out.json.xz"]
+        for path in paths:
+            self.result.save(path)
+        for merge in False, True:
+            result = ExecutionResult(*paths, merge=merge)
+            expected = ExecutionResult(GOLDEN_XML, GOLDEN_XML, merge=merge)
+            assert_equal(result.suite.to_dict(), expected.suite.to_dict())
+
+    def test_lazy_reading_is_not_used(self):
+        path = self.directory / "out.xml.gz"
+        self.result.save(path)
+        result = ExecutionResult(path, lazy=True)
+        assert_equal(result.suite.to_dict(), self.result.suite.to_dict())
+        assert_false(OutputIndex.get_path(path).exists())
+
+
 class TestElements(unittest.TestCase):
 
     def test_nested_suites(self):
@@ -2,7 +2,7 @@ import unittest
 from enum import Enum
 
 from robot.running.arguments.argumentspec import ArgInfo, ArgumentSpec
-from robot.utils.asserts import assert_equal
+from robot.utils.asserts import assert_equal, assert_raises_with_msg
 
 
 class TestStringRepr(unittest.TestCase):
@@ -211,5 +211,64 @@ class TestArgInfo(unittest.TestCase):
             assert_equal(ArgInfo(kind).required, False)
 
 
+class TestConvert(unittest.TestCase):
+
+    def test_convert(self):
+        spec = ArgumentSpec(
+            positional_or_named=["a", "b", "c"],
+            var_positional="d",
+            named_only=["e"],
+            var_named="f",
+            defaults={"b": 1, "c": None},
+            types={"a": int, "d": float, "e": bool, "f": "list[int]"},
+        )
+        for _ in range(2):
+            assert_equal(
+                spec.convert(["1", "2", "", "3"], [("e", "yes"), ("x", "[1]")]),
+                ([1, 2, "", 3.0], [("e", True), ("x", [1])]),
+            )
+            assert_equal(
+                spec.convert([1, None, None], [("c", "None")]),
+                ([1, None, None], [("c", None)]),
+            )
+
+    def test_conversion_error(self):
+        spec = ArgumentSpec(positional_or_named=["a"], types={"a": int})
+        for _ in range(2):
+            assert_raises_with_msg(
+                ValueError,
+                "Argument 'a' got value 'x' that cannot be converted to integer.",
+                spec.convert,
+                ["x"],
+                [],
+            )
+
+    def test_dry_run(self):
+        spec = ArgumentSpec(positional_or_named=["a"], types={"a": int})
+        assert_equal(spec.convert(["${x}"], [], dry_run=True), (["${x}"], []))
+        assert_equal(spec.convert(["1"], [], dry_run=True), ([1], []))
+        assert_raises_with_msg(
+            ValueError,
+            "Argument 'a' got value '${x}' that cannot be converted to integer.",
+            spec.convert,
+            ["${x}"],
+            [],
+        )
+
+    def test_languages(self):
+        spec = ArgumentSpec(positional_or_named=["a"], types={"a": bool})
+        assert_equal(spec.convert(["kyllä"], []), (["kyllä"], []))
+        assert_equal(spec.convert(["kyllä"], [], languages="fi"), ([True], []))
+        assert_equal(spec.convert(["kyllä"], []), (["kyllä"], []))
+
+    def test_spec_changes_are_taken_into_account(self):
+        spec = ArgumentSpec(positional_or_named=["a"], types={"a": int})
+        assert_equal(spec.convert(["1"], []), ([1], []))
+        spec.types = {"a": float}
+        assert_equal(spec.convert(["1"], []), ([1.0], []))
+        spec.positional_or_named = ("b",)
+        assert_equal(spec.convert(["1"], []), (["1"], []))
+
+
 if __name__ == "__main__":
     unittest.main()
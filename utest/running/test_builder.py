@@ -1,8 +1,11 @@
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
+from robot.conf import Languages
 from robot.errors import DataError
-from robot.running import TestSuite, TestSuiteBuilder
+from robot.output import LOGGER
+from robot.running import ResourceFileBuilder, TestSuite, TestSuiteBuilder
 from robot.utils import Importer
 from robot.utils.asserts import assert_equal, assert_raises, assert_true
 
@@ -188,5 +191,131 @@ class TestTemplates(unittest.TestCase):
         assert_equal(test.template, "Expect Exactly Three Args")
 
 
+class TestParseCache(unittest.TestCase):
+
+    def setUp(self):
+        self._tempdir = TemporaryDirectory()
+        self.tempdir = Path(self._tempdir.name)
+        self.cache = self.tempdir / "cache"
+        self.data = self.tempdir / "data"
+        self.data.mkdir()
+
+    def tearDown(self):
+        self._tempdir.cleanup()
+
+    def _build(self, **config):
+        with LOGGER.record_messages() as messages:
+            suite = TestSuiteBuilder(parse_cache=self.cache, **config).build(self.data)
+        errors = [(m.message, m.level) for m in messages if m.level != "INFO"]
+        return suite, errors
+
+    def _write(self, name, content):
+        (self.data / name).write_text(content, encoding="UTF-8")
+
+    def test_cached_result_is_same_as_parsed(self):
+        self._write("__init__.robot", "*** Settings ***\nTest Tags    init\n")
+        self._write(
+            "suite.robot",
+            "*** Settings ***\nNon-existing    setting\n"
+            "*** Variables ***\n${X}    a    b    separator=-\n"
+            "*** Test Cases ***\nTest\n    Keyword    ${X}\n"
+            "*** Keywords ***\nKeyword\n    [Arguments]    ${arg: int}=1\n    No Op\n"
+            "Invalid ${x:(}\n    No Op\n",
+        )
+        expected = TestSuiteBuilder().build(self.data).to_dict()
+        parsed, errors = self._build()
+        cached, cached_errors = self._build()
+        assert_equal(parsed.to_dict(), expected)
+        assert_equal(cached.to_dict(), expected)
+        assert_equal(cached_errors, errors)
+        assert_equal(len(errors), 2)
+        assert_equal(len(list(self.cache.glob("*.json"))), 2)
+
+    def test_changed_file_is_parsed_again(self):
+        self._write("suite.robot", "*** Test Cases ***\nOld\n    No Op\n")
+        assert_equal(self._build()[0].suites[0].tests[0].name, "Old")
+        self._write("suite.robot", "*** Test Cases ***\nNew\n    No Op\n")
+        assert_equal(self._build()[0].suites[0].tests[0].name, "New")
+        assert_equal(len(list(self.cache.glob("*.json"))), 2)
+
+    def test_changed_init_file_affects_child_suites(self):
+        self._write("suite.robot", "*** Test Cases ***\nTest\n    No Op\n")
+        self._write("__init__.robot", "*** Settings ***\nTest Tags    old\n")
+        assert_equal(list(self._build()[0].suites[0].tests[0].tags), ["old"])
+        self._write("__init__.robot", "*** Settings ***\nTest Tags    new\n")
+        assert_equal(list(self._build()[0].suites[0].tests[0].tags), ["new"])
+        assert_equal(list(self._build()[0].suites[0].tests[0].tags), ["new"])
+
+    def test_languages_declared_in_files(self):
+        self._write("suite.robot", "Language: fi\n*** Testit ***\nTest\n    No Op\n")
+        for _ in range(2):
+            languages = Languages()
+            suite, _ = self._build(lang=languages)
+            assert_equal(suite.suites[0].tests[0].name, "Test")
+            assert_true("Oletetaan" in languages.bdd_prefixes)
+
+    def test_resource_file(self):
+        path = self.data / "example.resource"
+        path.write_text("*** Keywords ***\nKeyword\n    No Op\n", encoding="UTF-8")
+        for _ in range(2):
+            resource = ResourceFileBuilder(parse_cache=self.cache).build(path)
+            assert_equal(resource.keywords[0].name, "Keyword")
+            assert_equal(resource.source, path)
+        assert_equal(len(list(self.cache.glob("*.json"))), 1)
+
+    def test_invalid_cache_entry_is_ignored(self):
+        self._write("suite.robot", "*** Test Cases ***\nTest\n    No Op\n")
+        self._build()
+        for entry in self.cache.glob("*.json"):
+            entry.write_text("{invalid", encoding="UTF-8")
+        assert_equal(self._build()[0].suites[0].tests[0].name, "Test")
+        assert_equal(self._build()[0].suites[0].tests[0].name, "Test")
+
+
+class TestParallelParsing(unittest.TestCase):
+
+    def _build(self, *paths, lang=None, processes=1):
+        # Languages are shared and mutated during parsing, so use a fresh instance.
+        lang = Languages(lang) if lang is not None else None
+        with LOGGER.record_messages() as messages:
+            suite = TestSuiteBuilder(lang=lang, processes=processes).build(*paths)
+        return suite.to_dict(), [(m.message, m.level) for m in messages]
+
+    def _verify(self, *paths, lang=None):
+        expected = self._build(*paths, lang=lang)
+        assert_equal(self._build(*paths, lang=lang, processes=2), expected)
+
+    def test_same_result_as_sequentially(self):
+        self._verify(DATADIR, lang=[])
+
+    def test_defaults_from_init_files(self):
+        self._verify(DATADIR / "suites")
+
+    def test_languages_declared_in_files(self):
+        translations = DATADIR / "../parsing/translations"
+        self._verify(
+            translations / "finnish",
+            translations / "per_file_config",
+            DATADIR / "pass_and_fail.robot",
+            lang=["fi"],
+        )
+
+    def test_parsing_errors(self):
+        with TemporaryDirectory() as tempdir:
+            path = Path(tempdir)
+            (path / "a.robot").write_text("*** Test Cases ***\nT\n    No Op\n")
+            (path / "b.robot").write_text("*** Invalid ***\n", encoding="UTF-8")
+            (path / "c.robot").write_bytes(b"*** Test Cases ***\n\xff\n")
+            for processes in 1, 2:
+                with LOGGER.record_messages() as messages:
+                    error = assert_raises(
+                        DataError,
+                        TestSuiteBuilder(processes=processes).build,
+                        path,
+                    )
+                assert_true(str(error).startswith(f"Parsing '{path / 'c.robot'}'"))
+                assert_equal([m.level for m in messages].count("ERROR"), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,182 @@
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from io import BytesIO, StringIO
+from os import environ, getenv
+from os.path import abspath, dirname, join
+from threading import Thread
+
+from robot.conf import RobotSettings
+from robot.errors import DataError
+from robot.result import ExecutionResult
+from robot.running import TestSuite
+from robot.running.distributed import (
+    Coordinator, receive_message, run_worker, send_message
+)
+from robot.utils.asserts import assert_equal, assert_raises, assert_true
+
+ROOT = dirname(dirname(dirname(abspath(__file__))))
+TEMP = getenv("TEMPDIR", tempfile.gettempdir())
+
+
+def get_free_port():
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+class FakeWorker(Thread):
+
+    def __init__(self, port, disconnect=False):
+        super().__init__(daemon=True)
+        self.port = port
+        self.disconnect = disconnect
+        self.units = []
+
+    def run(self):
+        with socket.create_connection(("localhost", self.port)) as connection:
+            with connection.makefile("rwb") as stream:
+                while True:
+                    send_message(stream, {"type": "ready"})
+                    header, _ = receive_message(stream)
+                    if header["type"] == "done" or self.disconnect:
+                        return
+                    self.units.append(header["suite"]["name"])
+                    payload = b'{"suite": {"name": "%d"}}' % header["id"]
+                    message = {"type": "result", "id": header["id"], "stop": False}
+                    send_message(stream, message, payload)
+
+
+class TestMessages(unittest.TestCase):
+
+    def test_send_and_receive(self):
+        stream = BytesIO()
+        send_message(stream, {"type": "result", "id": 1}, b"payload\nwith newline")
+        send_message(stream, {"type": "ready"})
+        stream.seek(0)
+        assert_equal(
+            receive_message(stream),
+            ({"type": "result", "id": 1, "size": 20}, b"payload\nwith newline"),
+        )
+        assert_equal(receive_message(stream), ({"type": "ready", "size": 0}, b""))
+        assert_raises(ConnectionError, receive_message, stream)
+
+
+class TestCoordinator(unittest.TestCase):
+
+    def setUp(self):
+        self.port = get_free_port()
+
+    def test_units_are_served_to_workers(self):
+        with Coordinator(("localhost", self.port)) as coordinator:
+            futures = [
+                coordinator.submit({"name": f"Unit {i}"}, RobotSettings())
+                for i in range(3)
+            ]
+            worker = FakeWorker(self.port)
+            worker.start()
+            results = [future.result(timeout=10) for future in futures]
+        worker.join(timeout=10)
+        assert_equal(worker.units, ["Unit 0", "Unit 1", "Unit 2"])
+        assert_equal(results[0], (b'{"suite": {"name": "1"}}', False))
+
+    def test_unit_is_given_to_another_worker_if_worker_disconnects(self):
+        with Coordinator(("localhost", self.port)) as coordinator:
+            future = coordinator.submit({"name": "Unit"}, RobotSettings())
+            first = FakeWorker(self.port, disconnect=True)
+            first.start()
+            first.join(timeout=10)
+            second = FakeWorker(self.port)
+            second.start()
+            assert_equal(future.result(timeout=10)[1], False)
+        assert_equal(second.units, ["Unit"])
+
+    def test_unit_fails_if_running_it_fails_too_many_times(self):
+        with Coordinator(("localhost", self.port)) as coordinator:
+            future = coordinator.submit({"name": "Unit"}, RobotSettings())
+            for _ in range(coordinator.max_attempts):
+                worker = FakeWorker(self.port, disconnect=True)
+                worker.start()
+                worker.join(timeout=10)
+            error = future.exception(timeout=10)
+        assert_equal(
+            str(error),
+            "Worker failed 3 times while running the unit. "
+            "Last error: Connection closed.",
+        )
+
+    def test_stopped_units_are_not_served(self):
+        with Coordinator(("localhost", self.port)) as coordinator:
+            coordinator.stop.set()
+            future = coordinator.submit({"name": "Unit"}, RobotSettings())
+            worker = FakeWorker(self.port)
+            worker.start()
+            assert_equal(future.result(timeout=10), (None, True))
+        worker.join(timeout=10)
+        assert_equal(worker.units, [])
+
+    def test_units_fail_if_no_workers_connect_during_timeout(self):
+        with Coordinator(("localhost", self.port), timeout=0.5) as coordinator:
+            futures = [
+                coordinator.submit({"name": f"Unit {i}"}, RobotSettings())
+                for i in range(2)
+            ]
+            errors = [future.exception(timeout=10) for future in futures]
+        for error in errors:
+            assert_equal(
+                str(error),
+                "No workers connected to the coordinator in 500 milliseconds.",
+            )
+
+    def test_timeout_is_not_used_when_workers_are_connected(self):
+        with Coordinator(("localhost", self.port), timeout=0.5) as coordinator:
+            with socket.create_connection(("localhost", self.port)):
+                future = coordinator.submit({"name": "Unit"}, RobotSettings())
+                time.sleep(1)
+                assert_true(not future.done())
+            assert_true(future.exception(timeout=10) is not None)
+
+    def test_worker_connection_fails(self):
+        assert_raises(DataError, run_worker, ("localhost", self.port), 0)
+
+
+class TestDistributedExecution(unittest.TestCase):
+
+    def test_run_with_remote_workers(self):
+        port = get_free_port()
+        env = dict(environ, PYTHONPATH=join(ROOT, "src"))
+        command = [sys.executable, "-m", "robot", "--worker", f"localhost:{port}"]
+        workers = [
+            subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL)
+            for _ in range(2)
+        ]
+        suite = TestSuite(name="Suite")
+        suite.setup.config(name="Set Global Variable", args=["${TOKEN}", "abc"])
+        for index in range(3):
+            test = suite.tests.create(name=f"Test {index}")
+            test.body.create_keyword("Log", args=[f"Message {index} ${{TOKEN}}"])
+        output = join(TEMP, "distributed-output.xml")
+        suite.run(
+            output=output,
+            coordinator=f"localhost:{port}",
+            stdout=StringIO(),
+            stderr=StringIO(),
+        )
+        for worker in workers:
+            assert_equal(worker.wait(timeout=30), 0)
+        result = ExecutionResult(output)
+        assert_equal(
+            [t.name for t in result.suite.tests], ["Test 0", "Test 1", "Test 2"]
+        )
+        for test in result.suite.tests:
+            assert_true(test.passed)
+            assert_equal(
+                test.body[0].messages[0].message, f"Message {test.name[-1]} abc"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
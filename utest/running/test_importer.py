@@ -41,6 +41,33 @@ class TestImportCache(unittest.TestCase):
         assert_raises(KeyError, self.cache.__getitem__, "nonex")
         assert_raises(KeyError, self.cache.__getitem__, ("lib1", ["wrong"]))
 
+    def test_mutable_values_in_keys(self):
+        key = ("lib", ["a"], {"x": [1, {"y": {2}}]})
+        self.cache[key] = "Mutable"
+        assert_equal(self.cache[("lib", ["a"], {"x": [1, {"y": {2}}]})], "Mutable")
+        assert_true(("lib", ["a"], {"x": [1, {"y": {3}}]}) not in self.cache)
+        assert_true(("lib", ("a1", "a2")) not in self.cache)
+
+    def test_unhashable_values_in_keys(self):
+        class Unhashable:
+            __hash__ = None
+
+            def __init__(self, value):
+                self.value = value
+
+            def __eq__(self, other):
+                return self.value == other.value
+
+        self.cache[("lib", [Unhashable(1)])] = "First"
+        self.cache[("lib", [Unhashable(2)])] = "Second"
+        self.cache[("lib", [Unhashable(1)])] = "Overwritten"
+        assert_equal(self.cache[("lib", [Unhashable(1)])], "Overwritten")
+        assert_equal(self.cache[("lib", [Unhashable(2)])], "Second")
+        assert_true(("lib", [Unhashable(3)]) not in self.cache)
+        assert_equal(
+            self.cache.values(), ["Library", "Resource", "Overwritten", "Second"]
+        )
+
     def test_invalid_key(self):
         assert_raises(FrameworkError, self.cache.__setitem__, ["inv"], None)
 
@@ -0,0 +1,270 @@
+import json
+import unittest
+from enum import Enum
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from robot.api.deco import keyword
+from robot.running.arguments import ArgumentSpec, TypeInfo
+from robot.running.librarycache import ArgumentSpecSerializer, LibraryCache
+from robot.running.testlibraries import TestLibrary
+from robot.utils.asserts import assert_equal, assert_raises, assert_true
+
+SOURCE = Path(__file__).absolute()
+
+
+class Color(Enum):
+    RED = 1
+    GREEN = 2
+
+
+class StaticLibrary:
+
+    @keyword(tags=["tag"])
+    def integers(self, a: int, b: "list[int]" = (1, 2), *rest: float) -> "int | None":
+        """Documentation."""
+        return a
+
+    @keyword("Embedded ${arg}")
+    def embedded(self, arg: Color = Color.RED):
+        return arg
+
+    def no_types(self, a, /, b=None, *, c, **kws):
+        pass
+
+
+class DynamicLibrary:
+    ROBOT_LIBRARY_CACHE = True
+    calls = []
+    names = ["First", "Second"]
+
+    def get_keyword_names(self):
+        return self.names
+
+    def run_keyword(self, name, args, kwargs):
+        return name
+
+    def get_keyword_arguments(self, name):
+        self.calls.append(name)
+        return ["a: int", "b=x"]
+
+    def get_keyword_types(self, name):
+        self.calls.append(name)
+        return {"b": "str"}
+
+    def get_keyword_documentation(self, name):
+        self.calls.append(name)
+        return f"Doc for {name}."
+
+    def get_keyword_tags(self, name):
+        return ["t"]
+
+
+class TestLibraryCache(unittest.TestCase):
+
+    def setUp(self):
+        self._tempdir = TemporaryDirectory()
+        self.directory = Path(self._tempdir.name)
+        self.cache = LibraryCache(self.directory)
+        DynamicLibrary.calls = []
+        DynamicLibrary.names = ["First", "Second"]
+
+    def tearDown(self):
+        self._tempdir.cleanup()
+
+    def _create(self, code):
+        lib = TestLibrary.from_code(code, source=SOURCE, create_keywords=False)
+        lib.create_keywords(self.cache)
+        return lib
+
+    def _assert_same_keywords(self, lib, expected):
+        assert_equal(
+            [self._keyword_info(kw) for kw in lib.keywords],
+            [self._keyword_info(kw) for kw in expected.keywords],
+        )
+
+    def _keyword_info(self, kw):
+        args = kw.args
+        return (
+            type(kw),
+            kw.name,
+            kw.doc,
+            tuple(kw.tags),
+            str(args),
+            args.defaults,
+            {n: (t.name, t.type, str(t)) for n, t in (args.types or {}).items()},
+            str(args.return_type),
+            kw.embedded.name.pattern if kw.embedded else None,
+        )
+
+    def test_static_library(self):
+        expected = TestLibrary.from_code(StaticLibrary)
+        created = self._create(StaticLibrary)
+        cached = self._create(StaticLibrary)
+        self._assert_same_keywords(created, expected)
+        self._assert_same_keywords(cached, expected)
+        assert_equal(len(list(self.directory.glob("*.json"))), 1)
+        kw = cached.find_keywords("Embedded green")[0]
+        assert_equal(kw.args.defaults["arg"], Color.RED)
+        assert_equal(kw.args.types["arg"].type, Color)
+
+    def test_standard_library(self):
+        expected = TestLibrary.from_name("BuiltIn")
+        for _ in range(2):
+            lib = TestLibrary.from_name("BuiltIn", create_keywords=False)
+            lib.create_keywords(self.cache)
+            self._assert_same_keywords(lib, expected)
+
+    def test_dynamic_library_methods_are_not_called_when_cached(self):
+        expected = TestLibrary.from_code(DynamicLibrary)
+        DynamicLibrary.calls = []
+        self._create(DynamicLibrary)
+        assert_equal(len(DynamicLibrary.calls), 6)
+        DynamicLibrary.calls = []
+        lib = self._create(DynamicLibrary)
+        assert_equal(DynamicLibrary.calls, [])
+        self._assert_same_keywords(lib, expected)
+
+    def test_dynamic_library_is_not_cached_without_permission(self):
+        class NotAllowed(DynamicLibrary):
+            ROBOT_LIBRARY_CACHE = False
+
+        self._create(NotAllowed)
+        DynamicLibrary.calls = []
+        self._create(NotAllowed)
+        assert_equal(len(DynamicLibrary.calls), 6)
+        assert_equal(list(self.directory.glob("*.json")), [])
+
+    def test_changed_keyword_names_invalidate_entry(self):
+        self._create(DynamicLibrary)
+        DynamicLibrary.names = ["First", "Third"]
+        DynamicLibrary.calls = []
+        lib = self._create(DynamicLibrary)
+        assert_equal([kw.name for kw in lib.keywords], ["First", "Third"])
+        assert_equal(len(DynamicLibrary.calls), 6)
+        DynamicLibrary.calls = []
+        self._create(DynamicLibrary)
+        assert_equal(DynamicLibrary.calls, [])
+
+    def test_invalid_references_are_ignored(self):
+        self._create(StaticLibrary)
+        for path in self.directory.glob("*.json"):
+            entry = json.loads(path.read_text(encoding="UTF-8"))
+            for info in entry["types"]:
+                if isinstance(info["type"], dict) and "ref" in info["type"]:
+                    info["type"]["ref"] = "non_existing_module:Class"
+            path.write_text(json.dumps(entry), encoding="UTF-8")
+        self._assert_same_keywords(
+            self._create(StaticLibrary), TestLibrary.from_code(StaticLibrary)
+        )
+
+    def test_entries_referring_to_not_allowed_modules_are_rebuilt(self):
+        self._create(StaticLibrary)
+        path = next(self.directory.glob("*.json"))
+        entry = json.loads(path.read_text(encoding="UTF-8"))
+        entry["keywords"]["no_types"]["args"]["defaults"]["b"] = {
+            "ref": "not_allowed_module:Class"
+        }
+        path.write_text(json.dumps(entry), encoding="UTF-8")
+        self._assert_same_keywords(
+            self._create(StaticLibrary), TestLibrary.from_code(StaticLibrary)
+        )
+        entry = json.loads(path.read_text(encoding="UTF-8"))
+        assert_equal(entry["keywords"]["no_types"]["args"]["defaults"]["b"], None)
+
+    def test_invalid_cache_entry_is_ignored(self):
+        self._create(StaticLibrary)
+        for path in self.directory.glob("*.json"):
+            path.write_text("{invalid", encoding="UTF-8")
+        self._assert_same_keywords(
+            self._create(StaticLibrary), TestLibrary.from_code(StaticLibrary)
+        )
+
+    def test_keywords_with_unreferable_types_are_not_cached(self):
+        class Local:
+            pass
+
+        class Library:
+            def local(self, arg: Local):
+                pass
+
+            def other(self, arg: int):
+                pass
+
+        expected = TestLibrary.from_code(Library)
+        for _ in range(2):
+            self._assert_same_keywords(self._create(Library), expected)
+        entry = json.loads(next(self.directory.glob("*.json")).read_text("UTF-8"))
+        assert_equal(entry["keywords"]["local"], None)
+        assert_true(entry["keywords"]["other"])
+
+
+class TestArgumentSpecSerializer(unittest.TestCase):
+
+    def test_roundtrip(self):
+        spec = ArgumentSpec(
+            "Keyword",
+            positional_or_named=["a", "b", "c"],
+            var_positional="args",
+            named_only=["d"],
+            defaults={"b": (1, None, ...), "c": Color.GREEN, "d": 1.5},
+            types={"a": "list[int]", "b": "tuple[int | None, ...]", "c": Color},
+            return_type="dict[str, int | float]",
+        )
+        serializer = ArgumentSpecSerializer(modules=[__name__])
+        data = json.loads(json.dumps(serializer.serialize(spec)))
+        types = json.loads(json.dumps(serializer.types))
+        restored = ArgumentSpecSerializer(types, [__name__]).deserialize(data)
+        assert_equal(str(restored), str(spec))
+        assert_equal(restored.defaults, spec.defaults)
+        for name, info in spec.types.items():
+            assert_equal(str(restored.types[name]), str(info))
+            assert_equal(restored.types[name].type, info.type)
+        assert_equal(str(restored.return_type), str(spec.return_type))
+
+    def test_types_are_stored_once(self):
+        serializer = ArgumentSpecSerializer()
+        for _ in range(3):
+            spec = ArgumentSpec("Kw", positional_or_named=["a"], types={"a": int})
+            serializer.serialize(spec)
+        assert_equal(len(serializer.types), 1)
+
+    def test_allowed_references(self):
+        serializer = ArgumentSpecSerializer(modules=["mylib"])
+        for reference in [
+            "builtins:int",
+            "collections.abc:Mapping",
+            "pathlib:Path",
+            "robot.utils.secret:Secret",
+            "mylib:Class",
+            "mylib.types:Class.Nested",
+        ]:
+            assert_true(serializer.is_allowed(reference), reference)
+        for reference in [
+            "subprocess:Popen",
+            "mylibx:Class",
+            "robotx:Class",
+            "builtins:int.__subclasses__",
+        ]:
+            assert_true(not serializer.is_allowed(reference), reference)
+
+    def test_references_to_not_allowed_modules_are_not_resolved(self):
+        types = [{"name": "X", "type": {"ref": "x:X"}, "nested": None}]
+        serializer = ArgumentSpecSerializer(types)
+        assert_raises(ValueError, serializer._restore_type, 0)
+        spec = ArgumentSpec("Kw", positional_or_named=["a"], defaults={"a": Color.RED})
+        assert_raises(TypeError, serializer.serialize, spec)
+
+    def test_unserializable_values(self):
+        serializer = ArgumentSpecSerializer()
+        for spec in [
+            {"defaults": {"a": object()}},
+            {"defaults": {"a": [1, 2]}},
+            {"types": {"a": TypeInfo("Local", type("Local", (), {}))}},
+        ]:
+            spec = ArgumentSpec("Kw", positional_or_named=["a"], **spec)
+            assert_raises(TypeError, serializer.serialize, spec)
+
+
+if __name__ == "__main__":
+    unittest.main()
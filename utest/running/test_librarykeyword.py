@@ -8,6 +8,7 @@ from pathlib import Path
 from ArgumentsPython import ArgumentsPython
 from classes import __file__ as classes_source, ArgInfoLibrary, DocLibrary, NameLibrary
 
+from robot.api.deco import keyword
 from robot.errors import DataError
 from robot.running.librarykeyword import DynamicKeyword, StaticKeyword
 from robot.running.testlibraries import DynamicLibrary, TestLibrary
@@ -445,6 +446,73 @@ class TestDynamicKeyword(unittest.TestCase):
         return DynamicKeyword.from_name("kw", lib)
 
 
+class TestDeferredArguments(unittest.TestCase):
+
+    def test_arguments_are_parsed_when_needed(self):
+        class Library:
+            def kw(self, a: int, b: "list[int] | None" = None) -> "dict[str, int]":
+                pass
+
+        lib = TestLibrary.from_code(Library)
+        kw = lib.keywords[0]
+        assert_true(kw._args_factory is not None)
+        assert_argspec(kw.args, 1, 2, ("a", "b"), defaults={"b": None})
+        assert_equal(str(kw.args.types["b"]), "list[int] | None")
+        assert_equal(kw.args.name, "Library.Kw")
+        assert_true(kw._args_factory is None)
+
+    def test_copy_does_not_parse_arguments(self):
+        class Library:
+            def kw(self, a: int):
+                pass
+
+        lib = TestLibrary.from_code(Library).copy("Alias")
+        kw = lib.keywords[0]
+        assert_true(kw._args_factory is not None)
+        assert_equal(kw.args.name, "Alias.Kw")
+        assert_equal(lib.find_keywords("Kw")[0].args.name, "Alias.Kw")
+
+    def test_arguments_are_parsed_immediately_if_parsing_can_fail(self):
+        class Library:
+            def invalid(self, a: "bad[type"):
+                pass
+
+            def non_matching(self, a: "int", b: "list[int, str]"):
+                pass
+
+            @keyword(types={"a": int})
+            def types_via_decorator(self, a):
+                pass
+
+        logger = LoggerMock()
+        lib = TestLibrary.from_code(Library, logger=logger)
+        assert_equal(
+            [kw.name for kw in lib.keywords if kw._args_factory is None],
+            ["Types Via Decorator"],
+        )
+        assert_equal(
+            [m for m, level in logger.messages if level == "ERROR"],
+            [
+                "Error in library 'Library': Adding keyword 'invalid' failed: "
+                "Parsing type 'bad[type' failed: Error at end: Closing ']' missing.",
+                "Error in library 'Library': Adding keyword 'non_matching' failed: "
+                "'list[]' requires exactly 1 parameter, 'list[int, str]' has 2.",
+            ],
+        )
+
+    def test_failing_deferred_arguments(self):
+        def fail():
+            raise DataError("Bang!")
+
+        logger = LoggerMock()
+        lib = TestLibrary.from_code(NameLibrary, logger=logger)
+        kw = StaticKeyword("simple1", lib, "Kw", args=fail)
+        assert_equal(kw.args.var_positional, "args")
+        assert_equal(kw.error, "Bang!")
+        message = "Error in library 'NameLibrary': Adding keyword 'Kw' failed: Bang!"
+        assert_equal(logger.messages[-1], (message, "ERROR"))
+
+
 class TestSourceAndLineno(unittest.TestCase):
 
     def test_class_with_init(self):
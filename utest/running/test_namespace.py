@@ -3,8 +3,11 @@ import pkgutil
 import unittest
 
 from robot import libraries
-from robot.running import namespace
-from robot.utils.asserts import assert_equal
+from robot.conf import Languages
+from robot.errors import DataError
+from robot.output import Message
+from robot.running import namespace, ResourceFile
+from robot.utils.asserts import assert_equal, assert_raises, assert_true
 
 
 class TestNamespace(unittest.TestCase):
@@ -17,3 +20,68 @@ class TestNamespace(unittest.TestCase):
             if name[0].isupper() and not name.startswith("Deprecated")
         )
         assert_equal(set(exp_libs), namespace.STDLIBS)
+
+
+class TestKeywordStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = namespace.KeywordStore(ResourceFile(), Languages())
+        for name in "First", "Second":
+            resource = ResourceFile(source=f"/path/to/{name}.resource")
+            resource.keywords.create("Keyword")
+            resource.keywords.create("Only ${name}")
+            self.store.resources[str(resource.source)] = resource
+
+    def test_runners_are_cached(self):
+        self.store.search_order = ("First",)
+        runner = self.store.get_runner("Keyword")
+        assert_equal(runner.keyword.owner.name, "First")
+        assert_true(self.store.get_runner("Keyword").keyword is runner.keyword)
+
+    def test_cached_runners_are_copies(self):
+        self.store.search_order = ("First",)
+        runner = self.store.get_runner("Only ${name} is embedded")
+        assert_true(self.store.get_runner("Only ${name} is embedded") is not runner)
+
+    def test_search_order_clears_cache(self):
+        self.store.search_order = ("First",)
+        assert_equal(self.store.get_runner("Keyword").keyword.owner.name, "First")
+        self.store.search_order = ("Second",)
+        assert_equal(self.store.get_runner("Keyword").keyword.owner.name, "Second")
+
+    def test_clear_cache(self):
+        self.store.search_order = ("First",)
+        runner = self.store.get_runner("Keyword")
+        self.store.resources["/path/to/First.resource"].keywords.clear()
+        assert_true(self.store.get_runner("Keyword").keyword is runner.keyword)
+        self.store.clear_cache()
+        assert_equal(self.store.get_runner("Keyword").keyword.owner.name, "Second")
+
+    def test_failures_are_not_cached(self):
+        assert_raises(DataError, self.store.get_runner, "Non-existing", False)
+        assert_equal(len(self.store._runner_cache), 0)
+
+    def test_runners_with_pre_run_messages_are_not_cached(self):
+        self.store.search_order = ("First",)
+        get_runner = self.store._get_uncached_runner
+
+        def get_runner_with_message(name, recommend=True):
+            runner = get_runner(name, recommend)
+            runner.pre_run_messages += (Message("Caller specific", "WARN"),)
+            return runner
+
+        self.store._get_uncached_runner = get_runner_with_message
+        self.store.get_runner("Keyword")
+        assert_equal(len(self.store._runner_cache), 0)
+
+    def test_cache_size_is_limited(self):
+        self.store.search_order = ("First",)
+        self.store.runner_cache_size = 3
+        for index in range(5):
+            self.store.get_runner(f"Only {index} is embedded")
+        self.store.get_runner("Only 2 is embedded")
+        self.store.get_runner("Only 5 is embedded")
+        assert_equal(
+            [name for name, source in self.store._runner_cache],
+            ["Only 4 is embedded", "Only 2 is embedded", "Only 5 is embedded"],
+        )
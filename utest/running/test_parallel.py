@@ -0,0 +1,211 @@
+import tempfile
+import unittest
+from io import StringIO
+from os import getenv
+from os.path import abspath, dirname, join
+
+from robot import run
+from robot.conf import RobotSettings
+from robot.errors import DataError
+from robot.result import ExecutionResult
+from robot.running import parallel, TestSuite
+from robot.utils.asserts import assert_equal, assert_raises_with_msg, assert_true
+
+ROOT = dirname(dirname(dirname(abspath(__file__))))
+DATA = join(ROOT, "atest", "testdata", "misc")
+TEMP = getenv("TEMPDIR", tempfile.gettempdir())
+
+
+def run_and_read(source, **options):
+    output = join(TEMP, "parallel-output.xml")
+    options.update(output=output, log=None, report=None)
+    run(source, stdout=StringIO(), stderr=StringIO(), **options)
+    return ExecutionResult(output)
+
+
+def get_test_info(suite):
+    return [(t.full_name, t.status, t.message) for t in suite.all_tests]
+
+
+class TestParallelExecution(unittest.TestCase):
+
+    def _run_both(self, suite):
+        """Runs ``suite`` in parallel and sequentially and compares results.
+
+        Returns the result of the parallel run.
+        """
+        parallel = suite.run(
+            output=None, processes=2, stdout=StringIO(), stderr=StringIO()
+        )
+        sequential = suite.run(output=None, stdout=StringIO(), stderr=StringIO())
+        assert_equal(get_test_info(parallel.suite), get_test_info(sequential.suite))
+        return parallel
+
+    def test_results_are_same_as_when_running_sequentially(self):
+        source = join(DATA, "suites")
+        sequential = run_and_read(source)
+        parallel = run_and_read(source, processes=3)
+        assert_equal(get_test_info(parallel.suite), get_test_info(sequential.suite))
+        assert_equal(
+            [s.full_name for s in parallel.suite.suites],
+            [s.full_name for s in sequential.suite.suites],
+        )
+        assert_equal(parallel.suite.teardown.name, "Log")
+        for test in parallel.suite.all_tests:
+            assert_true(test.body)
+
+    def test_tests_are_split_when_there_are_no_child_suites(self):
+        source = join(DATA, "pass_and_fail.robot")
+        sequential = run_and_read(source)
+        parallel = run_and_read(source, processes=2)
+        assert_equal(get_test_info(parallel.suite), get_test_info(sequential.suite))
+        assert_equal(parallel.suite.setup.name, sequential.suite.setup.name)
+
+    def test_child_suites_are_run_in_their_parent_suite(self):
+        suite = TestSuite(name="Suite", source=join(DATA, "suites"))
+        for name in "A", "B":
+            test = suite.suites.create(name=name).tests.create("Test")
+            test.body.create_keyword(
+                "Should Be Equal", args=["${SUITE NAME}", f"Suite.{name}"]
+            )
+            test.body.create_keyword("Should Be Equal", args=["${TEST NAME}", "Test"])
+        result = self._run_both(suite)
+        assert_equal(
+            get_test_info(result.suite),
+            [("Suite.A.Test", "PASS", ""), ("Suite.B.Test", "PASS", "")],
+        )
+        assert_equal([s.id for s in result.suite.suites], ["s1-s1", "s1-s2"])
+
+    def test_failures_in_worker_processes(self):
+        suite = TestSuite(name="Suite")
+        for index in range(2):
+            test = suite.suites.create(name=f"Child {index}").tests.create("Test")
+            test.body.create_keyword("Evaluate", args=["__import__('os')._exit(1)"])
+        result = suite.run(
+            output=None, processes=2, stdout=StringIO(), stderr=StringIO()
+        )
+        for test in result.suite.all_tests:
+            assert_equal(test.status, "FAIL")
+            assert_true(
+                test.message.startswith("Running in a worker process failed: "),
+                test.message,
+            )
+        assert_equal(result.suite.statistics.failed, 2)
+
+    def test_exit_on_failure(self):
+        suite = TestSuite(name="Suite")
+        for index in range(4):
+            test = suite.suites.create(name=f"Child {index}").tests.create("Test")
+            test.body.create_keyword("Should Be Equal", args=[str(index), "0"])
+        output = join(TEMP, "parallel-output.xml")
+        # Use only one worker so that it is deterministic which units have
+        # been started when the failure occurs.
+        executor = parallel.ProcessExecutor
+        parallel.ProcessExecutor = lambda processes: executor(1)
+        try:
+            suite.run(
+                output=output,
+                processes=2,
+                exitonfailure=True,
+                stdout=StringIO(),
+                stderr=StringIO(),
+            )
+        finally:
+            parallel.ProcessExecutor = executor
+        tests = list(ExecutionResult(output).suite.all_tests)
+        assert_equal([t.status for t in tests], ["PASS", "FAIL", "FAIL", "FAIL"])
+        assert_equal(tests[1].message, "1 != 0")
+        for test in tests[2:]:
+            assert_equal(
+                test.message, "Failure occurred and exit-on-failure mode is in use."
+            )
+
+    def test_top_level_setup_failure(self):
+        suite = TestSuite(name="Suite")
+        suite.setup.config(name="Fail", args=["Setup failed"])
+        for index in range(2):
+            suite.tests.create(name=f"Test {index}").body.create_keyword("No Operation")
+        result = self._run_both(suite)
+        for test in result.suite.tests:
+            assert_equal(test.status, "FAIL")
+            assert_equal(test.message, "Parent suite setup failed:\nSetup failed")
+
+    def test_variables_set_by_top_level_setup_are_visible_to_child_suites(self):
+        suite = TestSuite(name="Suite")
+        setup = suite.resource.keywords.create(name="Setup")
+        setup.body.create_keyword("Set Global Variable", args=["${TOKEN}", "abc"])
+        setup.body.create_keyword(
+            "Set Suite Variable", args=["@{CHILDREN}", "x", "y", "children=True"]
+        )
+        setup.body.create_keyword("Set Suite Variable", args=["${HIDDEN}", "value"])
+        suite.setup.config(name="Setup")
+        for index in range(2):
+            test = suite.suites.create(name=f"Child {index}").tests.create("Test")
+            test.body.create_keyword("Should Be Equal", args=["${TOKEN}", "abc"])
+            test.body.create_keyword("Should Be Equal", args=["${CHILDREN}[1]", "y"])
+            test.body.create_keyword("Variable Should Not Exist", args=["${HIDDEN}"])
+        result = self._run_both(suite)
+        assert_equal(result.suite.statistics.passed, 2)
+
+    def test_suite_variables_set_by_top_level_setup_are_visible_to_tests(self):
+        suite = TestSuite(name="Suite")
+        suite.resource.variables.create(name="${VALUE}", value=["original"])
+        suite.setup.config(name="Set Suite Variable", args=["${VALUE}", "changed"])
+        for index in range(2):
+            test = suite.tests.create(name=f"Test {index}")
+            test.body.create_keyword("Should Be Equal", args=["${VALUE}", "changed"])
+        result = self._run_both(suite)
+        assert_equal(result.suite.statistics.passed, 2)
+
+    def test_tests_are_run_in_main_process_if_variables_cannot_be_sent(self):
+        suite = TestSuite(name="Suite")
+        suite.setup.config(
+            name="Set Suite Variable", args=["${LOCK}", "${{threading.Lock()}}"]
+        )
+        for index in range(2):
+            test = suite.tests.create(name=f"Test {index}")
+            test.body.create_keyword("Variable Should Exist", args=["${LOCK}"])
+        stderr = StringIO()
+        result = suite.run(output=None, processes=2, stdout=StringIO(), stderr=stderr)
+        assert_equal(result.suite.statistics.passed, 2)
+        assert_true(
+            "Running all tests in the main process because variables set by the "
+            "top level suite setup cannot be sent to workers:" in stderr.getvalue(),
+            stderr.getvalue(),
+        )
+
+
+class TestWorkerSettings(unittest.TestCase):
+
+    def test_processes(self):
+        assert_equal(RobotSettings().processes, 1)
+        assert_equal(RobotSettings(processes="4").processes, 4)
+        assert_equal(RobotSettings(processes=0).processes, 1)
+
+    def test_output_and_console_are_not_copied(self):
+        settings = RobotSettings(
+            output="out.xml", console="dotted", variable=["X:1"], processes=2
+        ).get_worker_settings()
+        assert_equal(settings.output, None)
+        assert_equal(settings.console, "none")
+        assert_equal(settings.variables, ["X:1"])
+        assert_equal(settings.processes, 1)
+
+    def test_to_and_from_dict(self):
+        settings = RobotSettings(variable=["X:1"], exitonfailure=True)
+        copy = RobotSettings.from_dict(settings.get_worker_settings().to_dict())
+        assert_equal(copy.variables, ["X:1"])
+        assert_equal(copy.exit_on_failure, True)
+        assert_equal(copy.start_time, settings.start_time)
+
+    def test_listeners_must_be_names_or_paths(self):
+        assert_raises_with_msg(
+            DataError,
+            "Invalid value for option '--processes': Listeners must be given as "
+            "names or paths when running tests in multiple processes.",
+            RobotSettings(listener=[object()]).get_worker_settings,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -57,6 +57,61 @@ class TestResourceFile(unittest.TestCase):
         )
 
 
+class TestEmbeddedKeywordIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.resource = ResourceFile()
+        for name in [
+            "User ${name} logs in",
+            "${x} logs in",
+            "User logs ${what}",
+            "Users ${x}",
+            "Very long name prefix ${x}",
+            "Very long name prefix ${x} and more",
+            "Kill ${process}",
+            "-${x}-",
+        ]:
+            self.resource.keywords.create(name)
+
+    def should_find(self, name, *matches):
+        kws = self.resource.find_keywords(name)
+        assert_equal([k.name for k in kws], list(matches))
+
+    def test_prefix(self):
+        self.should_find("User john logs in", "User ${name} logs in", "${x} logs in")
+        self.should_find("user LOGS out", "User logs ${what}")
+        self.should_find("Users all", "Users ${x}")
+        self.should_find("Kill it", "Kill ${process}")
+
+    def test_order_is_preserved(self):
+        self.should_find(
+            "User logs logs in",
+            "User ${name} logs in",
+            "${x} logs in",
+            "User logs ${what}",
+        )
+
+    def test_long_prefix(self):
+        self.should_find(
+            "very long name PREFIX x and more",
+            "Very long name prefix ${x}",
+            "Very long name prefix ${x} and more",
+        )
+        self.should_find("Very long name logs in", "${x} logs in")
+
+    def test_no_prefix(self):
+        self.should_find("-x-", "-${x}-")
+        self.should_find("${var} logs in", "${x} logs in")
+
+    def test_variables(self):
+        self.should_find("User ${name} logs in", "User ${name} logs in", "${x} logs in")
+        self.should_find("Kill ${process}", "Kill ${process}")
+
+    def test_non_ascii(self):
+        self.should_find("\u212aill it", "Kill ${process}")
+        self.should_find("Kïll it")
+
+
 class TestCacheInvalidation(unittest.TestCase):
 
     def setUp(self):
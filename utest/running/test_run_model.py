@@ -644,8 +644,15 @@ class TestToFromDictAndJson(unittest.TestCase):
             body=[],
         )
 
+    def test_user_keyword_with_invalid_embedded_args(self):
+        uk = UserKeyword()
+        uk.config(_name="Invalid ${x:(}", error="E")
+        self._verify(uk, name="Invalid ${x:(}", error="E", body=[])
+
     def test_user_keyword_args(self):
         for spec in [
+            ("${a: int}", "@{b: float}", "&{c: int | None}"),
+            ("${a: list[int]}=[]", "${b: bool}=${True}"),
             ("${a}", "${b}"),
             ("${a}", "@{b}"),
             ("@{a}", "&{b}"),
@@ -686,6 +693,7 @@ class TestToFromDictAndJson(unittest.TestCase):
         resource.variables.create("${x}", ("value",))
         resource.variables.create("@{y}", ("v1", "v2"), lineno=4)
         resource.variables.create("&{z}", ["k=v"], error="E")
+        resource.variables.create("${s}", ("a", "b"), separator="-")
         resource.keywords.create("UK").body.create_keyword("K")
         self._verify(
             resource,
@@ -706,6 +714,7 @@ class TestToFromDictAndJson(unittest.TestCase):
                 {"name": "${x}", "value": ("value",)},
                 {"name": "@{y}", "value": ("v1", "v2"), "lineno": 4},
                 {"name": "&{z}", "value": ("k=v",), "error": "E"},
+                {"name": "${s}", "value": ("a", "b"), "separator": "-"},
             ],
             keywords=[{"name": "UK", "body": [{"name": "K"}]}],
         )
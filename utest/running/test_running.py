@@ -4,11 +4,13 @@ import sys
 import unittest
 from io import StringIO
 from os.path import abspath, dirname, join
+from tempfile import TemporaryDirectory
 
 from resources.Listener import Listener
 from resources.runningtestcase import RunningTestCase
 
 from robot.model import BodyItem
+from robot.result import ExecutionResult
 from robot.running import TestSuite, TestSuiteBuilder
 from robot.utils.asserts import assert_equal
 
@@ -381,5 +383,52 @@ class TestListeners(RunningTestCase):
         self._assert_outputs([("[from listener 1]", 0), ("[listener close]", 0)])
 
 
+class TestLowMemory(unittest.TestCase):
+
+    def setUp(self):
+        self.suite = TestSuite(name="Suite")
+        test = self.suite.tests.create(name="Test")
+        loop = test.body.create_for(assign=["${x}"], values=["a", "b", "c"])
+        loop.body.create_keyword("Log", args=["${x}"])
+        test.body.create_keyword("Log", args=["Done!"])
+
+    def test_results_are_detached(self):
+        listener = BodyLengthListener()
+        test = run(self.suite, lowmemory=True, listener=listener).tests[0]
+        assert_equal(test.status, "PASS")
+        assert_equal(listener.lengths["ITERATION"], [1, 1, 1])
+        assert_equal(listener.lengths["FOR"], [0])
+        assert_equal(listener.lengths["KEYWORD"], [1, 1, 1, 1])
+
+    def test_results_are_not_detached_by_default(self):
+        listener = BodyLengthListener()
+        run(self.suite, listener=listener)
+        assert_equal(listener.lengths["ITERATION"], [1, 1, 1])
+        assert_equal(listener.lengths["FOR"], [3])
+
+    def test_output_file_contains_all_results(self):
+        for name in "output.xml", "output.json":
+            with TemporaryDirectory() as directory:
+                output = join(directory, name)
+                run(self.suite, output=output, lowmemory=True)
+                test = ExecutionResult(output).suite.tests[0]
+            loop = test.body[0]
+            assert_equal(len(loop.body), 3)
+            for iteration, value in zip(loop.body, "abc"):
+                assert_equal(iteration.assign, {"${x}": value})
+                assert_equal(iteration.body[0].body[0].message, value)
+            assert_equal(test.body[1].body[0].message, "Done!")
+
+
+class BodyLengthListener:
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self):
+        self.lengths = {}
+
+    def end_body_item(self, data, result):
+        self.lengths.setdefault(result.type, []).append(len(result.body))
+
+
 if __name__ == "__main__":
     unittest.main()
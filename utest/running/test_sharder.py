@@ -0,0 +1,147 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from robot.errors import DataError
+from robot.result import TestSuite as ResultSuite
+from robot.running import TestSuite
+from robot.running.sharder import Sharder, ShardTimings
+from robot.utils.asserts import assert_equal, assert_raises, assert_raises_with_msg
+
+
+def generate_suite(*suites, tests=()):
+    root = TestSuite(name="Root")
+    for name, test_count in suites:
+        suite = root.suites.create(name=name)
+        for index in range(test_count):
+            suite.tests.create(name=f"T{index}")
+    for name in tests:
+        root.tests.create(name=name)
+    return root
+
+
+def shard(suite, index, total, timings=None):
+    suite = suite.deepcopy()
+    suite.shard(index, total, timings)
+    return [test.full_name for test in suite.all_tests]
+
+
+class TestSharder(unittest.TestCase):
+
+    def test_all_tests_are_run_exactly_once(self):
+        suite = generate_suite(*[(f"S{i}", i % 4 + 1) for i in range(11)])
+        timings = {f"Root.S{i}.T0": i for i in range(0, 11, 2)}
+        names = []
+        for index in range(1, 5):
+            names.extend(shard(suite, index, 4, timings))
+        assert_equal(sorted(names), sorted(t.full_name for t in suite.all_tests))
+
+    def test_suites_are_kept_together(self):
+        suite = generate_suite(("A", 2), ("B", 3), ("C", 1))
+        assert_equal(shard(suite, 1, 2), ["Root.B.T0", "Root.B.T1", "Root.B.T2"])
+        assert_equal(shard(suite, 2, 2), ["Root.A.T0", "Root.A.T1", "Root.C.T0"])
+
+    def test_shards_are_balanced_based_on_timings(self):
+        suite = generate_suite(("A", 1), ("B", 1), ("C", 1), ("D", 1))
+        timings = {"Root.A.T0": 50, "Root.B.T0": 10, "Root.C.T0": 25, "Root.D.T0": 20}
+        assert_equal(shard(suite, 1, 2, timings), ["Root.A.T0"])
+        assert_equal(
+            shard(suite, 2, 2, timings), ["Root.B.T0", "Root.C.T0", "Root.D.T0"]
+        )
+
+    def test_unknown_tests_get_average_duration(self):
+        suite = generate_suite(("A", 1), ("B", 1), ("C", 1))
+        timings = ShardTimings({"Root.A.T0": 3, "Root.B.T0": 1})
+        assert_equal(timings.estimate(suite.suites[2].tests[0]), 2)
+        assert_equal(shard(suite, 1, 2, timings), ["Root.A.T0"])
+        assert_equal(shard(suite, 2, 2, timings), ["Root.B.T0", "Root.C.T0"])
+
+    def test_tests_are_split_if_there_are_fewer_suites_than_shards(self):
+        suite = generate_suite(tests=["T1", "T2", "T3"])
+        assert_equal(shard(suite, 1, 3), ["Root.T1"])
+        assert_equal(shard(suite, 3, 3), ["Root.T3"])
+
+    def test_empty_suites_are_removed(self):
+        suite = generate_suite(("A", 1), ("B", 1))
+        suite.shard(2, 2)
+        assert_equal([s.name for s in suite.suites], ["B"])
+
+    def test_shard_is_added_to_metadata(self):
+        suite = generate_suite(("A", 1), ("B", 1))
+        suite.shard(1, 2)
+        assert_equal(suite.metadata["Shard"], "1/2")
+
+    def test_invalid_index(self):
+        assert_raises_with_msg(
+            ValueError,
+            "Shard index must be between 1 and 2, got 3.",
+            Sharder,
+            3,
+            2,
+        )
+
+    def test_configure(self):
+        suite = generate_suite(("A", 1), ("B", 1), ("C", 1))
+        suite.configure(include_suites=["A", "B"], shard=(2, 2))
+        assert_equal([t.full_name for t in suite.all_tests], ["Root.B.T0"])
+
+    def test_configure_with_empty_shard(self):
+        suite = generate_suite(tests=["T1"])
+        assert_raises_with_msg(
+            DataError,
+            "Suite 'Root' contains no tests or tasks in shard 2/2.",
+            suite.configure,
+            shard=(2, 2),
+        )
+
+
+class TestShardTimings(unittest.TestCase):
+
+    def setUp(self):
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        self.path = Path(path)
+
+    def tearDown(self):
+        self.path.unlink(missing_ok=True)
+
+    def test_update_and_save(self):
+        result = ResultSuite(name="Root")
+        result.tests.create(name="Passed", status="PASS", elapsed_time=1.5)
+        result.tests.create(name="Failed", status="FAIL", elapsed_time=2)
+        result.tests.create(name="Skipped", status="SKIP", elapsed_time=3)
+        ShardTimings({"Root.Old": 1}).update(result).save(self.path)
+        with open(self.path, encoding="UTF-8") as file:
+            data = json.load(file)
+        assert_equal(
+            data, {"tests": {"Root.Failed": 2, "Root.Old": 1, "Root.Passed": 1.5}}
+        )
+        assert_equal(ShardTimings.from_file(self.path).timings, data["tests"])
+
+    def test_average_is_updated(self):
+        suite = generate_suite(("A", 1), ("B", 1))
+        timings = ShardTimings({"Root.A.T0": 3})
+        assert_equal(timings.estimate(suite.suites[1].tests[0]), 3)
+        result = ResultSuite(name="Root")
+        result.tests.create(name="New", status="PASS", elapsed_time=5)
+        timings.update(result)
+        assert_equal(timings.estimate(suite.suites[1].tests[0]), 4)
+        assert_equal(ShardTimings().estimate(suite.suites[1].tests[0]), 1)
+
+    def test_non_existing_file(self):
+        self.path.unlink()
+        assert_equal(len(ShardTimings.from_file(self.path)), 0)
+
+    def test_invalid_file(self):
+        self.path.write_text("invalid", encoding="UTF-8")
+        error = assert_raises(DataError, ShardTimings.from_file, self.path)
+        assert_equal(
+            error.message.split(":")[0],
+            f"Reading shard timings from '{self.path}' failed",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -358,6 +358,78 @@ class TestCaseScope(_TestScopes):
             assert_true(self.lib._instance is suite_inst)
 
 
+class ReusedLibrary:
+    ROBOT_LIBRARY_SCOPE = "SUITE"
+    ROBOT_LIBRARY_REUSE = True
+    fail_reset = False
+
+    def __init__(self):
+        self.resets = 0
+
+    def reset(self):
+        if self.fail_reset:
+            raise RuntimeError("Reset failed!")
+        self.resets += 1
+
+
+class TestReusedSuiteScope(_TestScopes):
+
+    def setUp(self):
+        self.logger = RecordingLogger()
+        self.lib = TestLibrary.from_code(ReusedLibrary, logger=self.logger)
+        self.lib.instance = None
+
+    def test_reuse(self):
+        assert_true(self.lib.reuse)
+        for scope in "GLOBAL", "TEST":
+            code = type("Library", (ReusedLibrary,), {"ROBOT_LIBRARY_SCOPE": scope})
+            assert_false(TestLibrary.from_code(code).reuse)
+        code = type("Library", (ReusedLibrary,), {"ROBOT_LIBRARY_REUSE": "False"})
+        assert_false(TestLibrary.from_code(code).reuse)
+
+    def test_instances_are_reused_in_later_suites(self):
+        inst1 = self.start_suite(instance=True)
+        self.end_suite()
+        self.lib.scope_manager.start_suite()
+        assert_true(self.lib._instance is inst1)
+        assert_equal(inst1.resets, 1)
+        self.end_suite()
+        self.lib.scope_manager.start_suite()
+        assert_true(self.lib.instance is inst1)
+        assert_equal(inst1.resets, 2)
+
+    def test_instances_are_not_shared_by_active_suites(self):
+        inst1 = self.start_suite(instance=True)
+        inst2 = self.start_suite(instance=True)
+        assert_false(inst1 is inst2)
+        self._verify_end_suite_restores_previous_instance(inst1)
+        self.lib.scope_manager.start_suite()
+        assert_true(self.lib.instance is inst2)
+        self._verify_end_suite_restores_previous_instance(inst1)
+        self._verify_end_suite_restores_previous_instance(None)
+        self.lib.scope_manager.start_suite()
+        assert_true(self.lib.instance in (inst1, inst2))
+
+    def test_suites_not_using_library_do_not_pool_instances(self):
+        self.start_suite()
+        self.end_suite()
+        assert_equal(self.lib.scope_manager.instance_pool, [])
+
+    def test_failing_reset(self):
+        inst1 = self.start_suite(instance=True)
+        self.end_suite()
+        inst1.fail_reset = True
+        inst2 = self.start_suite(instance=True)
+        assert_false(inst1 is inst2)
+        assert_equal(
+            [msg for msg, level in self.logger.messages if level == "ERROR"],
+            [
+                "Error in library 'ReusedLibrary': Resetting library instance "
+                "failed: Reset failed!"
+            ],
+        )
+
+
 class TestKeywords(unittest.TestCase):
 
     def test_keywords(self):
@@ -470,6 +542,106 @@ class TestDynamicLibrary(unittest.TestCase):
             assert_args(self.find(lib, name), mina, maxa, kwargs=True)
 
 
+class InformationLibrary:
+    calls = []
+    information = {
+        "__intro__": {"doc": "Intro doc."},
+        "__init__": {"doc": "Init doc."},
+        "Keyword": {
+            "args": ["a", "b=default", "*rest"],
+            "types": {"a": "int", "return": "bool"},
+            "doc": "Keyword doc.",
+            "tags": ["t1", "t2"],
+        },
+        "Defaults": {},
+        "Invalid": {"tags": 42},
+        "Not dict": "xxx",
+    }
+
+    def get_library_information(self):
+        return self.information
+
+    def get_keyword_names(self):
+        return list(self.information)[2:] + ["Not in info"]
+
+    def run_keyword(self, name, args):
+        pass
+
+    def get_keyword_arguments(self, name):
+        self.calls.append(name)
+        return ["x"]
+
+    def get_keyword_documentation(self, name):
+        self.calls.append(name)
+        return f"Doc for {name}."
+
+
+class TestDynamicLibraryInformation(unittest.TestCase):
+
+    def setUp(self):
+        InformationLibrary.calls = []
+        self.logger = RecordingLogger()
+        self.lib = TestLibrary.from_code(InformationLibrary, logger=self.logger)
+
+    def test_information_is_used(self):
+        kw = self.lib.find_keywords("Keyword")[0]
+        assert_equal(str(kw.args), "a: int, b=default, *rest")
+        assert_equal(str(kw.args.return_type), "bool")
+        assert_equal(kw.doc, "Keyword doc.")
+        assert_equal(list(kw.tags), ["t1", "t2"])
+
+    def test_dynamic_methods_are_called_only_with_missing_keywords(self):
+        assert_equal(InformationLibrary.calls, ["Not in info", "Not in info"])
+        kw = self.lib.find_keywords("Not in info")[0]
+        assert_equal(str(kw.args), "x")
+        assert_equal(kw.doc, "Doc for Not in info.")
+
+    def test_missing_values_use_defaults(self):
+        kw = self.lib.find_keywords("Defaults")[0]
+        assert_equal(kw.args.maxargs, sys.maxsize)
+        assert_equal(kw.doc, "")
+        assert_equal(list(kw.tags), [])
+
+    def test_intro_and_init_documentation(self):
+        assert_equal(self.lib.doc, "Intro doc.")
+        assert_equal(self.lib.init.doc, "Init doc.")
+        assert_equal(InformationLibrary.calls, ["Not in info", "Not in info"])
+
+    def test_invalid_information(self):
+        assert_equal(
+            [kw.name for kw in self.lib.keywords],
+            ["Keyword", "Defaults", "Not In Info"],
+        )
+        assert_equal(
+            [msg for msg, level in self.logger.messages if level == "ERROR"],
+            [
+                "Error in library 'InformationLibrary': Adding keyword 'Invalid' "
+                "failed: Invalid 'tags' in library information: Return value "
+                "must be a list of strings, got integer.",
+                "Error in library 'InformationLibrary': Adding keyword 'Not dict' "
+                "failed: Library information for 'Not dict' must be a dictionary, "
+                "got string.",
+            ],
+        )
+
+    def test_failing_get_library_information(self):
+        class Library(InformationLibrary):
+            def get_library_information(self):
+                raise ValueError("Oh no!")
+
+        logger = RecordingLogger()
+        lib = TestLibrary.from_code(Library, logger=logger)
+        assert_equal(
+            logger.messages[0],
+            (
+                "Error in library 'Library': Calling dynamic method "
+                "'get_library_information' failed: ValueError: Oh no!",
+                "ERROR",
+            ),
+        )
+        assert_equal(lib.find_keywords("Keyword")[0].doc, "Doc for Keyword.")
+
+
 def assert_args(kw, minargs=0, maxargs=0, kwargs=False):
     assert_equal(kw.args.minargs, minargs)
     assert_equal(kw.args.maxargs, maxargs)
@@ -573,6 +745,15 @@ class NullLogger:
     error = warn = info = debug = write
 
 
+class RecordingLogger(NullLogger):
+
+    def __init__(self):
+        self.messages = []
+
+    def write(self, message, level, html=False):
+        self.messages.append((message, level))
+
+
 class FakeNamespace:
 
     def __init__(self):
@@ -1,9 +1,10 @@
 import os
 import pathlib
+import tempfile
 import unittest
 from xml.etree import ElementTree as ET
 
-from robot.utils import ETSource
+from robot.utils import ETSource, open_file
 from robot.utils.asserts import assert_equal, assert_true
 
 PATH = os.path.join(os.path.dirname(__file__), "test_etreesource.py")
@@ -39,6 +40,19 @@ class TestETSource(unittest.TestCase):
             assert_true(src is f)
         assert_true(src.closed is True)
 
+    def test_compressed_path(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            for suffix in ".gz", ".xz":
+                path = os.path.join(tempdir, f"test.xml{suffix}")
+                with open_file(path, "w", encoding="UTF-8") as file:
+                    file.write("<tag>hyvä</tag>")
+                for value in path, pathlib.Path(path):
+                    source = ETSource(value)
+                    with source as src:
+                        assert_equal(ET.parse(src).getroot().text, "hyvä")
+                    self._verify_string_representation(source, path)
+                    assert_true(source._opened.closed)
+
     def test_string(self):
         self._test_string("\n<tag>content</tag>\n")
 
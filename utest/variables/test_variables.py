@@ -2,7 +2,7 @@ import unittest
 
 from robot.errors import DataError, VariableError
 from robot.utils.asserts import assert_equal, assert_raises
-from robot.variables import Variables
+from robot.variables import evaluate_expression, Variables
 
 SCALARS = ["${var}", "${  v A  R }"]
 LISTS = ["@{var}", "@{  v A  R }"]
@@ -207,6 +207,29 @@ class TestVariables(unittest.TestCase):
         assert_equal(self.varz.replace_scalar('${dic["o"]}'), obj)
         assert_equal(self.varz.replace_scalar('-${dic["o"].b[2]}-'), "-3-")
 
+    def test_extended_variables_with_changing_base_value(self):
+        for value in "a", "b":
+            self.varz["${obj}"] = value
+            assert_equal(self.varz.replace_scalar("${obj.upper()}"), value.upper())
+
+    def test_evaluate_same_expression_multiple_times(self):
+        for value in 1, 2, 3:
+            self.varz["${x}"] = value
+            assert_equal(evaluate_expression("$x * 2", self.varz), value * 2)
+            assert_equal(self.varz.replace_scalar("${{$x + 1}}"), value + 1)
+        assert_raises(DataError, evaluate_expression, "$nonex * 2", self.varz)
+        self.varz["${nonex}"] = 5
+        assert_equal(evaluate_expression("$nonex * 2", self.varz), 10)
+
+    def test_evaluate_invalid_expression_with_non_existing_variable(self):
+        for expr in "$nonex +", "$nonex + (":
+            try:
+                evaluate_expression(expr, self.varz)
+            except DataError as err:
+                assert_equal("Variable '$nonex' not found." in err.message, True)
+            else:
+                raise AssertionError("DataError not raised.")
+
     def test_space_is_not_ignored_after_newline_in_extend_variable_syntax(self):
         self.varz["${x}"] = "test string"
         self.varz["${lf}"] = "\\n"
@@ -272,6 +295,49 @@ class TestVariables(unittest.TestCase):
         copy = varz.copy()
         assert_equal(copy["${foo}"], "bar")
 
+    def test_layered_copy(self):
+        varz = Variables()
+        varz["${foo}"] = "bar"
+        varz["${Zap}"] = "zap"
+        copy = varz.layered_copy(update={"${new}": "new", "${zap}": None})
+        assert_equal(copy["${foo}"], "bar")
+        assert_equal(copy["${new}"], "new")
+        assert_equal("zap" in copy.store, False)
+        assert_equal("new" in varz.store, False)
+        assert_equal("zap" in varz.store, True)
+
+    def test_layered_copy_local_changes(self):
+        varz = Variables()
+        varz["${Foo}"] = "bar"
+        copy = varz.layered_copy()
+        copy["${FOO}"] = "local"
+        copy["@{list}"] = [1, 2]
+        assert_equal(copy["${foo}"], "local")
+        assert_equal(varz["${foo}"], "bar")
+        assert_equal(list(copy.as_dict()), ["${Foo}", "@{list}"])
+        assert_equal(list(varz.as_dict()), ["${Foo}"])
+        del copy["${foo}"]
+        assert_equal("foo" in copy.store, False)
+        assert_equal(varz["${foo}"], "bar")
+        copy["${foo}"] = "again"
+        assert_equal(copy["${foo}"], "again")
+
+    def test_layered_copy_parent_changes(self):
+        varz = Variables()
+        varz["${foo}"] = "bar"
+        copy = varz.layered_copy()
+        varz["${foo}"] = "new"
+        varz["${other}"] = "other"
+        assert_equal(copy["${foo}"], "new")
+        assert_equal(copy["${other}"], "other")
+        copy.store.detach("${foo}")
+        copy.store.detach("${bar}")
+        varz["${foo}"] = "newer"
+        varz["${bar}"] = "bar"
+        assert_equal(copy["${foo}"], "new")
+        assert_equal("bar" in copy.store, False)
+        assert_equal(copy.store.data.copy(), {"foo": "new", "other": "other"})
+
     def test_ignore_error(self):
         v = Variables()
         v["${X}"] = "x"
@@ -314,6 +380,35 @@ class TestVariables(unittest.TestCase):
                 ["x" + item + x_at_end, "@{NON}"],
             )
 
+    def test_replace_same_string_multiple_times(self):
+        v = Variables()
+        for value in "first", "second":
+            v["${x}"] = value
+            v["@{y}"] = [value, value]
+            v["${name}"] = "x"
+            assert_equal(v.replace_scalar("${x}"), value)
+            assert_equal(v.replace_scalar("${${name}}"), value)
+            assert_equal(v.replace_string("-${x}-${y}[1]-"), f"-{value}-{value}-")
+            assert_equal(v.replace_list(["@{y}", "${y}[0]"]), [value] * 3)
+
+    def test_error_is_raised_after_preceding_variables_are_resolved(self):
+        v = Variables()
+        v["${x}"] = "x"
+        assert_raises(VariableError, v.replace_string, "${x} ${inv")
+        assert_raises(VariableError, v.replace_string, "${x} ${inv")
+        assert_raises(DataError, v.replace_string, "${nonex} ${inv")
+        try:
+            v.replace_string("${nonex} ${inv")
+        except DataError as err:
+            assert_equal(err.message, "Variable '${nonex}' not found.")
+
+    def test_custom_unescaper(self):
+        v = Variables()
+        v["${x}"] = "x"
+        assert_equal(v.replace_string("a\\tb ${x}"), "a\tb x")
+        assert_equal(v.replace_string("a\\tb ${x}", custom_unescaper=str), "a\\tb x")
+        assert_equal(v.replace_string("a\\tb", custom_unescaper=str.upper), "A\\TB")
+
     def test_sequence_subscript(self):
         sequences = (
             [42, "my", "name"],